@@ -1,11 +1,41 @@
-from .client import GA4Client
-from .api.utils import build_run_report_request, build_realtime_request
-from .api.deps import get_client as get_ga4_client_dependency
-
-__all__ = [
-    "GA4Client",
-    "build_run_report_request",
-    "build_realtime_request",
-    "get_ga4_client_dependency",
-]
-  # noqa: F401
+"""DealScale GA4 SDK.
+
+The public names below are imported on first access (PEP 562), so
+``import google_analytics`` stays cheap: FastAPI is only loaded for
+``get_ga4_client_dependency`` and httpx only for ``AsyncGA4Client``.
+"""
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import GA4Client
+    from .async_client import AsyncGA4Client
+    from .api.utils import build_run_report_request, build_realtime_request
+    from .api.deps import get_client as get_ga4_client_dependency
+
+# public name -> (submodule, attribute)
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "GA4Client": (".client", "GA4Client"),
+    "AsyncGA4Client": (".async_client", "AsyncGA4Client"),
+    "build_run_report_request": (".api.utils", "build_run_report_request"),
+    "build_realtime_request": (".api.utils", "build_realtime_request"),
+    "get_ga4_client_dependency": (".api.deps", "get_client"),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), attr)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
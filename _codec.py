@@ -0,0 +1,22 @@
+"""JSON codec used on the transport hot path: orjson when installed, stdlib otherwise."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # optional dependency: pip install "dealscale-ga4-sdk[fast]"
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
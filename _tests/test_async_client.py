@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from ..async_client import AsyncGA4Client
+from ..api.utils import build_run_report_request
+from ..api._exceptions import AuthError
+
+
+def _client(handler) -> AsyncGA4Client:
+    return AsyncGA4Client(access_token="test", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+def test_async_run_report_retries_then_succeeds():
+    calls = []
+    fake_json = {
+        "dimensionHeaders": [{"name": "date"}],
+        "metricHeaders": [{"name": "activeUsers", "type": "TYPE_INTEGER"}],
+        "rows": [{"dimensionValues": [{"value": "20250101"}], "metricValues": [{"value": "1"}]}],
+        "rowCount": 1,
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers["Authorization"])
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.01"}, json={"error": {"message": "rate"}})
+        return httpx.Response(200, json=fake_json)
+
+    async def main():
+        client = _client(handler)
+        req = build_run_report_request(dimensions=["date"], metrics=["activeUsers"], last_n_days=7)
+        return await client.run_report("123", req)
+
+    resp = asyncio.run(main())
+    assert resp.rowCount == 1
+    assert calls == ["Bearer test", "Bearer test"]
+
+
+def test_async_403_raises_auth_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(403, json={"error": {"message": "denied"}})
+
+    async def main():
+        await _client(handler).get_metadata("123")
+
+    try:
+        asyncio.run(main())
+    except AuthError as e:
+        assert "Forbidden" in str(e)
+    else:
+        assert False, "Expected AuthError"
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch, Mock
+
+from .. import auth
+from ..auth import TokenProvider
+from ..async_client import AsyncGA4Client
+from ..client import GA4Client
+
+
+class FakeCredentials:
+    def __init__(self, lifetime: timedelta) -> None:
+        self.lifetime = lifetime
+        self.refreshes = 0
+        self.token = None
+        self.expiry = None
+
+    def refresh(self, request) -> None:
+        self.refreshes += 1
+        self.token = f"token-{self.refreshes}"
+        self.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + self.lifetime
+
+
+def test_provider_caches_token_until_refresh_margin():
+    creds = FakeCredentials(timedelta(hours=1))
+    provider = TokenProvider(creds, refresh_margin=300, background=False)
+    with patch.object(auth, "_google_request", return_value=None):
+        assert provider.token() == "token-1"
+        assert provider.token() == "token-1"
+        creds.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=60)
+        assert provider.token() == "token-2"
+    assert creds.refreshes == 2
+
+
+def test_client_sends_current_token_and_refreshes_on_401():
+    creds = FakeCredentials(timedelta(hours=1))
+    provider = TokenProvider(creds, background=False)
+    client = GA4Client(credentials=provider)
+    seen = []
+
+    def fake_send(request, **kwargs):
+        seen.append(request.headers["Authorization"])
+        status = 401 if len(seen) == 1 else 200
+        return Mock(status_code=status, content=json.dumps({}).encode(), json=lambda: {}, text="", headers={})
+
+    with patch.object(auth, "_google_request", return_value=None), patch.object(client._session, "send", side_effect=fake_send):
+        client.get_metadata("123")
+
+    assert seen == ["Bearer token-1", "Bearer token-2"]
+
+
+def test_async_client_refreshes_once_on_401():
+    creds = FakeCredentials(timedelta(hours=1))
+    provider = TokenProvider(creds, background=False)
+    client = AsyncGA4Client(credentials=provider)
+    seen = []
+
+    async def fake_request(method, url, *, headers=None, **kwargs):
+        seen.append(headers["Authorization"])
+        status = 401 if len(seen) == 1 else 200
+        return Mock(status_code=status, content=json.dumps({}).encode(), json=lambda: {}, text="", headers={})
+
+    async def main():
+        with patch.object(client._http, "request", side_effect=fake_request):
+            await client.get_metadata("123")
+        await client.aclose()
+
+    with patch.object(auth, "_google_request", return_value=None):
+        asyncio.run(main())
+
+    assert seen == ["Bearer token-1", "Bearer token-2"]
+    assert creds.refreshes == 2
+
+
+def test_shared_service_account_mints_first_token_once():
+    creds = FakeCredentials(timedelta(hours=1))
+    with patch.object(auth, "_google_request", return_value=None), patch(
+        "google.oauth2.service_account.Credentials.from_service_account_file", return_value=creds
+    ), patch.dict(auth._shared, clear=True):
+        provider = auth.shared_service_account(key_path="key.json")
+        assert provider.token() == "token-1"
+        provider.close()
+    assert creds.refreshes == 1
+
+
+def test_concurrent_401s_refresh_once():
+    creds = FakeCredentials(timedelta(hours=1))
+    provider = TokenProvider(creds, background=False)
+    with patch.object(auth, "_google_request", return_value=None):
+        rejected = provider.token()
+        provider.refresh(force=True, stale=rejected)
+        provider.refresh(force=True, stale=rejected)  # second caller saw the same 401: token already replaced
+    assert creds.refreshes == 2
+    assert provider.token() == "token-2"
+
+
+def test_service_account_clients_stop_the_shared_refresher_when_last_closes():
+    creds = FakeCredentials(timedelta(hours=1))
+    with patch.object(auth, "_google_request", return_value=None), patch(
+        "google.oauth2.service_account.Credentials.from_service_account_file", return_value=creds
+    ), patch.dict(auth._shared, clear=True):
+        first = GA4Client.from_service_account(key_path="key.json")
+        second = GA4Client.from_service_account(key_path="key.json")
+        provider = first._credentials
+        assert second._credentials is provider
+        first.close()
+        assert not provider._closed.is_set()
+        second.close()
+        assert provider._closed.is_set()
+        assert auth._shared == {}
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+from unittest.mock import patch, Mock
+
+from ..client import GA4Client
+from ..api.utils import build_run_report_request
+
+
+def test_batch_run_reports_chunks_and_keeps_order():
+    client = GA4Client(access_token="test")
+    sizes = []
+
+    def side_effect(method, url, data=None, timeout=None):  # type: ignore[override]
+        body = json.loads(data)
+        sizes.append(len(body["requests"]))
+        payload = {
+            "reports": [
+                {"dimensionHeaders": [], "metricHeaders": [], "rowCount": r["limit"]}
+                for r in body["requests"]
+            ]
+        }
+        return Mock(status_code=200, json=lambda: payload, content=json.dumps(payload).encode())
+
+    reqs = [build_run_report_request(dimensions=["date"], metrics=["activeUsers"], limit=i + 1) for i in range(12)]
+    with patch.object(client._session, "request", side_effect=side_effect):
+        reports = client.batch_run_reports("123", reqs)
+
+    assert sorted(sizes) == [2, 5, 5]
+    assert [r.rowCount for r in reports] == list(range(1, 13))
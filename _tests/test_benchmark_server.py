@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+from ..benchmarks.fake_server import FakeAnalyticsServer, FakeServerConfig
+from ..benchmarks.run import _run_mode
+from ..client import GA4Client
+from ..api.utils import build_run_report_request
+from ..api._exceptions import RateLimitError
+
+
+def test_client_pages_through_fake_server():
+    with FakeAnalyticsServer(FakeServerConfig(rows=25)) as server:
+        client = GA4Client("test", base_url=server.base_url)
+        req = build_run_report_request(dimensions=["date"], metrics=["activeUsers"], last_n_days=7)
+        pages = list(client.iter_report_pages("123", req, page_size=10))
+        client.close()
+    assert [len(p.rows) for p in pages] == [10, 10, 5]
+    assert pages[-1].rows[-1].dimensionValues[0]["value"].endswith("-24")
+    assert server.requests == 3
+
+
+def test_fake_server_injects_rate_limits():
+    with FakeAnalyticsServer(FakeServerConfig(rows=5, error_rate_429=1.0, retry_after=0)) as server:
+        client = GA4Client("test", base_url=server.base_url)
+        req = build_run_report_request(dimensions=["date"], metrics=["activeUsers"], last_n_days=7)
+        with pytest.raises(RateLimitError):
+            client.run_report("123", req)
+        client.close()
+    assert server.errors == server.requests > 1
+
+
+def test_benchmark_mode_reports_metrics():
+    with FakeAnalyticsServer(FakeServerConfig(rows=30)) as server:
+        result = _run_mode("columnar", server.base_url, 30, 10, 2)
+    assert (result["rows"], result["requests"], result["retries"]) == (30, 3, 0)
+    assert result["parse_us_per_row"] > 0 and result["peak_rss_mb"] > 0
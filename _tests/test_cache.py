@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+from unittest.mock import patch, Mock
+
+from ..cache import DiskCache, MemoryCache, TtlPolicy, cache_key
+from ..client import GA4Client
+from ..api.utils import build_run_report_request
+
+
+def test_run_report_served_from_cache_on_repeat():
+    cache = MemoryCache()
+    client = GA4Client(access_token="test", cache=cache)
+    fake_json = {"dimensionHeaders": [{"name": "date"}], "metricHeaders": [{"name": "activeUsers"}], "rowCount": 0}
+    req = build_run_report_request(dimensions=["date"], metrics=["activeUsers"], start_date="2024-01-01", end_date="2024-01-31")
+
+    with patch.object(client._session, "request", return_value=Mock(status_code=200, json=lambda: fake_json, content=json.dumps(fake_json).encode())) as send:
+        first = client.run_report("123", req)
+        second = client.run_report("123", req)
+
+    assert send.call_count == 1
+    assert first == second
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_ttl_policy_by_date_range():
+    policy = TtlPolicy(live_ttl=1, recent_ttl=2, historical_ttl=None, settle_days=3)
+    today = date(2025, 6, 10)
+
+    def ttl(start, end):
+        req = build_run_report_request(dimensions=["date"], metrics=["activeUsers"], start_date=start, end_date=end)
+        return policy.ttl_for(req, today=today)
+
+    assert ttl("7daysAgo", "today") == 1
+    assert ttl("2025-06-01", "yesterday") == 2
+    assert ttl("2025-01-01", "2025-05-31") is None
+
+
+def test_relative_dates_resolved_into_cache_key():
+    req = build_run_report_request(dimensions=["date"], metrics=["activeUsers"], start_date="30daysAgo", end_date="7daysAgo")
+    pinned = build_run_report_request(dimensions=["date"], metrics=["activeUsers"], start_date="2024-12-02", end_date="2024-12-25")
+
+    assert cache_key("123", req, today=date(2025, 1, 1)) == cache_key("123", pinned)
+    assert cache_key("123", req, today=date(2025, 1, 1)) != cache_key("123", req, today=date(2025, 1, 2))
+
+
+def test_memory_cache_evicts_lru_by_size():
+    cache = MemoryCache(max_bytes=10)
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+    cache.get("a")
+    cache.set("c", b"12345")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"12345"
+    assert cache.stats.evictions == 1
+
+
+def test_disk_cache_roundtrip_and_expiry(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.set("k", b"payload")
+    cache.set("gone", b"x", ttl=-1)
+    assert DiskCache(str(tmp_path)).get("k") == b"payload"
+    assert cache.get("gone") is None
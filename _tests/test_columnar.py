@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+from unittest.mock import patch, Mock
+
+import numpy as np
+
+from ..client import GA4Client
+from ..columnar import ColumnarReport
+from ..api.utils import build_run_report_request
+
+
+def test_run_report_columnar_casts_by_metric_type():
+    client = GA4Client(access_token="test")
+    fake_json = {
+        "dimensionHeaders": [{"name": "date"}],
+        "metricHeaders": [
+            {"name": "activeUsers", "type": "TYPE_INTEGER"},
+            {"name": "engagementRate", "type": "TYPE_FLOAT"},
+        ],
+        "rows": [
+            {"dimensionValues": [{"value": "20250101"}], "metricValues": [{"value": "12"}, {"value": "0.5"}]},
+            {"dimensionValues": [{"value": "20250102"}], "metricValues": [{"value": "7"}, {"value": "0.25"}]},
+        ],
+        "rowCount": 2,
+    }
+
+    with patch.object(client._session, "request", return_value=Mock(status_code=200, json=lambda: fake_json, content=json.dumps(fake_json).encode())):
+        req = build_run_report_request(dimensions=["date"], metrics=["activeUsers", "engagementRate"], last_n_days=7)
+        report = client.run_report_columnar("123", req)
+
+    assert len(report) == 2
+    assert report["activeUsers"].dtype == np.int64
+    assert report["activeUsers"].tolist() == [12, 7]
+    assert report["engagementRate"].tolist() == [0.5, 0.25]
+    assert report["date"].tolist() == ["20250101", "20250102"]
+
+
+def test_concat_and_empty():
+    empty = ColumnarReport.from_json({"dimensionHeaders": [{"name": "d"}], "metricHeaders": [{"name": "m", "type": "TYPE_INTEGER"}]})
+    assert len(empty) == 0
+    assert len(ColumnarReport.concat([empty, empty])) == 0
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import gzip
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from ..export import export_report
+from ..api.utils import build_run_report_request
+from ..api._responses import RunReportResponse
+
+
+def _pages(total: int, fail_at: int | None = None):
+    def iter_report_pages(property_id, req, page_size):
+        offset = req.offset or 0
+        while offset < total:
+            if fail_at is not None and offset >= fail_at:
+                raise RuntimeError("network down")
+            n = min(page_size, total - offset)
+            yield RunReportResponse.model_validate(
+                {
+                    "dimensionHeaders": [{"name": "pagePath"}],
+                    "metricHeaders": [{"name": "screenPageViews", "type": "TYPE_INTEGER"}],
+                    "rows": [
+                        {"dimensionValues": [{"value": f"/p{i}"}], "metricValues": [{"value": str(i)}]}
+                        for i in range(offset, offset + n)
+                    ],
+                    "rowCount": total,
+                }
+            )
+            offset += n
+
+    return iter_report_pages
+
+
+def test_ndjson_gzip_export_resumes_from_checkpoint(tmp_path):
+    out, ckpt = str(tmp_path / "out.ndjson.gz"), str(tmp_path / "ckpt.json")
+    req = build_run_report_request(dimensions=["pagePath"], metrics=["screenPageViews"], last_n_days=7)
+
+    failing = Mock(iter_report_pages=_pages(25, fail_at=15))
+    try:
+        export_report(failing, "123", req, out, compression="gzip", page_size=5, buffer_rows=10, checkpoint_path=ckpt)
+    except RuntimeError:
+        pass
+    else:
+        assert False, "Expected RuntimeError"
+
+    result = export_report(Mock(iter_report_pages=_pages(25)), "123", req, out, compression="gzip", page_size=5, buffer_rows=10, checkpoint_path=ckpt)
+
+    with gzip.open(out, "rt") as f:
+        rows = [json.loads(line) for line in f]
+    assert result.resumed_from == 10 and result.rows == 25
+    assert rows == [{"pagePath": f"/p{i}", "screenPageViews": i} for i in range(25)]
+
+
+def test_csv_export_has_header_and_typed_values(tmp_path):
+    out = str(tmp_path / "out.csv")
+    req = build_run_report_request(dimensions=["pagePath"], metrics=["screenPageViews"], last_n_days=7)
+    export_report(Mock(iter_report_pages=_pages(3)), "123", req, out, format="csv", page_size=2)
+    with open(out) as f:
+        assert f.read().splitlines() == ["pagePath,screenPageViews", "/p0,0", "/p1,1", "/p2,2"]
+
+
+def test_empty_report_still_writes_header_and_schema(tmp_path):
+    req = build_run_report_request(dimensions=["pagePath"], metrics=["screenPageViews"], last_n_days=7)
+    out = str(tmp_path / "out.csv")
+    result = export_report(Mock(iter_report_pages=_pages(0)), "123", req, out, format="csv")
+    with open(out) as f:
+        assert f.read().splitlines() == ["pagePath,screenPageViews"]
+    assert result.rows == 0
+
+    pq = pytest.importorskip("pyarrow.parquet")
+    parts = str(tmp_path / "parts")
+    export_report(Mock(iter_report_pages=_pages(0)), "123", req, parts, format="parquet", checkpoint_path=str(tmp_path / "ckpt.json"))
+    table = pq.read_table(parts)
+    assert table.num_rows == 0 and table.column_names == ["pagePath", "screenPageViews"]
+
+
+def test_relative_window_resumes_with_pinned_dates(tmp_path):
+    out, ckpt = str(tmp_path / "out.ndjson"), str(tmp_path / "ckpt.json")
+    req = build_run_report_request(dimensions=["pagePath"], metrics=["screenPageViews"], start_date="7daysAgo", end_date="yesterday")
+    with pytest.raises(RuntimeError):
+        export_report(Mock(iter_report_pages=_pages(25, fail_at=15)), "123", req, out, page_size=5, buffer_rows=10, checkpoint_path=ckpt)
+
+    with open(ckpt) as f:
+        state = json.load(f)
+    state["dateRanges"] = [{"startDate": "2024-01-01", "endDate": "2024-01-07"}]  # as pinned on an earlier day
+    with open(ckpt, "w") as f:
+        json.dump(state, f)
+
+    seen = []
+    pages = _pages(25)
+
+    def iter_report_pages(property_id, req, page_size):
+        seen.append(req.dateRanges[0])
+        return pages(property_id, req, page_size)
+
+    result = export_report(Mock(iter_report_pages=iter_report_pages), "123", req, out, page_size=5, buffer_rows=10, checkpoint_path=ckpt)
+    assert result.resumed_from == 10 and result.rows == 25
+    assert (seen[0].startDate, seen[0].endDate) == ("2024-01-01", "2024-01-07")
+
+
+@pytest.mark.parametrize("fmt,compression", [("xlsx", None), ("csv", "zstd"), ("parquet", "zip")])
+def test_bad_format_or_compression_is_rejected_before_fetching(tmp_path, fmt, compression):
+    client = Mock()
+    req = build_run_report_request(dimensions=["pagePath"], metrics=["screenPageViews"], start_date="2024-01-01", end_date="2024-01-31")
+    with pytest.raises(ValueError):
+        export_report(client, "1", req, str(tmp_path / "out"), format=fmt, compression=compression)
+    assert not client.iter_report_pages.called
+    assert not (tmp_path / "out").exists()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+from ..fanout import arun_fanout, jobs_matrix, run_fanout
+from ..api.utils import build_run_report_request
+from ..api._responses import RunReportResponse
+
+
+def test_run_fanout_collects_errors_and_limits_per_property():
+    lock = threading.Lock()
+    active: dict = {}
+    peak: dict = {}
+
+    def run_report(property_id, req):
+        with lock:
+            active[property_id] = active.get(property_id, 0) + 1
+            peak[property_id] = max(peak.get(property_id, 0), active[property_id])
+        time.sleep(0.01)
+        with lock:
+            active[property_id] -= 1
+        if property_id == "bad":
+            raise RuntimeError("boom")
+        return RunReportResponse(dimensionHeaders=[], metricHeaders=[], rowCount=0)
+
+    client = Mock(run_report=run_report)
+    reqs = [build_run_report_request(dimensions=["date"], metrics=["activeUsers"], last_n_days=n) for n in range(1, 7)]
+    jobs = jobs_matrix(["1", "2", "bad"], reqs)
+
+    results = list(run_fanout(client, jobs, max_workers=8, max_per_property=2))
+
+    assert len(results) == 18
+    assert sum(not r.ok for r in results) == 6
+    assert all(isinstance(r.error, RuntimeError) for r in results if r.job.property_id == "bad")
+    assert all(r.elapsed > 0 for r in results)
+    assert max(peak.values()) <= 2
+
+
+def test_arun_fanout_bounds_tasks_and_per_property_calls_and_yields_in_completion_order():
+    active: dict = {}
+    peak: dict = {}
+    tasks_seen = []
+
+    async def run_report(property_id, req):
+        tasks_seen.append(len(asyncio.all_tasks()) - 1)  # minus the test's own task
+        active[property_id] = active.get(property_id, 0) + 1
+        peak[property_id] = max(peak.get(property_id, 0), active[property_id])
+        await asyncio.sleep(0.05 if property_id == "slow" else 0.001)
+        active[property_id] -= 1
+        return RunReportResponse(dimensionHeaders=[], metricHeaders=[], rowCount=0)
+
+    client = Mock(run_report=run_report)
+    reqs = [build_run_report_request(dimensions=["date"], metrics=["activeUsers"], last_n_days=n) for n in range(1, 7)]
+    jobs = jobs_matrix(["slow", "fast"], reqs)
+
+    async def main():
+        return [r async for r in arun_fanout(client, jobs, max_concurrency=3, max_per_property=2)]
+
+    results = asyncio.run(main())
+
+    assert len(results) == 12 and all(r.ok for r in results)
+    assert max(peak.values()) <= 2
+    assert max(tasks_seen) <= 3
+    # the fast property keeps its slot while the slow one holds two, so all of it finishes first
+    assert [r.job.property_id for r in results] == ["fast"] * 6 + ["slow"] * 6
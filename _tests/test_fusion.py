@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+from unittest.mock import patch, Mock
+
+from ..client import GA4Client
+from ..fusion import plan_fusion, run_fused
+from ..api._requests import Filter, FilterExpression, StringFilter
+from ..api.utils import build_run_report_request
+
+DATES = ["20240101", "20240102"]
+COUNTRIES = ["US", "DE"]
+
+
+def _req(metrics, *, dims=("date",), country=None, limit=None):
+    req = build_run_report_request(dimensions=dims, metrics=metrics, start_date="2024-01-01", end_date="2024-01-02", limit=limit)
+    if country:
+        req.dimensionFilter = FilterExpression(filter=Filter(fieldName="country", stringFilter=StringFilter(value=country)))
+    return req
+
+
+def _report(body):
+    """Fake GA: sessions = 10*date + country, screenPageViews only for DE."""
+    dims = [d["name"] for d in body["dimensions"]]
+    mets = [m["name"] for m in body["metrics"]]
+    rows = []
+    for di, d in enumerate(DATES):
+        for ci, c in enumerate(COUNTRIES):
+            values = {"date": d, "country": c}
+            if "country" not in dims and ci:
+                continue
+            if body.get("dimensionFilter") and c != body["dimensionFilter"]["filter"]["stringFilter"]["value"]:
+                continue
+            metric = {"sessions": 10 * (di + 1) + ci, "screenPageViews": 5 * ci}
+            rows.append({"dimensionValues": [{"value": values[n]} for n in dims], "metricValues": [{"value": str(metric[m])} for m in mets]})
+    return {
+        "dimensionHeaders": [{"name": n} for n in dims],
+        "metricHeaders": [{"name": m, "type": "TYPE_INTEGER"} for m in mets],
+        "rows": rows,
+        "rowCount": len(rows),
+    }
+
+
+def test_plan_fuses_metric_and_filter_variants():
+    by_country = ("date", "country")
+    reqs = [_req(["sessions"], dims=by_country), _req(["screenPageViews"], dims=by_country), _req(["sessions"], dims=by_country, country="US"), _req(["sessions"], limit=5)]
+    plan = plan_fusion(reqs)
+    assert plan.saved_calls == 2
+    fused, alone = plan.calls
+    assert fused.members == [0, 1, 2] and fused.local_filters
+    assert [d.name for d in fused.request.dimensions] == ["date", "country"]
+    assert [m.name for m in fused.request.metrics] == ["sessions", "screenPageViews"]
+    assert fused.request.dimensionFilter is None
+    assert alone.members == [3] and alone.request is reqs[3]
+
+    # country is not requested: summing back over it would inflate sessions, so the filter stays server-side
+    strict = plan_fusion([_req(["sessions"]), _req(["screenPageViews"]), _req(["sessions"], country="US")])
+    assert [c.members for c in strict.calls] == [[0, 1], [2]]
+    assert not any(c.local_filters for c in strict.calls)
+    assert strict.calls[1].request.dimensionFilter is not None
+
+
+def test_metrics_packed_within_limit():
+    names = [f"m{i}" for i in range(15)]
+    plan = plan_fusion([_req(names[0:6]), _req(names[6:12]), _req(names[9:15])])
+    assert [c.members for c in plan.calls] == [[0], [1, 2]]  # 1 and 2 share m9..m11
+    assert [len(c.request.metrics) for c in plan.calls] == [6, 9]
+
+
+def test_run_fused_splits_rows_back_per_request():
+    client = GA4Client(access_token="test")
+    bodies = []
+
+    def side_effect(method, url, data=None, timeout=None):
+        body = json.loads(data)
+        bodies.append(body)
+        payload = {"reports": [_report(r) for r in body["requests"]]} if url.endswith(":batchRunReports") else _report(body)
+        return Mock(status_code=200, json=lambda: payload, content=json.dumps(payload).encode())
+
+    by_country = ("date", "country")
+    reqs = [_req(["sessions"], dims=by_country), _req(["screenPageViews"], dims=by_country), _req(["sessions"], dims=by_country, country="US"), _req(["sessions"], limit=5)]
+    with patch.object(client._session, "request", side_effect=side_effect):
+        total, views, us, limited = run_fused(client, "123", reqs)
+
+    assert len(bodies) == 1 and len(bodies[0]["requests"]) == 2  # one round-trip instead of four
+    assert [r.metricValues[0]["value"] for r in total.rows] == ["10", "11", "20", "21"]
+    assert [h.name for h in total.dimensionHeaders] == ["date", "country"] and total.rowCount == 4
+    assert [(r.dimensionValues[1]["value"], r.metricValues[0]["value"]) for r in us.rows] == [("US", "10"), ("US", "20")]
+    assert [r.metricValues[0]["value"] for r in views.rows] == ["5", "5"]
+    assert limited.rowCount == 2 and [h.name for h in limited.dimensionHeaders] == ["date"]
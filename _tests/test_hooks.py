@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from unittest.mock import patch, Mock
+
+from ..cache import MemoryCache
+from ..client import GA4Client
+from ..hooks import Hooks
+from ..api.utils import build_run_report_request
+
+
+def test_hooks_receive_timed_events_with_retries_and_cache_hits():
+    hooks = Hooks()
+    started, finished = [], []
+    hooks.on_request(started.append)
+    hooks.on_response(finished.append)
+    client = GA4Client(access_token="test", hooks=hooks, cache=MemoryCache())
+
+    fake_json = {"dimensionHeaders": [{"name": "date"}], "metricHeaders": [{"name": "activeUsers"}], "rowCount": 0}
+    body = json.dumps(fake_json).encode()
+    responses = [
+        Mock(status_code=503, json=lambda: {"error": {"message": "busy"}}, content=b"{}", text="busy", headers={}, elapsed=timedelta(seconds=0.01)),
+        Mock(status_code=200, content=body, headers={}, elapsed=timedelta(seconds=0.02)),
+    ]
+    req = build_run_report_request(dimensions=["date"], metrics=["activeUsers"], last_n_days=7)
+
+    with patch.object(client._session, "request", side_effect=responses), patch("time.sleep"):
+        client.run_report("123", req)
+        client.run_report("123", req)
+
+    assert len(started) == len(finished) == 2
+    miss, hit = finished
+    assert miss.endpoint == "runReport" and miss.property_id == "123"
+    assert (miss.status, miss.retries, miss.cache_hit) == (200, 1, False)
+    assert miss.bytes_in == len(body) + 2 and miss.bytes_out > 0
+    assert abs(miss.spans["ttfb"] - 0.03) < 1e-9
+    assert {"retry_sleep", "parse"} <= set(miss.spans)
+    assert hit.cache_hit is True and hit.attempts == 0
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+PACKAGE = __package__.rsplit(".", 1)[0]
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _loaded_after(stmt: str) -> set:
+    code = f"import json, sys\n{stmt}\nprint(json.dumps(sorted(sys.modules)))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return set(json.loads(out))
+
+
+def test_sync_client_import_skips_web_and_optional_stacks():
+    loaded = _loaded_after(f"from {PACKAGE} import GA4Client")
+    assert not {"fastapi", "httpx", "numpy", "asyncio"} & loaded
+    assert not {m for m in loaded if m.startswith(f"{PACKAGE}.api.deps")}
+
+
+def test_public_names_resolve_lazily():
+    pkg = importlib.import_module(PACKAGE)
+    assert set(pkg.__all__) <= set(dir(pkg))
+    assert pkg.GA4Client is importlib.import_module(f"{PACKAGE}.client").GA4Client
+    assert pkg.get_ga4_client_dependency is importlib.import_module(f"{PACKAGE}.api.deps").get_client
+    with pytest.raises(AttributeError):
+        pkg.not_a_name
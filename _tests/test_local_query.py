@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from ..columnar import ColumnarReport
+from ..filters import matches_filter
+from ..local_query import query
+from ..api._requests import (
+    DateRange,
+    Dimension,
+    Filter,
+    FilterExpression,
+    Metric,
+    NumericFilter,
+    NumericValue,
+    OrderBy,
+    RunReportRequest,
+    StringFilter,
+)
+
+
+def _report() -> ColumnarReport:
+    rows = [
+        ("20250130", "/blog/a", 3),
+        ("20250131", "/blog/b", 4),
+        ("20250201", "/blog/a", 5),
+        ("20250202", "/shop", 7),
+    ]
+    return ColumnarReport.from_json(
+        {
+            "dimensionHeaders": [{"name": "date"}, {"name": "pagePath"}],
+            "metricHeaders": [{"name": "screenPageViews", "type": "TYPE_INTEGER"}],
+            "rows": [
+                {"dimensionValues": [{"value": d}, {"value": p}], "metricValues": [{"value": str(v)}]}
+                for d, p, v in rows
+            ],
+        }
+    )
+
+
+def test_rollup_to_month_with_filters_order_and_limit():
+    req = RunReportRequest(
+        dimensions=[Dimension(name="yearMonth")],
+        metrics=[Metric(name="screenPageViews")],
+        dimensionFilter=FilterExpression(filter=Filter(fieldName="pagePath", stringFilter=StringFilter(matchType="BEGINS_WITH", value="/blog"))),
+        orderBys=[OrderBy(fieldName="screenPageViews", desc=True)],
+    )
+    result = query(_report(), req)
+    assert result["yearMonth"].tolist() == ["202501", "202502"]
+    assert result["screenPageViews"].tolist() == [7, 5]
+
+
+def test_metric_filter_applies_after_grouping():
+    req = RunReportRequest(
+        dimensions=[Dimension(name="pagePath")],
+        metrics=[Metric(name="screenPageViews")],
+        metricFilter=FilterExpression(
+            filter=Filter(fieldName="screenPageViews", numericFilter=NumericFilter(operation="GREATER_THAN", value=NumericValue(int64Value="6")))
+        ),
+        orderBys=[OrderBy(fieldName="pagePath")],
+        limit=5,
+    )
+    result = query(_report(), req)
+    assert result["pagePath"].tolist() == ["/blog/a", "/shop"]
+    assert result["screenPageViews"].tolist() == [8, 7]
+
+
+def test_filter_on_missing_field_names_it():
+    req = RunReportRequest(
+        dimensions=[Dimension(name="pagePath")],
+        metrics=[Metric(name="screenPageViews")],
+        dimensionFilter=FilterExpression(filter=Filter(fieldName="country", stringFilter=StringFilter(value="US"))),
+    )
+    with pytest.raises(ValueError, match="'country'"):
+        query(_report(), req)
+
+
+def test_column_filters_share_row_filter_semantics():
+    report = _report()
+    for sf in (StringFilter(matchType="CONTAINS", value="BLOG"), StringFilter(matchType="PARTIAL_REGEXP", value="^/S")):
+        flt = Filter(fieldName="pagePath", stringFilter=sf)
+        req = RunReportRequest(dimensions=[Dimension(name="pagePath")], metrics=[Metric(name="screenPageViews")], dimensionFilter=FilterExpression(filter=flt))
+        expected = sorted({p for p in report["pagePath"] if matches_filter(p, flt)})
+        assert query(report, req)["pagePath"].tolist() == expected
+
+
+def test_date_range_narrows_rows_before_grouping():
+    req = RunReportRequest(
+        dimensions=[Dimension(name="yearMonth")],
+        metrics=[Metric(name="screenPageViews")],
+        dateRanges=[DateRange(startDate="2025-01-31", endDate="yesterday")],
+    )
+    result = query(_report(), req, today=date(2025, 2, 2))
+    assert result["yearMonth"].tolist() == ["202501", "202502"]
+    assert result["screenPageViews"].tolist() == [4, 5]  # 01-30 and 02-02 fall outside
+
+    no_dates = ColumnarReport.concat([_report()])
+    del no_dates.columns["date"]
+    with pytest.raises(ValueError, match="date"):
+        query(no_dates, req.model_copy(update={"dimensions": [Dimension(name="pagePath")]}))
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+from unittest.mock import patch, Mock
+
+from ..client import GA4Client
+from ..metadata import MetadataService
+from ..api.utils import build_run_report_request
+from ..api._exceptions import RequestValidationError
+
+FAKE_METADATA = {
+    "name": "properties/123/metadata",
+    "dimensions": [{"apiName": "date"}, {"apiName": "pagePath", "deprecatedApiNames": ["pagePathPlusQueryString"]}],
+    "metrics": [{"apiName": "activeUsers", "type": "TYPE_INTEGER"}],
+}
+
+
+def test_check_fields_rejects_unknown_names_without_running_report():
+    client = GA4Client(access_token="test", check_fields=True)
+    fake_resp = Mock(status_code=200, json=lambda: FAKE_METADATA, content=json.dumps(FAKE_METADATA).encode())
+
+    with patch.object(client._session, "request", return_value=fake_resp) as send:
+        req = build_run_report_request(dimensions=["date", "pagePth"], metrics=["activeUser"], last_n_days=7)
+        for _ in range(2):
+            try:
+                client.run_report("123", req)
+            except RequestValidationError as e:
+                assert e.problems == ["unknown dimension 'pagePth'", "unknown metric 'activeUser'"]
+            else:
+                assert False, "Expected RequestValidationError"
+
+    assert send.call_count == 1
+    assert send.call_args.args[0] == "GET"
+
+
+def test_metadata_persisted_to_disk(tmp_path):
+    fetches = []
+
+    def fetch(property_id):
+        fetches.append(property_id)
+        return FAKE_METADATA
+
+    MetadataService(fetch, cache_dir=str(tmp_path)).index("123")
+    index = MetadataService(fetch, cache_dir=str(tmp_path)).index("123")
+
+    assert fetches == ["123"]
+    assert index.dimensions["pagePathPlusQueryString"].apiName == "pagePath"
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+from unittest.mock import patch, Mock
+
+from ..client import GA4Client
+from ..api.utils import build_run_report_request
+
+
+def _page(offset: int, limit: int, total: int) -> dict:
+    return {
+        "dimensionHeaders": [{"name": "pagePath"}],
+        "metricHeaders": [{"name": "screenPageViews", "type": "TYPE_INTEGER"}],
+        "rows": [
+            {"dimensionValues": [{"value": f"/p{i}"}], "metricValues": [{"value": str(i)}]}
+            for i in range(offset, min(offset + limit, total))
+        ],
+        "rowCount": total,
+    }
+
+
+def test_iter_report_rows_walks_offset():
+    client = GA4Client(access_token="test")
+    offsets = []
+
+    def side_effect(method, url, data=None, timeout=None):  # type: ignore[override]
+        body = json.loads(data)
+        offsets.append((body["offset"], body["limit"]))
+        payload = _page(body["offset"], body["limit"], total=25)
+        return Mock(status_code=200, json=lambda: payload, content=json.dumps(payload).encode())
+
+    with patch.object(client._session, "request", side_effect=side_effect):
+        req = build_run_report_request(dimensions=["pagePath"], metrics=["screenPageViews"], last_n_days=7)
+        rows = list(client.iter_report_rows("123", req, page_size=10))
+
+    assert [r.dimensionValues[0]["value"] for r in rows] == [f"/p{i}" for i in range(25)]
+    assert offsets == [(0, 10), (10, 10), (20, 10)]
+
+
+def test_iter_report_rows_respects_limit():
+    client = GA4Client(access_token="test")
+
+    def side_effect(method, url, data=None, timeout=None):  # type: ignore[override]
+        body = json.loads(data)
+        payload = _page(body["offset"], body["limit"], total=100)
+        return Mock(status_code=200, json=lambda: payload, content=json.dumps(payload).encode())
+
+    with patch.object(client._session, "request", side_effect=side_effect):
+        req = build_run_report_request(dimensions=["pagePath"], metrics=["screenPageViews"], limit=15)
+        rows = list(client.iter_report_rows("123", req, page_size=10))
+
+    assert len(rows) == 15
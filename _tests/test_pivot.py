@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+from unittest.mock import patch, Mock
+
+import pytest
+
+from ..async_client import AsyncGA4Client
+from ..client import GA4Client, _Verdicts
+from ..metadata import MetadataIndex, MetadataService, validate_request
+from ..pivot import pivot_matrix
+from ..api._exceptions import RequestValidationError
+from ..api._requests import Dimension, Metric, Pivot, RunPivotReportRequest
+from ..api._responses import PropertyMetadata
+
+
+def _ok(payload):
+    return Mock(status_code=200, json=lambda: payload, content=json.dumps(payload).encode())
+
+
+def _cell(*values):
+    return [{"value": v} for v in values]
+
+
+REQ = RunPivotReportRequest(
+    dimensions=[Dimension(name="deviceCategory"), Dimension(name="country")],
+    metrics=[Metric(name="activeUsers"), Metric(name="sessions")],
+    pivots=[Pivot(fieldNames=["country"], limit=2), Pivot(fieldNames=["deviceCategory"], limit=3)],
+)
+PIVOT = {
+    "pivotHeaders": [
+        {"pivotDimensionHeaders": [{"dimensionValues": _cell("US")}, {"dimensionValues": _cell("DE")}], "rowCount": 40},
+        {"pivotDimensionHeaders": [{"dimensionValues": _cell(d)} for d in ("desktop", "mobile", "tablet")], "rowCount": 3},
+    ],
+    "dimensionHeaders": [{"name": "deviceCategory"}, {"name": "country"}],
+    "metricHeaders": [{"name": "activeUsers", "type": "TYPE_INTEGER"}, {"name": "sessions", "type": "TYPE_INTEGER"}],
+    "rows": [
+        {"dimensionValues": _cell("desktop", "US"), "metricValues": _cell("10", "12")},
+        {"dimensionValues": _cell("mobile", "US"), "metricValues": _cell("7", "9")},
+        {"dimensionValues": _cell("desktop", "DE"), "metricValues": _cell("4", "5")},
+        {"dimensionValues": _cell("desktop", "FR"), "metricValues": _cell("1", "1")},
+    ],
+}
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_run_pivot_report_reshapes_into_cross_tab(validate):
+    client = GA4Client(access_token="test", validate=validate)
+    with patch.object(client._session, "request", return_value=_ok(PIVOT)) as send:
+        resp = client.run_pivot_report("123", REQ)
+
+    assert send.call_args.args[1].endswith("/properties/123:runPivotReport")
+    pm = pivot_matrix(resp, REQ)
+    assert pm.labels == [[("US",), ("DE",)], [("desktop",), ("mobile",), ("tablet",)]]
+    assert pm.values.shape == (2, 3, 2)
+    users = pm.matrix()
+    assert users[0].tolist()[:2] == [10.0, 7.0] and math.isnan(users[0, 2])
+    assert pm.matrix("sessions")[1, 0] == 5.0  # FR is outside the country pivot's limit
+    frame = pm.to_pandas("activeUsers")
+    assert frame.loc["US", "mobile"] == 7.0
+
+
+def test_batch_run_pivot_reports_keeps_order():
+    client = GA4Client(access_token="test")
+
+    def side_effect(method, url, data=None, timeout=None):
+        n = len(json.loads(data)["requests"])
+        return _ok({"pivotReports": [dict(PIVOT, rows=PIVOT["rows"][:i]) for i in range(n)]})
+
+    with patch.object(client._session, "request", side_effect=side_effect) as send:
+        reports = client.batch_run_pivot_reports("123", [REQ] * 7)
+
+    assert send.call_count == 2 and send.call_args.args[1].endswith(":batchRunPivotReports")
+    assert [len(r.rows) for r in reports] == [0, 1, 2, 3, 4, 0, 1]
+
+
+def test_ensure_compatible_rejects_and_remembers_verdict():
+    client = GA4Client(access_token="test")
+    verdict = {
+        "dimensionCompatibilities": [
+            {"dimensionMetadata": {"apiName": "deviceCategory"}, "compatibility": "COMPATIBLE"},
+            {"dimensionMetadata": {"apiName": "country"}, "compatibility": "INCOMPATIBLE"},
+        ],
+        "metricCompatibilities": [{"metricMetadata": {"apiName": "activeUsers"}, "compatibility": "COMPATIBLE"}],
+    }
+    with patch.object(client._session, "request", return_value=_ok(verdict)) as send:
+        for _ in range(2):
+            with pytest.raises(RequestValidationError) as err:
+                client.ensure_compatible("123", REQ)
+    assert err.value.problems == ["'country' is incompatible with the other requested fields"]
+    assert send.call_count == 1
+    assert json.loads(send.call_args.kwargs["data"])["dimensions"] == [{"name": "deviceCategory"}, {"name": "country"}]
+
+
+def test_pivot_requests_validated_locally():
+    meta = PropertyMetadata(dimensions=[{"apiName": "deviceCategory"}, {"apiName": "country"}], metrics=[{"apiName": "activeUsers"}])
+    index = MetadataIndex.build(meta, 0.0)
+    req = REQ.model_copy(update={"metrics": [Metric(name="activeUsers")], "pivots": [Pivot(fieldNames=["country"], limit=1000), Pivot(fieldNames=["city"], limit=1000)]})
+    with pytest.raises(RequestValidationError) as err:
+        validate_request(index, req)
+    assert err.value.problems == [
+        "pivot field 'city' is not a requested dimension",
+        "dimension 'deviceCategory' must appear in exactly one pivot",
+        "pivot limits multiply to 1000000, at most 100000 allowed",
+    ]
+
+
+def test_async_pivot_report_checked_against_metadata():
+    meta = {"dimensions": [{"apiName": "deviceCategory"}], "metrics": [{"apiName": "activeUsers"}]}
+    client = AsyncGA4Client(access_token="test", metadata=MetadataService(lambda pid: meta))
+
+    async def main():
+        with patch.object(client._http, "request") as send:
+            with pytest.raises(RequestValidationError) as err:
+                await client.run_pivot_report("123", REQ)
+        await client.aclose()
+        return err.value.problems, send.call_count
+
+    problems, calls = asyncio.run(main())
+    assert "unknown dimension 'country'" in " ".join(problems) and calls == 0
+
+
+def test_compatibility_verdicts_are_bounded():
+    verdicts = _Verdicts(maxsize=2)
+    verdicts.set("a", [])
+    verdicts.set("b", ["x"])
+    assert verdicts.get("a") == []  # touch: "b" is now least recently used
+    verdicts.set("c", [])
+    assert len(verdicts) == 2 and verdicts.get("b") is None and verdicts.get("a") == []
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+from ..pool import ClientPool
+
+
+def test_pool_reuses_clients_per_token_and_bounds_size():
+    pool = ClientPool(max_clients=2, idle_ttl=60)
+    a = pool.get("token-a")
+    assert pool.get("token-a") is a
+    pool.get("token-b")
+    pool.get("token-c")
+    assert len(pool) == 2
+    assert pool.get("token-a") is not a
+
+
+def test_pool_evicts_idle_clients():
+    pool = ClientPool(max_clients=10, idle_ttl=5)
+    with patch("time.monotonic", return_value=100.0):
+        a = pool.get("token-a")
+    with patch("time.monotonic", return_value=200.0):
+        pool.get("token-b")
+        assert len(pool) == 1
+        assert pool.get("token-a") is not a
+
+
+def test_pool_closes_clients_dropped_for_size_once_idle_and_returned():
+    pool = ClientPool(max_clients=1, idle_ttl=5)
+    with patch("time.monotonic", return_value=100.0) as now:
+        with pool.lease("token-a") as a:
+            a.close = Mock()
+            b = pool.get("token-b")  # drops a while it is checked out
+            b.close = Mock()
+            now.return_value = 200.0
+            pool.get("token-c")
+            assert b.close.called  # dropped earlier, now idle and not leased
+            assert not a.close.called
+        assert a.close.called
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import patch, Mock
+
+from ..cache import MemoryCache
+from ..client import GA4Client
+from ..ratelimit import QuotaScheduler
+from ..api.utils import build_run_report_request
+from ..api._responses import PropertyQuota
+
+
+def test_scheduler_caps_concurrency_per_property():
+    scheduler = QuotaScheduler(concurrent_requests=2)
+    lock = threading.Lock()
+    active = [0, 0]  # current, peak
+
+    def work():
+        with scheduler.acquire("123"):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert active[1] == 2
+
+
+def test_observe_quota_throttles_when_tokens_run_out():
+    scheduler = QuotaScheduler(tokens_per_hour=3600)
+    scheduler.observe(
+        "123",
+        PropertyQuota.model_validate(
+            {"tokensPerHour": {"consumed": 3600, "remaining": 0}, "concurrentRequests": {"consumed": 0, "remaining": 10}}
+        ),
+    )
+
+    async def main():
+        try:
+            await asyncio.wait_for(scheduler.acquire_async("123").__aenter__(), timeout=0.1)
+        except asyncio.TimeoutError:
+            return True
+        return False
+
+    assert asyncio.run(main())
+    assert scheduler._waiting["123"] == []
+
+
+def test_client_observes_quota_from_parsed_response_but_not_cache_hits():
+    scheduler = QuotaScheduler()
+    client = GA4Client(access_token="test", rate_limiter=scheduler, cache=MemoryCache())
+    quota = {"tokensPerHour": {"consumed": 10, "remaining": 90}}
+    body = json.dumps({"dimensionHeaders": [], "metricHeaders": [], "rowCount": 0, "propertyQuota": quota}).encode()
+    req = build_run_report_request(dimensions=["date"], metrics=["activeUsers"], start_date="2024-01-01", end_date="2024-01-31")
+
+    with patch.object(client._session, "request", return_value=Mock(status_code=200, content=body, headers={})), patch.object(
+        scheduler, "observe", wraps=scheduler.observe
+    ) as observe:
+        client.run_report("123", req)
+        client.run_report("123", req)  # cached: its quota is stale
+
+    assert observe.call_count == 1
+    assert observe.call_args.args[1].tokensPerHour.remaining == 90
+
+
+def test_observe_resyncs_tokens_both_ways_and_costs_from_consumed():
+    scheduler = QuotaScheduler(tokens_per_hour=1000)
+    quota = lambda consumed, remaining: PropertyQuota.model_validate({"tokensPerHour": {"consumed": consumed, "remaining": remaining}})
+
+    scheduler.observe("123", quota(20, 100))
+    state = scheduler._states["123"]
+    assert state.tokens == 100
+    assert state.cost == 0.8 * 10 + 0.2 * 20
+
+    scheduler.observe("123", quota(20, 900))  # another worker's hour rolled over: quota came back
+    assert state.tokens == 900
+    assert state.capacity == 1000
+
+    scheduler.observe("123", quota(20, 5000))  # larger (360) property
+    assert state.capacity == 5000
+
+
+def test_report_priority_reaches_the_scheduler():
+    scheduler = QuotaScheduler()
+    client = GA4Client(access_token="test", rate_limiter=scheduler)
+    body = json.dumps({"dimensionHeaders": [], "metricHeaders": [], "rowCount": 0}).encode()
+    req = build_run_report_request(dimensions=["date"], metrics=["activeUsers"], start_date="2024-01-01", end_date="2024-01-31")
+
+    with patch.object(client._session, "request", return_value=Mock(status_code=200, content=body, headers={})), patch.object(
+        scheduler, "acquire", wraps=scheduler.acquire
+    ) as acquire:
+        client.run_report("123", req, priority=-1)
+
+    assert acquire.call_args.kwargs == {"priority": -1}
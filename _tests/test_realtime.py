@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from unittest.mock import patch, Mock
 
 from ..client import GA4Client
@@ -20,7 +21,7 @@ def test_realtime_success():
         ],
     }
 
-    with patch.object(client._session, "request", return_value=Mock(status_code=200, json=lambda: fake_json, content=b"{}")):
+    with patch.object(client._session, "request", return_value=Mock(status_code=200, json=lambda: fake_json, content=json.dumps(fake_json).encode())):
         req = build_realtime_request(dimensions=["eventName"], metrics=["activeUsers"], limit=10)
         resp = client.run_realtime_report("123", req)
         assert len(resp.rows) == 1
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+from ..realtime import stream_realtime
+from ..api.utils import build_realtime_request
+from ..api._responses import RealtimeReportResponse
+
+
+def _snapshot(counts: dict) -> RealtimeReportResponse:
+    return RealtimeReportResponse.model_validate(
+        {
+            "dimensionHeaders": [{"name": "country"}],
+            "metricHeaders": [{"name": "activeUsers"}],
+            "rows": [
+                {"dimensionValues": [{"value": k}], "metricValues": [{"value": str(v)}]} for k, v in counts.items()
+            ],
+        }
+    )
+
+
+def test_stream_realtime_yields_diffs_and_backs_off():
+    snapshots = [
+        _snapshot({"US": 5, "DE": 2}),
+        _snapshot({"US": 5, "DE": 2}),
+        _snapshot({"US": 6, "FR": 1}),
+    ]
+    sleeps = []
+
+    class FakeClient:
+        async def run_realtime_report(self, property_id, req):
+            return snapshots.pop(0)
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    async def main():
+        req = build_realtime_request(dimensions=["country"], metrics=["activeUsers"])
+        stream = stream_realtime(FakeClient(), "123", req, interval=1.0, backoff=2.0)
+        with patch("asyncio.sleep", fake_sleep):
+            first = await stream.__anext__()
+            second = await stream.__anext__()
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert set(first.added) == {("US",), ("DE",)}
+    assert set(second.changed) == {("US",)}
+    assert set(second.added) == {("FR",)}
+    assert set(second.removed) == {("DE",)}
+    assert sleeps == [1.0, 2.0]
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import patch, Mock
+
+import pytest
+
+from ..async_client import AsyncGA4Client
+from ..client import GA4Client
+from ..hooks import Hooks
+from ..ratelimit import QuotaScheduler
+from ..resilience import CircuitBreaker, HedgePolicy
+from ..api._exceptions import CircuitOpenError
+from ..api.utils import build_run_report_request
+
+REPORT = {"dimensionHeaders": [{"name": "date"}], "metricHeaders": [{"name": "activeUsers"}], "rowCount": 1}
+REQ = build_run_report_request(dimensions=["date"], metrics=["activeUsers"], last_n_days=7)
+
+
+def _warm(policy: HedgePolicy, seconds: float = 0.01) -> HedgePolicy:
+    for _ in range(policy.min_samples):
+        policy.record("runReport", seconds)
+    return policy
+
+
+def test_slow_call_is_hedged_and_fast_duplicate_wins():
+    hooks, events = Hooks(), []
+    hooks.on_response(events.append)
+    policy = _warm(HedgePolicy(percentile=0.5, min_samples=5, min_delay=0.01))
+    client = GA4Client(access_token="test", hooks=hooks, hedge=policy)
+    release = threading.Event()
+    calls = []
+
+    def side_effect(method, url, data=None, timeout=None):
+        calls.append(url)
+        if len(calls) == 1:
+            release.wait(5)  # stuck upstream node
+            return Mock(status_code=200, content=json.dumps(dict(REPORT, rowCount=-1)).encode(), headers={})
+        return Mock(status_code=200, content=json.dumps(REPORT).encode(), headers={})
+
+    with patch.object(client._session, "request", side_effect=side_effect):
+        resp = client.run_report("123", REQ)
+        release.set()
+
+    assert resp.rowCount == 1 and len(calls) == 2
+    assert events[0].hedges == 1
+    assert policy.delay_for("runReport") == 0.01
+    assert HedgePolicy(min_samples=5).delay_for("runReport") is None  # cold: no hedging
+    policy.close()
+
+
+def test_async_hedge_cancels_loser():
+    policy = _warm(HedgePolicy(percentile=0.5, min_samples=5, min_delay=0.01))
+    cancelled = []
+
+    async def main():
+        attempts = 0
+
+        async def send():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+                return "slow"
+            return "fast"
+
+        return await policy.arun("runReport", send)
+
+    assert asyncio.run(main()) == ("fast", True)
+    assert cancelled == [True]
+
+
+def test_circuit_breaker_fails_fast_then_recovers():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_time=60)
+    client = GA4Client(access_token="test", circuit_breaker=breaker)
+    busy = Mock(status_code=503, json=lambda: {"error": {"message": "busy"}}, content=b"{}", text="busy", headers={})
+
+    with patch.object(client._session, "request", return_value=busy) as send, patch("time.sleep") as sleep:
+        with pytest.raises(CircuitOpenError):
+            client.run_report("123", REQ)
+        assert send.call_count == 2 and sleep.call_count == 1
+        with pytest.raises(CircuitOpenError) as err:
+            client.run_report("123", REQ)
+        assert send.call_count == 2  # no upstream call while open
+    assert err.value.endpoint == "runReport" and breaker.state("runReport") == "open"
+    assert breaker.state("batchRunReports") == "closed"
+
+    breaker.recovery_time = 0  # cool-down elapsed: one probe goes through and closes the circuit
+    ok = Mock(status_code=200, content=json.dumps(REPORT).encode(), headers={})
+    with patch.object(client._session, "request", return_value=ok):
+        assert client.run_report("123", REQ).rowCount == 1
+    assert breaker.state("runReport") == "closed"
+
+
+def test_cancelled_probe_releases_half_open_slot():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=0)
+    breaker.record("runReport", False)
+    assert breaker.state("runReport") == "half_open"
+    client = AsyncGA4Client(access_token="test", circuit_breaker=breaker)
+    ok = Mock(status_code=200, content=json.dumps(REPORT).encode(), headers={})
+
+    async def main():
+        started = asyncio.Event()
+
+        async def hang(*args, **kwargs):
+            started.set()
+            await asyncio.sleep(5)
+
+        with patch.object(client._http, "request", side_effect=hang):
+            probe = asyncio.ensure_future(client.run_report("123", REQ))
+            await started.wait()
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+        with patch.object(client._http, "request", return_value=ok):
+            resp = await client.run_report("123", REQ)
+        await client.aclose()
+        return resp
+
+    assert asyncio.run(main()).rowCount == 1  # next caller gets the slot back
+    assert breaker.state("runReport") == "closed"
+
+
+def test_quota_exhaustion_does_not_open_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=60)
+    client = GA4Client(access_token="test", circuit_breaker=breaker)
+    exhausted = Mock(status_code=429, json=lambda: {"error": {"message": "quota"}}, content=b"{}", text="quota", headers={})
+    ok = Mock(status_code=200, content=json.dumps(REPORT).encode(), headers={})
+
+    with patch.object(client._session, "request", side_effect=[exhausted, ok]), patch("time.sleep"):
+        assert client.run_report("123", REQ).rowCount == 1
+    assert breaker.state("runReport") == "closed"
+
+
+def test_hedge_takes_its_own_permit_or_does_not_hedge():
+    policy = _warm(HedgePolicy(percentile=0.5, min_samples=5, min_delay=0.01))
+    scheduler = QuotaScheduler(concurrent_requests=1)
+    client = GA4Client(access_token="test", hedge=policy, rate_limiter=scheduler)
+    calls = []
+
+    def side_effect(method, url, data=None, timeout=None):
+        calls.append(url)
+        time.sleep(0.05)
+        return Mock(status_code=200, content=json.dumps(REPORT).encode(), headers={})
+
+    with patch.object(client._session, "request", side_effect=side_effect):
+        client.run_report("123", REQ)
+    assert len(calls) == 1  # the only permit is held by the original: no duplicate
+
+    scheduler = QuotaScheduler(concurrent_requests=2)
+    client = GA4Client(access_token="test", hedge=policy, rate_limiter=scheduler)
+    with patch.object(client._session, "request", side_effect=side_effect):
+        client.run_report("123", REQ)
+    state = scheduler._states["123"]
+    assert len(calls) == 3 and state.tokens < state.capacity - 1.5 * state.cost  # both attempts charged
+    time.sleep(0.1)  # the losing duplicate finishes in the background
+    assert state.in_flight == 0
+    policy.close()
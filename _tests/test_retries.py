@@ -25,7 +25,7 @@ def test_retries_on_429_then_success():
 
     calls = []
 
-    def side_effect(method, url, json=None, timeout=None):  # type: ignore[override]
+    def side_effect(method, url, data=None, timeout=None):  # type: ignore[override]
         calls.append(url)
         if len(calls) == 1:
             return Resp(429, headers={"Retry-After": "0.01"}, payload={"error": {"message": "rate"}})
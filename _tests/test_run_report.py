@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from unittest.mock import patch, Mock
 
 from ..client import GA4Client
@@ -21,8 +22,26 @@ def test_run_report_success():
         "rowCount": 1,
     }
 
-    with patch.object(client._session, "request", return_value=Mock(status_code=200, json=lambda: fake_json, content=b"{}")):
+    with patch.object(client._session, "request", return_value=Mock(status_code=200, json=lambda: fake_json, content=json.dumps(fake_json).encode())):
         req = build_run_report_request(dimensions=["date"], metrics=["activeUsers"], last_n_days=7, limit=10)
         resp = client.run_report("123", req)
         assert resp.rowCount == 1
         assert len(resp.rows) == 1
+
+
+def test_run_report_without_validation_builds_models():
+    client = GA4Client(access_token="test", validate=False)
+    fake_json = {
+        "dimensionHeaders": [{"name": "date"}],
+        "metricHeaders": [{"name": "activeUsers", "type": "TYPE_INTEGER"}],
+        "rows": [{"dimensionValues": [{"value": "20250101"}], "metricValues": [{"value": "123"}]}],
+        "rowCount": 1,
+    }
+
+    with patch.object(client._session, "request", return_value=Mock(status_code=200, content=json.dumps(fake_json).encode())) as send:
+        req = build_run_report_request(dimensions=["date"], metrics=["activeUsers"], last_n_days=7)
+        resp = client.run_report("123", req)
+
+    assert json.loads(send.call_args.kwargs["data"]) == json.loads(req.model_dump_json(exclude_none=True))
+    assert resp.rows[0].metricValues[0]["value"] == "123"
+    assert resp.metricHeaders[0].type == "TYPE_INTEGER"
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import Mock
+
+import pytest
+
+from ..splitter import is_additive, merge_reports, run_split_report, split_date_range
+from ..api.utils import build_run_report_request
+from ..api._responses import MetricHeader, RunReportResponse
+
+
+def _report(rows, metrics=(("screenPageViews", "TYPE_INTEGER"),)):
+    return RunReportResponse.model_validate(
+        {
+            "dimensionHeaders": [{"name": "pagePath"}],
+            "metricHeaders": [{"name": n, "type": t} for n, t in metrics],
+            "rows": [
+                {"dimensionValues": [{"value": k}], "metricValues": [{"value": str(v)} for v in vals]}
+                for k, vals in rows
+            ],
+            "rowCount": len(rows),
+        }
+    )
+
+
+def test_split_date_range_by_month_and_week():
+    assert split_date_range(date(2025, 1, 20), date(2025, 3, 3), "month") == [
+        (date(2025, 1, 20), date(2025, 1, 31)),
+        (date(2025, 2, 1), date(2025, 2, 28)),
+        (date(2025, 3, 1), date(2025, 3, 3)),
+    ]
+    assert split_date_range(date(2025, 1, 1), date(2025, 1, 8), "week")[0] == (date(2025, 1, 1), date(2025, 1, 5))
+
+
+def test_merge_sums_additive_and_rejects_user_counts():
+    merged = merge_reports([_report([("/a", [2]), ("/b", [1])]), _report([("/a", [3])])])
+    assert {r.dimensionValues[0]["value"]: r.metricValues[0]["value"] for r in merged.rows} == {"/a": "5", "/b": "1"}
+
+    users = (("activeUsers", "TYPE_INTEGER"),)
+    try:
+        merge_reports([_report([("/a", [2])], users), _report([("/a", [3])], users)])
+    except ValueError as e:
+        assert "activeUsers" in str(e)
+    else:
+        assert False, "Expected ValueError"
+
+
+def test_run_split_report_runs_each_window():
+    windows = []
+
+    def run_report(property_id, req):
+        windows.append((req.dateRanges[0].startDate, req.dateRanges[0].endDate))
+        return _report([(req.dateRanges[0].startDate, [1])])
+
+    client = Mock(run_report=run_report)
+    req = build_run_report_request(dimensions=["date"], metrics=["screenPageViews"], start_date="2025-01-01", end_date="2025-01-03")
+    merged = run_split_report(client, "123", req, granularity="day")
+
+    assert sorted(windows) == [("2025-01-01", "2025-01-01"), ("2025-01-02", "2025-01-02"), ("2025-01-03", "2025-01-03")]
+    assert merged.rowCount == 3
+
+
+def test_split_report_ranks_filters_and_limits_merged_rows():
+    from ..api._requests import Filter, FilterExpression, NumericFilter, NumericValue, OrderBy
+
+    sent = []
+    per_window = {
+        "2025-01-01": [("/b", [50]), ("/c", [60])],
+        "2025-01-02": [("/c", [40]), ("/a", [10])],
+    }
+
+    def run_report(property_id, req):
+        sent.append(req)
+        return _report(per_window[req.dateRanges[0].startDate])
+
+    client = Mock(run_report=run_report)
+    req = build_run_report_request(dimensions=["pagePath"], metrics=["screenPageViews"], start_date="2025-01-01", end_date="2025-01-02", limit=1)
+    req.orderBys = [OrderBy(fieldName="screenPageViews", desc=True)]
+    top = run_split_report(client, "123", req, granularity="day")
+    assert [(r.dimensionValues[0]["value"], r.metricValues[0]["value"]) for r in top.rows] == [("/c", "100")]
+    assert top.rowCount == 3  # matching rows before the limit, as GA reports it
+    assert all(s.orderBys is None and s.metricFilter is None and s.limit != 1 for s in sent)
+
+    req = req.model_copy(update={"limit": None, "offset": 1})
+    req.metricFilter = FilterExpression(
+        filter=Filter(fieldName="screenPageViews", numericFilter=NumericFilter(operation="GREATER_THAN", value=NumericValue(int64Value="20")))
+    )
+    rest = run_split_report(client, "123", req, granularity="day")
+    assert [r.dimensionValues[0]["value"] for r in rest.rows] == ["/b"]  # /a (10) filtered on the merged value, /c skipped by offset
+
+
+def test_unknown_metrics_are_not_summed_and_rejected_before_fetching():
+    assert is_additive(MetricHeader(name="sessions")) and is_additive(MetricHeader(name="keyEvents:purchase"))
+    assert not is_additive(MetricHeader(name="totalPurchasers", type="TYPE_INTEGER"))
+    assert is_additive(MetricHeader(name="totalPurchasers"), {"totalPurchasers"})
+
+    client = Mock()
+    req = build_run_report_request(dimensions=["pagePath"], metrics=["totalPurchasers"], start_date="2025-01-01", end_date="2025-01-31")
+    with pytest.raises(ValueError, match="totalPurchasers"):
+        run_split_report(client, "123", req)
+    assert not client.run_report.called  # no quota spent on the probe or windows
+
+    per_day = build_run_report_request(dimensions=["date"], metrics=["totalPurchasers"], start_date="2025-01-01", end_date="2025-01-02")
+    client = Mock(run_report=lambda pid, r: _report([(r.dateRanges[0].startDate, [1])], (("totalPurchasers", "TYPE_INTEGER"),)))
+    assert run_split_report(client, "123", per_day, granularity="day").rowCount == 2  # one window per row: nothing summed
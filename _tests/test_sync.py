@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import Mock
+
+from ..sync import IncrementalSync, WatermarkStore, request_shape_key
+from ..api.utils import build_run_report_request
+from ..api._responses import Row
+
+
+def test_incremental_sync_fetches_only_new_days_plus_restatement(tmp_path):
+    store = WatermarkStore(str(tmp_path / "wm.sqlite3"))
+    windows = []
+
+    def iter_report_rows(property_id, req, page_size):
+        windows.append((req.dateRanges[0].startDate, req.dateRanges[0].endDate))
+        yield Row(dimensionValues=[{"value": "20250101"}], metricValues=[{"value": "1"}])
+
+    client = Mock(iter_report_rows=iter_report_rows)
+    sync = IncrementalSync(client, store, initial_start=date(2025, 1, 1), restatement_days=3)
+    req = build_run_report_request(dimensions=["date"], metrics=["activeUsers"])
+    received = []
+
+    def sink(start, end, rows):
+        received.append((start, end, list(rows)))
+
+    first = sync.run("123", req, sink, today=date(2025, 1, 11))
+    second = sync.run("123", req, sink, today=date(2025, 1, 13))
+
+    assert windows == [("2025-01-01", "2025-01-10"), ("2025-01-08", "2025-01-12")]
+    assert first.rows == 1 and second.end == date(2025, 1, 12)
+    assert store.get("123", request_shape_key(req)) == date(2025, 1, 12)
+    assert sync.run("123", req, sink, today=date(2025, 1, 13)).start == date(2025, 1, 10)
+
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from .. import transport as ga_transport
+from ..benchmarks.fake_server import FakeAnalyticsServer, FakeServerConfig
+from ..client import GA4Client
+from ..hooks import Hooks
+from ..transport import _installed, accept_encoding, make_transport
+from ..api.utils import build_run_report_request
+
+
+def _pull(transport: str, compress: bool = True):
+    hooks = Hooks()
+    events = []
+    hooks.on_response(events.append)
+    req = build_run_report_request(dimensions=["date", "pagePath"], metrics=["activeUsers"], last_n_days=7, limit=2000)
+    with FakeAnalyticsServer(FakeServerConfig(rows=2000, compress=compress)) as server:
+        client = GA4Client("test", base_url=server.base_url, hooks=hooks, transport=transport)
+        try:
+            report = client.run_report("123", req)
+        finally:
+            client.close()
+    return report, events[0]
+
+
+@pytest.mark.parametrize("transport", ["requests", "httpx"])
+def test_transports_negotiate_and_decode_compressed_reports(transport):
+    report, event = _pull(transport)
+    _, plain = _pull(transport, compress=False)
+    assert len(report.rows) == 2000 and report.rows[-1].metricValues[0]["value"] == "999"
+    assert event.bytes_in * 5 < plain.bytes_in  # bytes_in counts the compressed wire size
+
+
+def test_accept_encoding_and_transport_selection():
+    assert accept_encoding().startswith("gzip, deflate")
+    assert make_transport("requests", {"X-Test": "1"}).session.headers["Accept-Encoding"] == accept_encoding()
+    with patch.object(ga_transport, "_installed", return_value=True), patch.object(ga_transport, "_version", return_value=(0, 26)):
+        assert "zstd" not in accept_encoding("httpx")  # zstandard present, but this httpx cannot decode it
+    with patch.object(ga_transport, "_installed", return_value=True), patch.object(ga_transport, "_version", return_value=(2, 2)):
+        assert accept_encoding("requests").endswith("br, zstd")
+    with pytest.raises(ValueError):
+        make_transport("carrier-pigeon", {})
+    if not _installed("h2"):
+        with pytest.raises(ImportError):
+            GA4Client("test", transport="http2")
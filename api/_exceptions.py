@@ -15,3 +15,15 @@ class RateLimitError(ApiError):
 
 class RetryableError(ApiError):
     pass
+
+class CircuitOpenError(RetryableError):
+    """Raised without calling GA while an endpoint's circuit breaker is open."""
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        super().__init__(503, f"circuit open for {endpoint}, retry in {retry_after:.1f}s", "CIRCUIT_OPEN")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+class RequestValidationError(ValueError):
+    def __init__(self, problems: list[str]) -> None:
+        super().__init__("Invalid request: " + "; ".join(problems))
+        self.problems = problems
@@ -20,10 +20,20 @@ class OrderBy(BaseModel):
 class StringFilter(BaseModel):
     matchType: str = Field(default="EXACT")  # GA4 supports BEGINS_WITH, EXACT, etc.
     value: str
+    caseSensitive: Optional[bool] = None
+
+class NumericValue(BaseModel):
+    int64Value: Optional[str] = None
+    doubleValue: Optional[float] = None
+
+class NumericFilter(BaseModel):
+    operation: str = Field(default="EQUAL")  # LESS_THAN, GREATER_THAN_OR_EQUAL, etc.
+    value: NumericValue
 
 class Filter(BaseModel):
     fieldName: str
     stringFilter: Optional[StringFilter] = None
+    numericFilter: Optional[NumericFilter] = None
 
 class FilterExpression(BaseModel):
     filter: Optional[Filter] = None
@@ -37,9 +47,36 @@ class RunReportRequest(BaseModel):
     orderBys: Optional[List[OrderBy]] = None
     dimensionFilter: Optional[FilterExpression] = None
     metricFilter: Optional[FilterExpression] = None
+    returnPropertyQuota: Optional[bool] = None
 
 class RealtimeReportRequest(BaseModel):
     dimensions: List[Dimension]
     metrics: List[Metric]
     limit: Optional[int] = None
     orderBys: Optional[List[OrderBy]] = None
+    returnPropertyQuota: Optional[bool] = None
+
+class Pivot(BaseModel):
+    fieldNames: List[str]
+    limit: int
+    offset: Optional[int] = None
+    orderBys: Optional[List[OrderBy]] = None
+    metricAggregations: Optional[List[str]] = None  # TOTAL, MINIMUM, MAXIMUM, COUNT
+
+class RunPivotReportRequest(BaseModel):
+    dimensions: List[Dimension]
+    metrics: List[Metric]
+    pivots: List[Pivot]
+    dateRanges: Optional[List[DateRange]] = None
+    dimensionFilter: Optional[FilterExpression] = None
+    metricFilter: Optional[FilterExpression] = None
+    currencyCode: Optional[str] = None
+    keepEmptyRows: Optional[bool] = None
+    returnPropertyQuota: Optional[bool] = None
+
+class CheckCompatibilityRequest(BaseModel):
+    dimensions: Optional[List[Dimension]] = None
+    metrics: Optional[List[Metric]] = None
+    dimensionFilter: Optional[FilterExpression] = None
+    metricFilter: Optional[FilterExpression] = None
+    compatibilityFilter: Optional[str] = None  # COMPATIBLE or INCOMPATIBLE
@@ -18,6 +18,18 @@ class Metadata(BaseModel):
     dimensions: Optional[list] = None
     metrics: Optional[list] = None
 
+class QuotaStatus(BaseModel):
+    consumed: Optional[int] = None
+    remaining: Optional[int] = None
+
+class PropertyQuota(BaseModel):
+    tokensPerDay: Optional[QuotaStatus] = None
+    tokensPerHour: Optional[QuotaStatus] = None
+    concurrentRequests: Optional[QuotaStatus] = None
+    serverErrorsPerProjectPerHour: Optional[QuotaStatus] = None
+    potentiallyThresholdedRequestsPerHour: Optional[QuotaStatus] = None
+    tokensPerProjectPerHour: Optional[QuotaStatus] = None
+
 class RunReportResponse(BaseModel):
     dimensionHeaders: List[DimensionHeader]
     metricHeaders: List[MetricHeader]
@@ -25,9 +37,79 @@ class RunReportResponse(BaseModel):
     totals: Optional[List[Row]] = None
     metadata: Optional[Metadata] = None
     rowCount: Optional[int] = None
+    propertyQuota: Optional[PropertyQuota] = None
 
 class RealtimeReportResponse(BaseModel):
     dimensionHeaders: List[DimensionHeader]
     metricHeaders: List[MetricHeader]
     rows: List[Row] = []
     totals: Optional[List[Row]] = None
+    rowCount: Optional[int] = None
+    propertyQuota: Optional[PropertyQuota] = None
+
+class BatchRunReportsResponse(BaseModel):
+    reports: List[RunReportResponse] = []
+    kind: Optional[str] = None
+
+class DimensionMetadata(BaseModel):
+    apiName: str
+    uiName: Optional[str] = None
+    description: Optional[str] = None
+    deprecatedApiNames: List[str] = []
+    customDefinition: Optional[bool] = None
+    category: Optional[str] = None
+
+class MetricMetadata(BaseModel):
+    apiName: str
+    uiName: Optional[str] = None
+    description: Optional[str] = None
+    deprecatedApiNames: List[str] = []
+    type: Optional[str] = None
+    expression: Optional[str] = None
+    customDefinition: Optional[bool] = None
+    blockedReasons: List[str] = []
+    category: Optional[str] = None
+
+class PropertyMetadata(BaseModel):
+    name: Optional[str] = None
+    dimensions: List[DimensionMetadata] = []
+    metrics: List[MetricMetadata] = []
+
+class PivotDimensionHeader(BaseModel):
+    dimensionValues: List[dict] = []
+
+class PivotHeader(BaseModel):
+    pivotDimensionHeaders: List[PivotDimensionHeader] = []
+    rowCount: Optional[int] = None
+
+class RunPivotReportResponse(BaseModel):
+    pivotHeaders: List[PivotHeader] = []
+    dimensionHeaders: List[DimensionHeader] = []
+    metricHeaders: List[MetricHeader] = []
+    rows: List[Row] = []
+    aggregates: Optional[List[Row]] = None
+    metadata: Optional[Metadata] = None
+    propertyQuota: Optional[PropertyQuota] = None
+    kind: Optional[str] = None
+
+class BatchRunPivotReportsResponse(BaseModel):
+    pivotReports: List[RunPivotReportResponse] = []
+    kind: Optional[str] = None
+
+class DimensionCompatibility(BaseModel):
+    dimensionMetadata: Optional[DimensionMetadata] = None
+    compatibility: Optional[str] = None
+
+class MetricCompatibility(BaseModel):
+    metricMetadata: Optional[MetricMetadata] = None
+    compatibility: Optional[str] = None
+
+class CheckCompatibilityResponse(BaseModel):
+    dimensionCompatibilities: List[DimensionCompatibility] = []
+    metricCompatibilities: List[MetricCompatibility] = []
+
+    def incompatible(self) -> List[str]:
+        """API names of the dimensions and metrics GA reported as ``INCOMPATIBLE``."""
+        dims = [c.dimensionMetadata.apiName for c in self.dimensionCompatibilities if c.compatibility == "INCOMPATIBLE" and c.dimensionMetadata]
+        mets = [c.metricMetadata.apiName for c in self.metricCompatibilities if c.compatibility == "INCOMPATIBLE" and c.metricMetadata]
+        return dims + mets
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-from typing import Optional
-from fastapi import Depends, Header, HTTPException, status
+from typing import Iterator, Optional
+
+try:  # optional dependency: pip install "dealscale-ga4-sdk[fastapi]"
+    from fastapi import Depends, Header, HTTPException, status
+except Exception as e:  # pragma: no cover
+    raise ImportError("fastapi is required for google_analytics.api.deps") from e
 
 from ..client import GA4Client
 from ..config import SCOPE_ANALYTICS_READONLY
+from ..pool import ClientPool
+
+# Clients (and their keep-alive connections) reused across requests, keyed by token
+CLIENT_POOL = ClientPool()
+
 
+def get_client(authorization: Optional[str] = Header(None)) -> Iterator[GA4Client]:
+    """Yield the pooled GA4Client for the Bearer token in the Authorization header.
 
-def get_client(authorization: Optional[str] = Header(None)) -> GA4Client:
-    """Create a GA4Client from a Bearer token in the Authorization header.
+    The client is leased for the request, so the pool never closes it mid-request.
 
     Expect header: "Authorization: Bearer <token>"
     """
@@ -20,13 +30,17 @@ def get_client(authorization: Optional[str] = Header(None)) -> GA4Client:
     token = parts[1]
     if not token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Empty bearer token")
-    return GA4Client(access_token=token)
+    with CLIENT_POOL.lease(token) as client:
+        yield client
 
 
 # Optional utility: service-account client via settings/env (not used as default dependency)
 class ServiceAccountProvider:
     def __init__(self, key_path: Optional[str] = None) -> None:
         self.key_path = key_path
+        self._client: Optional[GA4Client] = None
 
     def __call__(self) -> GA4Client:
-        return GA4Client.from_service_account(key_path=self.key_path, scopes=[SCOPE_ANALYTICS_READONLY])
+        if self._client is None:
+            self._client = GA4Client.from_service_account(key_path=self.key_path, scopes=[SCOPE_ANALYTICS_READONLY])
+        return self._client
@@ -0,0 +1,358 @@
+"""Asyncio GA4 Data API client on top of httpx."""
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Optional
+
+from .config import BASE_URL, HTTP_SETTINGS
+from . import _codec
+from .client import (
+    MAX_BATCH_SIZE,
+    ReportT,
+    RetryPolicy,
+    T,
+    _chunked,
+    _compatibility_problems,
+    _compatibility_request,
+    _construct,
+    _encode,
+    _encode_batch,
+    _metadata_url,
+    _observing,
+    _parse_batch,
+    _record_attempt,
+    _upstream_failed,
+    _Verdicts,
+)
+from .hooks import Hooks, RequestEvent, current_event, endpoint_of
+from .auth import TokenProvider
+from .cache import cache_key
+from .metadata import MetadataService
+from .ratelimit import QuotaScheduler
+from .resilience import CircuitBreaker, HedgePolicy
+from .realtime import RealtimeDiff, stream_realtime
+from .singleflight import AsyncSingleFlight
+from .transport import _installed, accept_encoding
+from .api._exceptions import AuthError, RequestValidationError
+from .api._requests import CheckCompatibilityRequest, RunPivotReportRequest, RunReportRequest, RealtimeReportRequest
+from .api._responses import (
+    BatchRunPivotReportsResponse,
+    BatchRunReportsResponse,
+    CheckCompatibilityResponse,
+    RunPivotReportResponse,
+    RunReportResponse,
+    RealtimeReportResponse,
+)
+
+try:  # optional dependency: pip install "dealscale-ga4-sdk[async]"
+    import httpx
+except Exception:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .columnar import ColumnarReport
+
+
+class AsyncGA4Client:
+    """Async counterpart of ``GA4Client``.
+
+    One ``httpx.AsyncClient`` (and so one keep-alive pool) serves every call made
+    through this instance; pass ``http_client`` to share a pool between several
+    clients, e.g. one per bearer token. In-flight requests are capped per
+    property by ``max_concurrency_per_property``. ``http2=True`` multiplexes
+    those requests over one connection per host (``http2`` extra).
+    With a ``metadata`` service (e.g. one shared with a ``GA4Client``) report
+    and pivot requests are checked locally first, as with ``check_fields``.
+    """
+
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        *,
+        credentials: Optional[TokenProvider] = None,
+        timeout: Optional[int] = None,
+        user_agent: Optional[str] = None,
+        max_connections: int = 100,
+        max_concurrency_per_property: int = 10,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        validate: bool = True,
+        rate_limiter: Optional[QuotaScheduler] = None,
+        metadata: Optional[MetadataService] = None,
+        coalesce: bool = False,
+        hooks: Optional[Hooks] = None,
+        base_url: Optional[str] = None,
+        http2: bool = False,
+        hedge: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        if httpx is None:  # pragma: no cover
+            raise ImportError("httpx is required for AsyncGA4Client")
+        if access_token is None and credentials is None:
+            raise AuthError("AsyncGA4Client needs an access_token or a credentials provider")
+        self._access_token = access_token
+        self._credentials = credentials
+        self._validate = validate
+        self._rate_limiter = rate_limiter
+        self._metadata = metadata
+        self._flight = AsyncSingleFlight() if coalesce else None
+        self._compatibility = _Verdicts()
+        self._hooks = hooks
+        self._hedge = hedge
+        self._breaker = circuit_breaker
+        self._base_url = (base_url or BASE_URL).rstrip("/")
+        self._timeout = timeout or HTTP_SETTINGS.timeout
+        self._user_agent = user_agent or HTTP_SETTINGS.user_agent
+        self._headers = {
+            "Accept": "application/json",
+            "Accept-Encoding": accept_encoding("httpx"),
+            "Content-Type": "application/json",
+            "User-Agent": self._user_agent,
+        }
+        if credentials is None:
+            self._headers["Authorization"] = f"Bearer {self._access_token}"
+        self._owns_http = http_client is None
+        if http2 and http_client is None and not _installed("h2"):
+            raise ImportError('h2 is required for HTTP/2: pip install "dealscale-ga4-sdk[http2]"')
+        self._http = http_client or httpx.AsyncClient(
+            http2=http2,
+            timeout=self._timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+        self._max_per_property = max_concurrency_per_property
+        self._property_slots: Dict[str, asyncio.Semaphore] = {}
+
+    async def aclose(self) -> None:
+        if self._owns_http:
+            await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncGA4Client":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def _request_headers(self) -> Dict[str, str]:
+        if self._credentials is None:
+            return self._headers
+        token = self._credentials.cached_token()
+        if token is None:  # background refresher is behind: refresh off the event loop
+            token = await asyncio.to_thread(self._credentials.token)
+        return {**self._headers, "Authorization": f"Bearer {token}"}
+
+    def _slot(self, property_id: str | int) -> asyncio.Semaphore:
+        key = str(property_id)
+        slot = self._property_slots.get(key)
+        if slot is None:
+            slot = self._property_slots[key] = asyncio.Semaphore(self._max_per_property)
+        return slot
+
+    # ----- Low-level HTTP with retries -----
+    async def _request_raw(
+        self,
+        method: str,
+        url: str,
+        *,
+        property_id: str | int,
+        body: Optional[bytes] = None,
+        priority: int = 0,
+    ) -> bytes:
+        retry = RetryPolicy()
+        limiter = self._rate_limiter
+        event = current_event() if self._hooks is not None else None
+        endpoint = endpoint_of(url)
+        reauthed = False
+        while True:
+            probe = self._breaker.before(endpoint) if self._breaker is not None else None
+            sent_with = self._credentials.cached_token() if self._credentials is not None else None
+            try:
+                queued = time.perf_counter()
+                async with self._slot(property_id):
+                    async with limiter.acquire_async(property_id, priority=priority) if limiter else nullcontext():
+                        sent = time.perf_counter()
+                        resp = await self._send(method, url, body, endpoint, event, property_id)
+            finally:
+                # cancelled or failed before sending: hand the half-open probe slot back
+                if probe is not None:
+                    self._breaker.release(endpoint, probe)  # type: ignore[union-attr]
+            if event is not None:
+                _record_attempt(event, resp, body, queued, sent)
+            if 200 <= resp.status_code < 300:
+                return resp.content
+            if resp.status_code == 401 and self._credentials is not None and not reauthed:
+                # Token revoked or expired early: refresh once (unless a concurrent 401 already did),
+                # then let RetryPolicy map a second 401.
+                await asyncio.to_thread(self._credentials.refresh, force=True, stale=sent_with)
+                reauthed = True
+                continue
+            delay = retry.next_delay(resp)
+            if limiter and resp.status_code == 429:
+                limiter.pause(property_id, delay)
+            if self._breaker is not None:
+                self._breaker.check(endpoint)
+            if event is not None:
+                event.add_span("retry_sleep", delay)
+            await asyncio.sleep(delay)
+
+    async def _send(
+        self, method: str, url: str, body: Optional[bytes], endpoint: str, event: Optional[RequestEvent], property_id: str | int
+    ) -> Any:
+        async def send() -> Any:
+            return await self._http.request(method, url, content=body, headers=await self._request_headers(), timeout=self._timeout)
+
+        slot, limiter = self._slot(property_id), self._rate_limiter
+
+        async def admit() -> bool:
+            # the duplicate needs its own property slot and (charged) permit, without waiting for them
+            if slot.locked():
+                return False
+            await slot.acquire()
+            if limiter is not None and not limiter.try_acquire(property_id):
+                slot.release()
+                return False
+            return True
+
+        def release() -> None:
+            slot.release()
+            if limiter is not None:
+                limiter.release(property_id)
+
+        try:
+            if self._hedge is None:
+                resp = await send()
+            else:
+                resp, hedged = await self._hedge.arun(endpoint, send, admit=admit, release=release)
+                if hedged and event is not None:
+                    event.hedges += 1
+        except Exception:
+            if self._breaker is not None:
+                self._breaker.record(endpoint, False)
+            raise
+        if self._breaker is not None and resp.status_code != 429:
+            self._breaker.record(endpoint, not _upstream_failed(resp.status_code))
+        return resp
+
+    async def _call(
+        self,
+        method: str,
+        url: str,
+        property_id: str | int,
+        body: Optional[bytes],
+        parse: Callable[[bytes], T],
+        priority: int = 0,
+    ) -> T:
+        async def fetch() -> bytes:
+            return await self._request_raw(method, url, property_id=property_id, body=body, priority=priority)
+
+        if self._rate_limiter is not None:
+            parse = _observing(self._rate_limiter, property_id, parse)
+        if self._hooks is None:
+            return parse(await fetch())
+        return await self._hooks.atrace(method, url, property_id, fetch, parse)
+
+    async def _check_fields(self, property_id: str | int, req: RunReportRequest | RunPivotReportRequest) -> None:
+        if self._metadata is not None:
+            # a metadata miss is fetched synchronously: keep it off the event loop
+            await asyncio.to_thread(self._metadata.validate, property_id, req)
+
+    def _parse(self, model: type[ReportT], raw: bytes) -> ReportT:
+        if self._validate:
+            return model.model_validate_json(raw)
+        return _construct(model, _codec.loads(raw))
+
+    # ----- High-level API methods -----
+    async def run_report(self, property_id: str | int, req: RunReportRequest, *, priority: int = 0) -> RunReportResponse:
+        """``priority`` orders this call among those queued on a shared ``rate_limiter`` (lower first)."""
+        await self._check_fields(property_id, req)
+        url = f"{self._base_url}/properties/{property_id}:runReport"
+
+        async def call() -> RunReportResponse:
+            return await self._call("POST", url, property_id, _encode(req), lambda raw: self._parse(RunReportResponse, raw), priority)
+
+        if self._flight is not None:
+            return await self._flight.do(cache_key(property_id, req), call)
+        return await call()
+
+    async def run_report_columnar(self, property_id: str | int, req: RunReportRequest, *, priority: int = 0) -> ColumnarReport:
+        from .columnar import ColumnarReport
+
+        await self._check_fields(property_id, req)
+        url = f"{self._base_url}/properties/{property_id}:runReport"
+        return await self._call("POST", url, property_id, _encode(req), lambda raw: ColumnarReport.from_json(_codec.loads(raw)), priority)
+
+    async def run_realtime_report(self, property_id: str | int, req: RealtimeReportRequest, *, priority: int = 0) -> RealtimeReportResponse:
+        url = f"{self._base_url}/properties/{property_id}:runRealtimeReport"
+
+        async def call() -> RealtimeReportResponse:
+            return await self._call("POST", url, property_id, _encode(req), lambda raw: self._parse(RealtimeReportResponse, raw), priority)
+
+        if self._flight is not None:
+            return await self._flight.do("realtime:" + cache_key(property_id, req), call)
+        return await call()
+
+    def stream_realtime(
+        self,
+        property_id: str | int,
+        req: RealtimeReportRequest,
+        *,
+        interval: float = 5.0,
+        max_interval: float = 60.0,
+    ) -> AsyncIterator[RealtimeDiff]:
+        """Adaptive realtime poll yielding only added/changed/removed rows (see ``realtime.stream_realtime``)."""
+        return stream_realtime(self, property_id, req, interval=interval, max_interval=max_interval)
+
+    async def get_metadata(self, property_id: str | int) -> Dict[str, Any]:
+        return await self._call("GET", _metadata_url(self._base_url, property_id), property_id, None, lambda raw: _codec.loads(raw) if raw else {})
+
+    async def batch_run_reports(
+        self, property_id: str | int, requests_list: list[RunReportRequest], *, priority: int = 0
+    ) -> list[RunReportResponse]:
+        url = f"{self._base_url}/properties/{property_id}:batchRunReports"
+
+        def parse(raw: bytes) -> list[RunReportResponse]:
+            return _parse_batch(raw, self._validate, RunReportResponse, BatchRunReportsResponse, "reports")
+
+        return await self._run_batches(url, property_id, requests_list, parse, priority)
+
+    async def _run_batches(
+        self, url: str, property_id: str | int, requests_list: list[Any], parse: Callable[[bytes], list[T]], priority: int = 0
+    ) -> list[T]:
+        chunks = _chunked(requests_list, MAX_BATCH_SIZE)
+        parts = await asyncio.gather(*(self._call("POST", url, property_id, _encode_batch(c), parse, priority) for c in chunks))
+        return [resp for part in parts for resp in part]
+
+    async def run_pivot_report(self, property_id: str | int, req: RunPivotReportRequest, *, priority: int = 0) -> RunPivotReportResponse:
+        await self._check_fields(property_id, req)
+        url = f"{self._base_url}/properties/{property_id}:runPivotReport"
+        return await self._call("POST", url, property_id, _encode(req), lambda raw: self._parse(RunPivotReportResponse, raw), priority)
+
+    async def batch_run_pivot_reports(
+        self, property_id: str | int, requests_list: list[RunPivotReportRequest], *, priority: int = 0
+    ) -> list[RunPivotReportResponse]:
+        for req in requests_list:
+            await self._check_fields(property_id, req)
+        url = f"{self._base_url}/properties/{property_id}:batchRunPivotReports"
+
+        def parse(raw: bytes) -> list[RunPivotReportResponse]:
+            return _parse_batch(raw, self._validate, RunPivotReportResponse, BatchRunPivotReportsResponse, "pivotReports")
+
+        return await self._run_batches(url, property_id, requests_list, parse, priority)
+
+    async def check_compatibility(
+        self,
+        property_id: str | int,
+        req: CheckCompatibilityRequest | RunReportRequest | RunPivotReportRequest,
+    ) -> CheckCompatibilityResponse:
+        url = f"{self._base_url}/properties/{property_id}:checkCompatibility"
+        body = _encode(_compatibility_request(req))
+        return await self._call("POST", url, property_id, body, CheckCompatibilityResponse.model_validate_json)
+
+    async def ensure_compatible(self, property_id: str | int, req: CheckCompatibilityRequest | RunReportRequest | RunPivotReportRequest) -> None:
+        compat = _compatibility_request(req)
+        key = cache_key(property_id, compat)
+        problems = self._compatibility.get(key)
+        if problems is None:
+            problems = self._compatibility.set(key, _compatibility_problems(await self.check_compatibility(property_id, compat)))
+        if problems:
+            raise RequestValidationError(problems)
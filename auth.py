@@ -0,0 +1,137 @@
+"""Process-wide OAuth token providers.
+
+A ``TokenProvider`` wraps google-auth credentials, hands out the cached access
+token, and refreshes it on a background thread ``refresh_margin`` seconds
+before it expires, so request paths never wait on a token round-trip. Clients
+that share a provider (see ``shared_service_account``) share one token; the
+refresh thread stops when the last of them calls ``close``.
+"""
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import requests
+
+from .config import OAUTH_SETTINGS, SCOPE_ANALYTICS_READONLY
+from .api._exceptions import AuthError
+
+
+def _google_request() -> Any:
+    try:
+        from google.auth.transport.requests import Request as GoogleAuthRequest  # type: ignore
+    except Exception as e:  # pragma: no cover
+        raise AuthError("google-auth is required for token refresh") from e
+    return GoogleAuthRequest()
+
+
+class TokenProvider:
+    def __init__(self, credentials: Any, *, refresh_margin: float = 300.0, background: bool = True) -> None:
+        self._credentials = credentials
+        self.refresh_margin = refresh_margin
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._users = 1
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._thread = threading.Thread(target=self._refresh_loop, name="ga4-token-refresh", daemon=True)
+            self._thread.start()
+
+    def _seconds_left(self) -> float:
+        expiry = getattr(self._credentials, "expiry", None)
+        if not getattr(self._credentials, "token", None):
+            return 0.0
+        if expiry is None:
+            return float("inf")
+        now = datetime.now(timezone.utc).replace(tzinfo=None)  # google-auth uses naive UTC
+        return (expiry - now).total_seconds()
+
+    def refresh(self, *, force: bool = False, stale: Optional[str] = None) -> None:
+        """``stale`` is the token a request was rejected with; if it has already been replaced, do nothing."""
+        with self._lock:
+            if stale is not None and self._credentials.token != stale:
+                return
+            if not force and self._seconds_left() > self.refresh_margin:
+                return
+            try:
+                self._credentials.refresh(_google_request())
+            except AuthError:
+                raise
+            except Exception as e:
+                raise AuthError(f"Failed to refresh token: {e}") from e
+
+    def cached_token(self) -> Optional[str]:
+        """The current token if it is outside the refresh margin, without ever blocking on a refresh."""
+        if self._seconds_left() <= self.refresh_margin:
+            return None
+        return self._credentials.token
+
+    def token(self) -> str:
+        if self._seconds_left() <= self.refresh_margin:
+            self.refresh()
+        return self._credentials.token
+
+    def _refresh_loop(self) -> None:
+        while not self._closed.is_set():
+            wait = self._seconds_left() - self.refresh_margin
+            if wait > 0 and self._closed.wait(min(wait, 3600.0)):
+                return
+            try:
+                self.refresh()
+            except AuthError:
+                # Request paths retry synchronously; don't spin on a broken key.
+                if self._closed.wait(30.0):
+                    return
+
+    def close(self) -> None:
+        with _shared_lock:
+            self._users -= 1
+            if self._users > 0:
+                return
+            for key in [k for k, v in _shared.items() if v is self]:
+                del _shared[key]
+        self._closed.set()
+
+
+class BearerAuth(requests.auth.AuthBase):
+    """requests auth hook that stamps the provider's current token on every request."""
+
+    def __init__(self, provider: TokenProvider) -> None:
+        self.provider = provider
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        r.headers["Authorization"] = f"Bearer {self.provider.token()}"
+        return r
+
+
+_shared: Dict[Tuple[str, Tuple[str, ...]], TokenProvider] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_service_account(
+    *,
+    key_path: Optional[str] = None,
+    scopes: Optional[Iterable[str]] = None,
+) -> TokenProvider:
+    """Process-wide provider per (key file, scopes); the key is read and a token minted only once.
+
+    Every call registers a user of the provider: call ``close`` when done with it.
+    """
+    scopes_key = tuple(sorted(scopes)) if scopes else (SCOPE_ANALYTICS_READONLY,)
+    key_path = key_path or OAUTH_SETTINGS.service_account_key_path
+    with _shared_lock:
+        provider = _shared.get((key_path, scopes_key))
+        if provider is not None:
+            provider._users += 1
+        else:
+            try:
+                from google.oauth2 import service_account  # type: ignore
+            except Exception as e:  # pragma: no cover
+                raise AuthError("google-auth is required for service account flow") from e
+            creds = service_account.Credentials.from_service_account_file(key_path, scopes=list(scopes_key))  # type: ignore
+            provider = TokenProvider(creds)
+            # Not forced: whichever of this call and the background thread gets the lock first mints it.
+            provider.refresh()
+            _shared[(key_path, scopes_key)] = provider
+        return provider
@@ -0,0 +1 @@
+# Benchmark harness and local GA4 Data API stand-in (not part of the runtime SDK)
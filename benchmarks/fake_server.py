@@ -0,0 +1,211 @@
+"""Local stand-in for the Analytics Data API used by the benchmarks.
+
+Serves synthetic ``runReport``, ``batchRunReports``, ``runRealtimeReport`` and
+``metadata`` responses over HTTP/1.1 keep-alive, gzip-compressed when the
+client accepts it. Reports have ``rows`` rows in
+total and honour ``limit``/``offset``, so pagination behaves like GA. Latency
+and 429/5xx errors can be injected.
+
+Run standalone with ``python -m google_analytics.benchmarks.fake_server``.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+_PATH = re.compile(r"^/v1(?:beta)?/properties/(?P<prop>[^/:]+)(?::(?P<verb>\w+)|/(?P<meta>metadata))$")
+
+
+@dataclass
+class FakeServerConfig:
+    rows: int = 10_000
+    latency_ms: float = 0.0
+    error_rate_429: float = 0.0
+    error_rate_5xx: float = 0.0
+    retry_after: float = 0.01
+    seed: int = 0
+    compress: bool = True
+
+
+def _metric_type(name: str) -> str:
+    return "TYPE_FLOAT" if "rate" in name.lower() or name.lower().startswith("average") else "TYPE_INTEGER"
+
+
+@lru_cache(maxsize=256)
+def _gzip(payload: bytes) -> bytes:
+    return gzip.compress(payload, compresslevel=5)
+
+
+@lru_cache(maxsize=256)
+def _report_bytes(dims: Tuple[str, ...], mets: Tuple[str, ...], offset: int, limit: int, total: int) -> bytes:
+    rows: List[Dict[str, Any]] = []
+    types = [_metric_type(m) for m in mets]
+    for i in range(offset, min(offset + limit, total)):
+        rows.append(
+            {
+                "dimensionValues": [{"value": f"{d}-{i % 997}-{i}"} for d in dims],
+                "metricValues": [
+                    {"value": str(i % 1000 + j) if t == "TYPE_INTEGER" else f"{(i % 100) / 100:.4f}"}
+                    for j, t in enumerate(types)
+                ],
+            }
+        )
+    return json.dumps(
+        {
+            "dimensionHeaders": [{"name": d} for d in dims],
+            "metricHeaders": [{"name": m, "type": t} for m, t in zip(mets, types)],
+            "rows": rows,
+            "rowCount": total,
+            "metadata": {"currencyCode": "USD", "timeZone": "Etc/UTC"},
+            "kind": "analyticsData#runReport",
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _report(body: Dict[str, Any], total: int, cap: int = 250_000) -> bytes:
+    dims = tuple(d["name"] for d in body.get("dimensions", []))
+    mets = tuple(m["name"] for m in body.get("metrics", []))
+    limit = min(int(body.get("limit") or 10_000), cap)
+    return _report_bytes(dims, mets, int(body.get("offset") or 0), limit, total)
+
+
+class FakeAnalyticsServer:
+    def __init__(self, config: Optional[FakeServerConfig] = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or FakeServerConfig()
+        self.requests = 0
+        self.errors = 0
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "FakeAnalyticsServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="ga4-fake-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeAnalyticsServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def _inject(self) -> Optional[Tuple[int, Dict[str, str]]]:
+        cfg = self.config
+        with self._lock:
+            self.requests += 1
+            roll = self._rng.random()
+            if roll < cfg.error_rate_429:
+                self.errors += 1
+                return 429, {"Retry-After": str(cfg.retry_after)}
+            if roll < cfg.error_rate_429 + cfg.error_rate_5xx:
+                self.errors += 1
+                return 503, {}
+        return None
+
+    def _handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def _send(self, status: int, payload: bytes, headers: Optional[Dict[str, str]] = None) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                if server.config.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    payload = _gzip(payload)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(payload)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _dispatch(self, body: Dict[str, Any]) -> None:
+                if server.config.latency_ms:
+                    time.sleep(server.config.latency_ms / 1000.0)
+                match = _PATH.match(self.path)
+                if not match:
+                    self._send(404, b'{"error":{"code":404,"message":"not found","status":"NOT_FOUND"}}')
+                    return
+                failure = server._inject()
+                if failure is not None:
+                    status, headers = failure
+                    err = {"error": {"code": status, "message": "injected", "status": "RESOURCE_EXHAUSTED" if status == 429 else "UNAVAILABLE"}}
+                    self._send(status, json.dumps(err).encode(), headers)
+                    return
+
+                total = server.config.rows
+                verb = match.group("verb")
+                if match.group("meta"):
+                    meta = {
+                        "name": f"properties/{match.group('prop')}/metadata",
+                        "dimensions": [{"apiName": n} for n in ("date", "pagePath", "country", "eventName")],
+                        "metrics": [{"apiName": n, "type": _metric_type(n)} for n in ("activeUsers", "screenPageViews", "engagementRate")],
+                    }
+                    self._send(200, json.dumps(meta).encode())
+                elif verb == "runReport":
+                    self._send(200, _report(body, total))
+                elif verb == "runRealtimeReport":
+                    self._send(200, _report(body, min(total, 1000)))
+                elif verb == "batchRunReports":
+                    reports = [_report(r, total) for r in body.get("requests", [])]
+                    self._send(200, b'{"reports":[' + b",".join(reports) + b'],"kind":"analyticsData#batchRunReports"}')
+                else:
+                    self._send(404, b'{"error":{"code":404,"message":"unknown method","status":"NOT_FOUND"}}')
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b"{}"
+                self._dispatch(json.loads(raw or b"{}"))
+
+            def do_GET(self) -> None:
+                self._dispatch({})
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local GA4 Data API stand-in")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate-429", type=float, default=0.0)
+    parser.add_argument("--error-rate-5xx", type=float, default=0.0)
+    parser.add_argument("--no-compress", action="store_true", help="never gzip responses")
+    args = parser.parse_args()
+    cfg = FakeServerConfig(args.rows, args.latency_ms, args.error_rate_429, args.error_rate_5xx, compress=not args.no_compress)
+    server = FakeAnalyticsServer(cfg, port=args.port).start()
+    print(f"Serving fake GA4 Data API at {server.base_url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
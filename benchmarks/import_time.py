@@ -0,0 +1,83 @@
+"""Cold-start import cost of the SDK.
+
+Every sample is a fresh interpreter, so nothing is warm in ``sys.modules``;
+the reported figure is the time spent in the import statement itself
+(interpreter startup excluded). Also lists heavy optional dependencies that
+leaked into the import, which is what usually regresses.
+
+    python -m google_analytics.benchmarks.import_time
+    python -m google_analytics.benchmarks.import_time --runs 20 --max-ms 150 --json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+PACKAGE = (__spec__.name if __spec__ else __name__).rsplit(".", 2)[0]
+
+# label -> statement timed in a fresh interpreter
+TARGETS: Dict[str, str] = {
+    "package": f"import {PACKAGE}",
+    "GA4Client": f"from {PACKAGE} import GA4Client",
+    "AsyncGA4Client": f"from {PACKAGE} import AsyncGA4Client",
+    "columnar": f"from {PACKAGE}.columnar import ColumnarReport",
+}
+# modules a plain GA4Client job should never pay for
+HEAVY = ("fastapi", "starlette", "numpy", "pyarrow", "pandas", "polars", "httpx")
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+{stmt}
+elapsed = time.perf_counter() - t0
+heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+print(json.dumps({{"ms": elapsed * 1000.0, "modules": len(sys.modules), "heavy": heavy}}))
+"""
+
+
+def probe(stmt: str) -> Dict[str, Any]:
+    code = _PROBE.format(stmt=stmt, heavy=HEAVY)
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def measure(label: str, stmt: str, runs: int) -> Dict[str, Any]:
+    samples = [probe(stmt) for _ in range(runs)]
+    ms = [s["ms"] for s in samples]
+    return {
+        "target": label,
+        "min_ms": min(ms),
+        "median_ms": statistics.median(ms),
+        "modules": samples[-1]["modules"],
+        "heavy": samples[-1]["heavy"],
+    }
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure cold import time of the GA4 SDK")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--targets", default=",".join(TARGETS), help=f"comma separated subset of {', '.join(TARGETS)}")
+    parser.add_argument("--max-ms", type=float, help="exit non-zero if the GA4Client median exceeds this")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args(argv)
+
+    results = [measure(t, TARGETS[t], args.runs) for t in args.targets.split(",") if t]
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'target':>16}  {'min ms':>8}  {'median ms':>9}  {'modules':>7}  heavy deps loaded")
+        for r in results:
+            heavy = ", ".join(r["heavy"]) or "-"
+            print(f"{r['target']:>16}  {r['min_ms']:8.1f}  {r['median_ms']:9.1f}  {r['modules']:7d}  {heavy}")
+
+    client = next((r for r in results if r["target"] == "GA4Client"), None)
+    if args.max_ms is not None and client is not None and client["median_ms"] > args.max_ms:
+        sys.exit(f"GA4Client import took {client['median_ms']:.1f} ms (budget {args.max_ms:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
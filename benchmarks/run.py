@@ -0,0 +1,160 @@
+"""Benchmark the GA4 clients against the local stand-in server.
+
+Each mode pages through one synthetic report and reports throughput
+(requests/s, rows/s), parse cost per row (from the ``parse`` hook span), peak
+RSS and retry overhead (share of wall time spent in backoff). Modes run in
+separate processes so peak RSS is per mode.
+
+    python -m google_analytics.benchmarks.run --rows 200000 --page-size 10000
+    python -m google_analytics.benchmarks.run --error-rate-429 0.05 --json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+from ..api._requests import DateRange, Dimension, Metric, RunReportRequest
+from ..hooks import Hooks, RequestEvent
+from .fake_server import FakeAnalyticsServer, FakeServerConfig, _gzip, _report
+
+MODES = ("sync", "sync-raw", "columnar", "async")
+PROPERTY_ID = "123"
+
+
+def _request() -> RunReportRequest:
+    return RunReportRequest(
+        dateRanges=[DateRange(startDate="2024-01-01", endDate="2024-01-31")],
+        dimensions=[Dimension(name="date"), Dimension(name="pagePath"), Dimension(name="country")],
+        metrics=[Metric(name="activeUsers"), Metric(name="screenPageViews"), Metric(name="engagementRate")],
+    )
+
+
+def _collector() -> tuple[Hooks, List[RequestEvent]]:
+    hooks, events = Hooks(), []
+    hooks.on_response(events.append)
+    return hooks, events
+
+
+def _pages(req: RunReportRequest, rows: int, page_size: int) -> List[RunReportRequest]:
+    return [req.model_copy(update={"offset": at, "limit": page_size}) for at in range(0, rows, page_size)]
+
+
+def _run_mode(
+    mode: str, base_url: str, rows: int, page_size: int, concurrency: int, transport: str = "requests"
+) -> Dict[str, Any]:
+    from ..client import GA4Client
+
+    hooks, events = _collector()
+    req = _request()
+    seen = 0
+    began = time.perf_counter()
+    if mode in ("sync", "sync-raw", "columnar"):
+        client = GA4Client("bench", base_url=base_url, hooks=hooks, validate=mode != "sync-raw", transport=transport)
+        try:
+            if mode == "columnar":
+                for page_req in _pages(req, rows, page_size):
+                    seen += len(client.run_report_columnar(PROPERTY_ID, page_req))
+            else:
+                for page in client.iter_report_pages(PROPERTY_ID, req, page_size=page_size):
+                    seen += len(page.rows)
+        finally:
+            client.close()
+    elif mode == "async":
+        from ..async_client import AsyncGA4Client
+
+        async def main() -> int:
+            async with AsyncGA4Client(
+                "bench", base_url=base_url, hooks=hooks, max_concurrency_per_property=concurrency
+            ) as client:
+                pages = await asyncio.gather(*(client.run_report(PROPERTY_ID, r) for r in _pages(req, rows, page_size)))
+            return sum(len(p.rows) for p in pages)
+
+        seen = asyncio.run(main())
+    else:
+        raise ValueError(f"unknown mode {mode!r}")
+    elapsed = time.perf_counter() - began
+
+    busy = sum(e.duration for e in events) or 1e-9
+    parse = sum(e.spans.get("parse", 0.0) for e in events)
+    backoff = sum(e.spans.get("retry_sleep", 0.0) for e in events)
+    return {
+        "mode": mode,
+        "rows": seen,
+        "requests": len(events),
+        "seconds": elapsed,
+        "requests_per_s": len(events) / elapsed,
+        "rows_per_s": seen / elapsed,
+        "parse_us_per_row": parse / max(seen, 1) * 1e6,
+        "wire_mb": sum(e.bytes_in for e in events) / 1e6,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,
+        "retries": sum(e.retries for e in events),
+        "retry_sleep_share": backoff / busy,
+    }
+
+
+def _spawn(mode: str, base_url: str, args: argparse.Namespace) -> Dict[str, Any]:
+    cmd = [
+        sys.executable, "-m", __spec__.name if __spec__ else "google_analytics.benchmarks.run",
+        "--worker", mode, "--base-url", base_url,
+        "--rows", str(args.rows), "--page-size", str(args.page_size), "--concurrency", str(args.concurrency),
+        "--transport", args.transport,
+    ]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _table(results: List[Dict[str, Any]]) -> str:
+    cols = [
+        ("mode", "{}"), ("rows", "{:d}"), ("requests", "{:d}"), ("requests_per_s", "{:.1f}"),
+        ("rows_per_s", "{:.0f}"), ("parse_us_per_row", "{:.2f}"), ("wire_mb", "{:.2f}"), ("peak_rss_mb", "{:.1f}"),
+        ("retries", "{:d}"), ("retry_sleep_share", "{:.1%}"),
+    ]
+    cells = [[name for name, _ in cols]] + [[fmt.format(r[name]) for name, fmt in cols] for r in results]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(cols))]
+    return "\n".join("  ".join(c.rjust(w) for c, w in zip(row, widths)) for row in cells)
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark GA4 clients against a local stand-in server")
+    parser.add_argument("--modes", default=",".join(MODES), help=f"comma separated subset of {', '.join(MODES)}")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=4, help="async in-flight requests")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate-429", type=float, default=0.0)
+    parser.add_argument("--error-rate-5xx", type=float, default=0.0)
+    parser.add_argument("--transport", default="requests", help="sync client transport: requests, httpx or http2")
+    parser.add_argument("--no-compress", action="store_true", help="serve uncompressed responses")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    parser.add_argument("--in-process", action="store_true", help="run modes in this process (shared peak RSS)")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(_run_mode(args.worker, args.base_url, args.rows, args.page_size, args.concurrency, args.transport)))
+        return
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    cfg = FakeServerConfig(args.rows, args.latency_ms, args.error_rate_429, args.error_rate_5xx, compress=not args.no_compress)
+    with FakeAnalyticsServer(cfg) as server:
+        # pre-render every page so the first mode does not pay for response generation
+        for page_req in _pages(_request(), args.rows, args.page_size):
+            payload = _report(page_req.model_dump(exclude_none=True), args.rows)
+            if cfg.compress:
+                _gzip(payload)
+        if args.in_process:
+            results = [_run_mode(m, server.base_url, args.rows, args.page_size, args.concurrency, args.transport) for m in modes]
+        else:
+            results = [_spawn(m, server.base_url, args) for m in modes]
+    print(json.dumps(results, indent=2) if args.json else _table(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""Pluggable response caches for ``GA4Client.run_report``.
+
+Entries are keyed on the property ID plus the canonical request JSON (with
+relative dates like ``7daysAgo`` resolved to calendar dates) and hold the raw
+response body, so a hit skips the network entirely. TTLs come from
+``TtlPolicy``: ranges that touch today (or GA's still-settling recent days)
+expire quickly, fully historical ranges never do.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+from .api._requests import RunReportRequest
+
+_DAYS_AGO = re.compile(r"^(\d+)daysAgo$")
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def pin_dates(req: ModelT, *, today: Optional[date] = None) -> ModelT:
+    """Copy of ``req`` with ``today``/``yesterday``/``NdaysAgo`` in its ``dateRanges`` resolved to calendar dates."""
+    ranges = getattr(req, "dateRanges", None)
+    if not ranges:
+        return req
+    today = today or date.today()
+    resolved = [
+        r.model_copy(update={"startDate": resolve_date(r.startDate, today).isoformat(), "endDate": resolve_date(r.endDate, today).isoformat()})
+        for r in ranges
+    ]
+    return req.model_copy(update={"dateRanges": resolved})
+
+
+def cache_key(property_id: str | int, req: BaseModel, *, today: Optional[date] = None) -> str:
+    """Stable key for ``req``; relative dates are pinned (``pin_dates``) so windows roll daily."""
+    body = pin_dates(req, today=today).model_dump_json(exclude_none=True).encode("utf-8")
+    return f"{property_id}:{hashlib.sha256(body).hexdigest()}"
+
+
+def resolve_date(value: str, today: date) -> date:
+    if value == "today":
+        return today
+    if value == "yesterday":
+        return today - timedelta(days=1)
+    m = _DAYS_AGO.match(value)
+    if m:
+        return today - timedelta(days=int(m.group(1)))
+    return date.fromisoformat(value)
+
+
+@dataclass(frozen=True)
+class TtlPolicy:
+    """Pick a TTL (seconds, ``None`` = forever) from a request's date ranges.
+
+    GA keeps revising the last ``settle_days`` days, so those are cached for
+    ``recent_ttl``; a range including today gets ``live_ttl``.
+    """
+
+    live_ttl: float = 300.0
+    recent_ttl: float = 3600.0
+    historical_ttl: Optional[float] = None
+    settle_days: int = 3
+
+    def ttl_for(self, req: RunReportRequest, *, today: Optional[date] = None) -> Optional[float]:
+        today = today or date.today()
+        if not req.dateRanges:
+            return self.live_ttl
+        latest = max(resolve_date(r.endDate, today) for r in req.dateRanges)
+        if latest >= today:
+            return self.live_ttl
+        if latest > today - timedelta(days=self.settle_days):
+            return self.recent_ttl
+        return self.historical_ttl
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class ResponseCache(ABC):
+    """Base class for cache backends: byte values, per-entry TTL, size bound."""
+
+    def __init__(self) -> None:
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._get(key)
+            if value is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+            return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        expires = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._set(key, value, expires)
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    def _set(self, key: str, value: bytes, expires: Optional[float]) -> None: ...
+
+
+class MemoryCache(ResponseCache):
+    """In-process LRU bounded by total payload bytes."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        super().__init__()
+        self.max_bytes = max_bytes
+        self._size = 0
+        self._entries: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+
+    def _get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires is not None and expires <= time.time():
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value: bytes, expires: Optional[float]) -> None:
+        if len(value) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = (value, expires)
+        self._size += len(value)
+        while self._size > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def _drop(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._size -= len(value)
+
+
+class DiskCache(ResponseCache):
+    """One file per entry under ``directory``; least-recently-used files are evicted past ``max_bytes``."""
+
+    def __init__(self, directory: str, max_bytes: int = 1024 * 1024 * 1024) -> None:
+        super().__init__()
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._sizes: Dict[str, int] = {}
+        for name in os.listdir(directory):
+            if name.endswith(".bin"):
+                self._sizes[name] = os.path.getsize(os.path.join(directory, name))
+        self._size = sum(self._sizes.values())
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    @staticmethod
+    def _name(key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest() + ".bin"
+
+    def _get(self, key: str) -> Optional[bytes]:
+        name = self._name(key)
+        try:
+            with open(self._path(name), "rb") as f:
+                header = f.readline()
+                value = f.read()
+        except OSError:
+            return None
+        expires = float(header) if header.strip() else None
+        if expires is not None and expires <= time.time():
+            self._remove(name)
+            return None
+        os.utime(self._path(name))
+        return value
+
+    def _set(self, key: str, value: bytes, expires: Optional[float]) -> None:
+        name = self._name(key)
+        header = (repr(expires) if expires is not None else "").encode("ascii") + b"\n"
+        tmp = self._path(name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(header)
+            f.write(value)
+        os.replace(tmp, self._path(name))
+        self._size += len(header) + len(value) - self._sizes.get(name, 0)
+        self._sizes[name] = len(header) + len(value)
+        if self._size > self.max_bytes:
+            by_age = sorted(self._sizes, key=lambda n: os.path.getmtime(self._path(n)))
+            for victim in by_age:
+                if self._size <= self.max_bytes:
+                    break
+                self._remove(victim)
+                self.stats.evictions += 1
+
+    def _remove(self, name: str) -> None:
+        try:
+            os.remove(self._path(name))
+        except OSError:
+            pass
+        self._size -= self._sizes.pop(name, 0)
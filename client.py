@@ -1,16 +1,276 @@
 """Google Analytics Data API (GA4) SDK client."""
 from __future__ import annotations
 
-import json
+import random
+import threading
 import time
-from typing import Any, Dict, Iterable, Optional
+from collections import OrderedDict
+from contextlib import nullcontext
+from functools import partial
+from datetime import timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
 
-import requests
+from pydantic import BaseModel
+from pydantic_core import to_json
 
+from . import _codec
 from .config import BASE_URL, HTTP_SETTINGS, OAUTH_SETTINGS, SCOPE_ANALYTICS_READONLY, FEATURE_USE_BETA_METADATA
-from .api._exceptions import ApiError, AuthError, RateLimitError, RetryableError
-from .api._requests import RunReportRequest, RealtimeReportRequest
-from .api._responses import RunReportResponse, RealtimeReportResponse
+from .auth import TokenProvider, shared_service_account
+from .cache import ResponseCache, TtlPolicy, cache_key
+from .hooks import Hooks, RequestEvent, current_event, endpoint_of
+from .metadata import MetadataService
+from .ratelimit import QuotaScheduler
+from .resilience import CircuitBreaker, HedgePolicy
+from .singleflight import SingleFlight
+from .transport import Transport, make_transport
+from .api._exceptions import ApiError, AuthError, RateLimitError, RequestValidationError, RetryableError
+from .api._requests import CheckCompatibilityRequest, RunPivotReportRequest, RunReportRequest, RealtimeReportRequest
+from .api._responses import (
+    BatchRunPivotReportsResponse,
+    BatchRunReportsResponse,
+    CheckCompatibilityResponse,
+    DimensionHeader,
+    MetricHeader,
+    PivotHeader,
+    PropertyQuota,
+    RealtimeReportResponse,
+    Row,
+    RunPivotReportResponse,
+    RunReportResponse,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .columnar import ColumnarReport
+
+# GA4 accepts at most 250k rows per runReport page
+MAX_PAGE_SIZE = 250_000
+# ...and at most 5 reports per batchRunReports call
+MAX_BATCH_SIZE = 5
+# compatibility verdicts remembered per client (least recently used are dropped)
+MAX_COMPATIBILITY_VERDICTS = 1024
+
+ReportT = TypeVar("ReportT", RunReportResponse, RealtimeReportResponse, RunPivotReportResponse)
+T = TypeVar("T")
+
+
+def _parse_error(resp: Any) -> Tuple[str, Optional[str]]:
+    """Extract (message, reason) from a GA error body; works for requests and httpx responses."""
+    try:
+        err = resp.json()
+        message = err.get("error", {}).get("message") or err.get("message") or resp.text
+        reason = None
+        if "error" in err and isinstance(err["error"], dict):
+            reason = err["error"].get("status")
+            if not reason:
+                reasons = err["error"].get("errors") or []
+                if reasons and isinstance(reasons, list) and isinstance(reasons[0], dict):
+                    reason = reasons[0].get("reason")
+    except Exception:
+        message = resp.text
+        reason = None
+    return message, reason
+
+
+class RetryPolicy:
+    """Retry/backoff state and error mapping for one logical request.
+
+    Shared by the sync and async clients: callers send the request, and on a
+    non-2xx response ask ``next_delay`` how long to sleep before trying again.
+    It raises the mapped exception once the response is final.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 5,
+        backoff: float = 1.0,
+        max_backoff: float = 16.0,
+        jitter: bool = True,
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.attempts = 0
+
+    def next_delay(self, resp: Any) -> float:
+        self.attempts += 1
+        message, reason = _parse_error(resp)
+        status = resp.status_code
+
+        if status == 401 or status == 403:
+            raise AuthError(f"Unauthorized/Forbidden: {message}")
+        if status == 429:
+            if self.attempts <= self.max_retries:
+                retry_after = resp.headers.get("Retry-After")
+                if retry_after is not None:
+                    return self._advance(float(retry_after), floor=True)
+                return self._advance(self.backoff)
+            raise RateLimitError(status, message, reason)
+        if 500 <= status < 600:
+            if self.attempts <= self.max_retries:
+                return self._advance(self.backoff)
+            raise RetryableError(status, message, reason)
+
+        raise ApiError(status, message, reason)
+
+    def _advance(self, delay: float, *, floor: bool = False) -> float:
+        """Grow the backoff and return ``delay`` with jitter so concurrent workers spread out.
+
+        A server-provided ``Retry-After`` is a floor: jitter only ever adds to it.
+        """
+        self.backoff = min(self.backoff * 2, self.max_backoff)
+        if not self.jitter:
+            return delay
+        if floor:
+            return delay * random.uniform(1.0, 1.25)
+        return random.uniform(delay / 2, delay)
+
+
+def _encode(req: BaseModel) -> bytes:
+    """Request body bytes straight from pydantic's serializer (no dict round-trip)."""
+    return to_json(req, exclude_none=True)
+
+
+def _encode_batch(requests_list: list[Any]) -> bytes:
+    return b'{"requests":[' + b",".join(_encode(r) for r in requests_list) + b"]}"
+
+
+def _construct(model: type[ReportT], data: Dict[str, Any]) -> ReportT:
+    """Build a report model from trusted JSON without validation (``validate=False``)."""
+    fields = dict(data)
+    fields["dimensionHeaders"] = [DimensionHeader.model_construct(**h) for h in data.get("dimensionHeaders", [])]
+    fields["metricHeaders"] = [MetricHeader.model_construct(**h) for h in data.get("metricHeaders", [])]
+    fields["rows"] = [Row.model_construct(**r) for r in data.get("rows", [])]
+    for key in ("totals", "aggregates"):
+        if data.get(key) is not None:
+            fields[key] = [Row.model_construct(**r) for r in data[key]]
+    if data.get("pivotHeaders") is not None:
+        fields["pivotHeaders"] = [PivotHeader.model_validate(h) for h in data["pivotHeaders"]]
+    if data.get("propertyQuota") is not None:
+        fields["propertyQuota"] = PropertyQuota.model_validate(data["propertyQuota"])
+    return model.model_construct(**fields)
+
+
+def _parse_batch(raw: bytes, validate: bool, model: type[ReportT], batch: type[BaseModel], key: str) -> list[ReportT]:
+    """Reports of a batch response (``reports`` / ``pivotReports``), validated or constructed."""
+    if validate:
+        return getattr(batch.model_validate_json(raw), key)
+    return [_construct(model, r) for r in _codec.loads(raw).get(key, [])]
+
+
+def _compatibility_request(req: CheckCompatibilityRequest | RunReportRequest | RunPivotReportRequest) -> CheckCompatibilityRequest:
+    if isinstance(req, CheckCompatibilityRequest):
+        return req
+    return CheckCompatibilityRequest(
+        dimensions=req.dimensions,
+        metrics=req.metrics,
+        dimensionFilter=req.dimensionFilter,
+        metricFilter=req.metricFilter,
+    )
+
+
+def _compatibility_problems(resp: CheckCompatibilityResponse) -> list[str]:
+    return [f"'{name}' is incompatible with the other requested fields" for name in resp.incompatible()]
+
+
+class _Verdicts:
+    """Thread-safe LRU of ``ensure_compatible`` results, keyed by property and field set."""
+
+    def __init__(self, maxsize: int = MAX_COMPATIBILITY_VERDICTS) -> None:
+        self.maxsize = maxsize
+        self._items: "OrderedDict[str, list[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[list[str]]:
+        with self._lock:
+            problems = self._items.get(key)
+            if problems is not None:
+                self._items.move_to_end(key)
+            return problems
+
+    def set(self, key: str, problems: list[str]) -> list[str]:
+        with self._lock:
+            self._items[key] = problems
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return problems
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class _CacheHit(bytes):
+    """Response body served from the response cache; its ``propertyQuota`` is stale."""
+
+
+def _quota_of(result: Any) -> Optional[PropertyQuota]:
+    """``propertyQuota`` of a parsed response (the last one sent in a batch), if GA returned one."""
+    if isinstance(result, list):
+        quotas = [q for q in map(_quota_of, result) if q is not None]
+        return quotas[-1] if quotas else None
+    quota = getattr(result, "propertyQuota", None) or getattr(result, "property_quota", None)
+    return PropertyQuota.model_validate(quota) if isinstance(quota, dict) else quota
+
+
+def _observe_quota(limiter: QuotaScheduler, property_id: str | int, result: Any) -> None:
+    """Feed a parsed response's ``propertyQuota`` (present when requested) back into the scheduler."""
+    quota = _quota_of(result)
+    if quota is not None:
+        limiter.observe(property_id, quota)
+
+
+def _observing(limiter: QuotaScheduler, property_id: str | int, parse: Callable[[bytes], T]) -> Callable[[bytes], T]:
+    """``parse`` that also re-syncs ``limiter`` from the parsed ``propertyQuota`` (skipped for cache hits)."""
+
+    def run(raw: bytes) -> T:
+        result = parse(raw)
+        if not isinstance(raw, _CacheHit):
+            _observe_quota(limiter, property_id, result)
+        return result
+
+    return run
+
+
+def _record_attempt(event: RequestEvent, resp: Any, body: Optional[bytes], queued: float, sent: float) -> None:
+    now = time.perf_counter()
+    event.attempts += 1
+    event.status = resp.status_code
+    event.bytes_out += len(body or b"")
+    event.bytes_in += _wire_bytes(resp)
+    if sent > queued:
+        event.add_span("queue", sent - queued)
+    elapsed = getattr(resp, "elapsed", None)
+    ttfb = elapsed.total_seconds() if isinstance(elapsed, timedelta) else now - sent
+    event.add_span("ttfb", ttfb)
+    event.add_span("transfer", max(0.0, now - sent - ttfb))
+
+
+def _wire_bytes(resp: Any) -> int:
+    """Response body size on the wire: the compressed length when the server encoded it."""
+    length = resp.headers.get("Content-Length") if resp.headers.get("Content-Encoding") else None
+    return int(length) if length else len(resp.content or b"")
+
+
+def _upstream_failed(status: int) -> bool:
+    """Responses that count against a circuit breaker: GA overloaded or erroring, not a bad request.
+
+    429 is not passed here at all: RESOURCE_EXHAUSTED is one property's quota (handled by retries
+    and ``QuotaScheduler``) and must not open the endpoint for every other property.
+    """
+    return status >= 500
+
+
+def _chunked(items: list[Any], size: int) -> Iterator[list[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def _metadata_url(base_url: str, property_id: str | int) -> str:
+    base = "https://analyticsdata.googleapis.com/v1beta" if FEATURE_USE_BETA_METADATA and base_url == BASE_URL else base_url
+    return f"{base}/properties/{property_id}/metadata"
 
 
 class GA4Client:
@@ -18,23 +278,73 @@ class GA4Client:
 
     def __init__(
         self,
-        access_token: str,
+        access_token: Optional[str] = None,
         *,
+        credentials: Optional[TokenProvider] = None,
         timeout: Optional[int] = None,
         user_agent: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_policy: Optional[TtlPolicy] = None,
+        validate: bool = True,
+        rate_limiter: Optional[QuotaScheduler] = None,
+        metadata: Optional[MetadataService] = None,
+        check_fields: bool = False,
+        coalesce: bool = False,
+        hooks: Optional[Hooks] = None,
+        base_url: Optional[str] = None,
+        transport: Transport | str | None = None,
+        hedge: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ) -> None:
+        """``validate=False`` skips pydantic validation of responses (trusted-schema fast path).
+
+        Pass either a static ``access_token`` or a refreshing ``credentials``
+        provider. ``rate_limiter`` may be shared by many clients, threads and
+        async tasks. With ``check_fields`` (or an explicit ``metadata`` service) every
+        ``run_report`` is validated against cached property metadata first.
+        ``coalesce`` lets concurrent identical report calls share one upstream
+        request and one parsed (shared, so treat as read-only) response.
+        ``hooks`` receives a timed ``RequestEvent`` per call (see ``hooks``).
+        ``base_url`` points the client at another Data API host (e.g. a local stand-in).
+        ``transport`` is ``"requests"`` (default), ``"httpx"``, ``"http2"`` or a
+        ``transport.Transport`` instance (see ``transport``).
+        ``hedge`` duplicates calls slower than a per-endpoint latency percentile and
+        ``circuit_breaker`` fails fast while an endpoint is degraded (see ``resilience``).
+        """
+        if access_token is None and credentials is None:
+            raise AuthError("GA4Client needs an access_token or a credentials provider")
         self._access_token = access_token
+        self._credentials = credentials
+        self._owns_credentials = False  # set by the from_* constructors, which create the provider
+        self._validate = validate
+        self._rate_limiter = rate_limiter
+        self._metadata = metadata or (MetadataService(self.get_metadata) if check_fields else None)
+        self._cache = cache
+        self._flight = SingleFlight() if coalesce else None
+        self._compatibility = _Verdicts()
+        self._hooks = hooks
+        self._hedge = hedge
+        self._breaker = circuit_breaker
+        self._base_url = (base_url or BASE_URL).rstrip("/")
+        self._cache_policy = cache_policy or TtlPolicy()
         self._timeout = timeout or HTTP_SETTINGS.timeout
         self._user_agent = user_agent or HTTP_SETTINGS.user_agent
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Authorization": f"Bearer {self._access_token}",
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-                "User-Agent": self._user_agent,
-            }
-        )
+        headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "User-Agent": self._user_agent,
+        }
+        if credentials is None:
+            headers["Authorization"] = f"Bearer {self._access_token}"
+        if transport is None or isinstance(transport, str):
+            transport = make_transport(transport or HTTP_SETTINGS.transport, headers, credentials=credentials)
+        self._transport = transport
+        self._session = transport.session
+
+    def close(self) -> None:
+        self._transport.close()
+        if self._owns_credentials:
+            self._credentials.close()  # type: ignore[union-attr]
 
     # ----- Auth helpers -----
     @staticmethod
@@ -78,7 +388,9 @@ class GA4Client:
                 except Exception:
                     pass
 
-        return GA4Client(access_token=creds.token)
+        client = GA4Client(credentials=TokenProvider(creds))
+        client._owns_credentials = True
+        return client
 
     @staticmethod
     def from_service_account(
@@ -86,88 +398,341 @@ class GA4Client:
         key_path: Optional[str] = None,
         scopes: Optional[Iterable[str]] = None,
     ) -> "GA4Client":
-        try:
-            from google.oauth2 import service_account  # type: ignore
-            from google.auth.transport.requests import Request as GoogleAuthRequest  # type: ignore
-        except Exception as e:  # pragma: no cover
-            raise AuthError("google-auth is required for service account flow") from e
-
-        scopes = list(scopes) if scopes else [SCOPE_ANALYTICS_READONLY]
-        key_path = key_path or OAUTH_SETTINGS.service_account_key_path
-        creds = service_account.Credentials.from_service_account_file(key_path, scopes=scopes)  # type: ignore
-        # Create fresh token
-        auth_request = GoogleAuthRequest()
-        try:
-            creds.refresh(auth_request)  # type: ignore[arg-type]
-        except Exception as e:
-            raise AuthError(f"Failed to refresh service account token: {e}") from e
-        return GA4Client(access_token=creds.token)
+        """Client backed by the process-wide token provider for this key file and scopes."""
+        client = GA4Client(credentials=shared_service_account(key_path=key_path, scopes=scopes))
+        client._owns_credentials = True  # one user of the shared provider; it stops after the last closes
+        return client
 
     # ----- Low-level HTTP with retries -----
-    def _request(self, method: str, url: str, *, json_body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        backoff = 1.0
-        max_backoff = 16.0
-        attempts = 0
+    def _request_raw(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: Optional[bytes] = None,
+        property_id: str | int | None = None,
+        priority: int = 0,
+    ) -> bytes:
+        retry = RetryPolicy()
+        limiter = self._rate_limiter if property_id is not None else None
+        event = current_event() if self._hooks is not None else None
+        endpoint = endpoint_of(url)
+        reauthed = False
         while True:
-            attempts += 1
-            resp = self._session.request(method, url, json=json_body, timeout=self._timeout)
+            probe = self._breaker.before(endpoint) if self._breaker is not None else None
+            sent_with = self._credentials.cached_token() if self._credentials is not None else None
+            try:
+                queued = time.perf_counter()
+                with limiter.acquire(property_id, priority=priority) if limiter else nullcontext():
+                    sent = time.perf_counter()
+                    resp = self._send(method, url, body, endpoint, event, limiter, property_id)
+            finally:
+                # failed before sending (e.g. rate-limit timeout): hand the half-open probe slot back
+                if probe is not None:
+                    self._breaker.release(endpoint, probe)  # type: ignore[union-attr]
+            if event is not None:
+                _record_attempt(event, resp, body, queued, sent)
             if 200 <= resp.status_code < 300:
-                if resp.content:
-                    return resp.json()
-                return {}
+                return resp.content
+            if resp.status_code == 401 and self._credentials is not None and not reauthed:
+                # Token revoked or expired early: refresh once (unless a concurrent 401 already did),
+                # then let RetryPolicy map a second 401.
+                self._credentials.refresh(force=True, stale=sent_with)
+                reauthed = True
+                continue
+            delay = retry.next_delay(resp)
+            if limiter and resp.status_code == 429:
+                limiter.pause(property_id, delay)
+            if self._breaker is not None:
+                self._breaker.check(endpoint)  # raises now rather than after the sleep if this failure opened it
+            if event is not None:
+                event.add_span("retry_sleep", delay)
+            time.sleep(delay)
 
-            # Parse error
-            try:
-                err = resp.json()
-                message = err.get("error", {}).get("message") or err.get("message") or resp.text
-                reason = None
-                if "error" in err and isinstance(err["error"], dict):
-                    details = err["error"].get("details") or []
-                    reason = err["error"].get("status")
-                    if not reason:
-                        reasons = err["error"].get("errors") or []
-                        if reasons and isinstance(reasons, list) and isinstance(reasons[0], dict):
-                            reason = reasons[0].get("reason")
-            except Exception:
-                message = resp.text
-                reason = None
-
-            if resp.status_code == 401 or resp.status_code == 403:
-                raise AuthError(f"Unauthorized/Forbidden: {message}")
-            if resp.status_code == 429:
-                if attempts <= 5:
-                    sleep_for = float(resp.headers.get("Retry-After", backoff))
-                    time.sleep(sleep_for)
-                    backoff = min(backoff * 2, max_backoff)
-                    continue
-                raise RateLimitError(resp.status_code, message, reason)
-            if 500 <= resp.status_code < 600:
-                if attempts <= 5:
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, max_backoff)
-                    continue
-                raise RetryableError(resp.status_code, message, reason)
-
-            raise ApiError(resp.status_code, message, reason)
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        endpoint: str,
+        event: Optional[RequestEvent],
+        limiter: Optional[QuotaScheduler],
+        property_id: str | int | None,
+    ) -> Any:
+        """One attempt through the transport, hedged and fed to the circuit breaker when configured."""
+
+        def send() -> Any:
+            return self._transport.request(method, url, data=body, timeout=self._timeout)
+
+        try:
+            if self._hedge is None:
+                resp = send()
+            else:
+                # the duplicate needs its own (charged) permit; the caller holds the original's
+                admit = release = None
+                if limiter is not None:
+                    admit, release = partial(limiter.try_acquire, property_id), partial(limiter.release, property_id)
+                resp, hedged = self._hedge.run(endpoint, send, admit=admit, release=release)
+                if hedged and event is not None:
+                    event.hedges += 1
+        except Exception:
+            if self._breaker is not None:
+                self._breaker.record(endpoint, False)
+            raise
+        if self._breaker is not None and resp.status_code != 429:
+            self._breaker.record(endpoint, not _upstream_failed(resp.status_code))
+        return resp
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: Optional[bytes] = None,
+        property_id: str | int | None = None,
+    ) -> Dict[str, Any]:
+        return self._call(
+            method,
+            url,
+            property_id,
+            lambda: self._request_raw(method, url, body=body, property_id=property_id),
+            lambda raw: _codec.loads(raw) if raw else {},
+        )
+
+    def _call(self, method: str, url: str, property_id: Any, fetch: Callable[[], bytes], parse: Callable[[bytes], T]) -> T:
+        """Fetch + parse one logical API call, traced when hooks are installed."""
+        if self._rate_limiter is not None and property_id is not None:
+            parse = _observing(self._rate_limiter, property_id, parse)
+        if self._hooks is None:
+            return parse(fetch())
+        return self._hooks.trace(method, url, property_id, fetch, parse)
+
+    def _parse(self, model: type[ReportT], raw: bytes) -> ReportT:
+        if self._validate:
+            return model.model_validate_json(raw)
+        return _construct(model, _codec.loads(raw))
 
     # ----- High-level API methods -----
-    def run_report(self, property_id: str | int, req: RunReportRequest) -> RunReportResponse:
-        url = f"{BASE_URL}/properties/{property_id}:runReport"
-        data = self._request("POST", url, json_body=json.loads(req.model_dump_json(exclude_none=True)))
-        return RunReportResponse.model_validate(data)
+    def run_report(self, property_id: str | int, req: RunReportRequest, *, priority: int = 0) -> RunReportResponse:
+        """``priority`` orders this call among those queued on a shared ``rate_limiter`` (lower first)."""
+        url = f"{self._base_url}/properties/{property_id}:runReport"
+
+        def call() -> RunReportResponse:
+            return self._call(
+                "POST",
+                url,
+                property_id,
+                lambda: self._run_report_raw(property_id, req, priority),
+                lambda raw: self._parse(RunReportResponse, raw),
+            )
+
+        if self._flight is not None:
+            return self._flight.do(cache_key(property_id, req), call)
+        return call()
+
+    def run_report_columnar(self, property_id: str | int, req: RunReportRequest, *, priority: int = 0) -> ColumnarReport:
+        """Like ``run_report`` but parsed straight into typed NumPy columns (no per-row models)."""
+        from .columnar import ColumnarReport  # numpy is only loaded by callers that want columns
+
+        url = f"{self._base_url}/properties/{property_id}:runReport"
+        return self._call(
+            "POST",
+            url,
+            property_id,
+            lambda: self._run_report_raw(property_id, req, priority),
+            lambda raw: ColumnarReport.from_json(_codec.loads(raw)),
+        )
+
+    def _run_report_raw(self, property_id: str | int, req: RunReportRequest, priority: int = 0) -> bytes:
+        if self._metadata is not None:
+            self._metadata.validate(property_id, req)
+        url = f"{self._base_url}/properties/{property_id}:runReport"
+        if self._cache is None:
+            return self._request_raw("POST", url, body=_encode(req), property_id=property_id, priority=priority)
+
+        key = cache_key(property_id, req)
+        cached = self._cache.get(key)
+        event = current_event() if self._hooks is not None else None
+        if event is not None:
+            event.cache_hit = cached is not None
+        if cached is not None:
+            return _CacheHit(cached)
+        raw = self._request_raw("POST", url, body=_encode(req), property_id=property_id, priority=priority)
+        self._cache.set(key, raw, self._cache_policy.ttl_for(req))
+        return raw
+
+    def iter_report_pages(
+        self,
+        property_id: str | int,
+        req: RunReportRequest,
+        *,
+        page_size: int = 10_000,
+        priority: int = 0,
+    ) -> Iterator[RunReportResponse]:
+        """Yield every page of a report, walking ``offset``.
 
-    def run_realtime_report(self, property_id: str | int, req: RealtimeReportRequest) -> RealtimeReportResponse:
-        url = f"{BASE_URL}/properties/{property_id}:runRealtimeReport"
-        data = self._request("POST", url, json_body=json.loads(req.model_dump_json(exclude_none=True)))
-        return RealtimeReportResponse.model_validate(data)
+        The next page is fetched in the background while the caller consumes the
+        current one, so at most two pages are held in memory. ``req.offset`` is
+        the starting row and ``req.limit`` (if set) caps the total rows yielded.
+        """
+        if not 0 < page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+        offset = req.offset or 0
+        remaining = req.limit
+
+        def fetch(at: int) -> RunReportResponse:
+            size = page_size if remaining is None else min(page_size, remaining)
+            return self.run_report(property_id, req.model_copy(update={"offset": at, "limit": size}), priority=priority)
+
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ga4-prefetch")
+        try:
+            future: Optional[Future[RunReportResponse]] = pool.submit(fetch, offset)
+            while future is not None:
+                page = future.result()
+                count = len(page.rows)
+                offset += count
+                if remaining is not None:
+                    remaining -= count
+                more = count > 0 and (remaining is None or remaining > 0)
+                if page.rowCount is not None:
+                    more = more and offset < page.rowCount
+                else:
+                    more = more and count >= page_size
+                future = pool.submit(fetch, offset) if more else None
+                yield page
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def iter_report_rows(
+        self,
+        property_id: str | int,
+        req: RunReportRequest,
+        *,
+        page_size: int = 10_000,
+        priority: int = 0,
+    ) -> Iterator[Row]:
+        """Yield every row of a report at constant memory (see ``iter_report_pages``)."""
+        for page in self.iter_report_pages(property_id, req, page_size=page_size, priority=priority):
+            yield from page.rows
+
+    def run_realtime_report(self, property_id: str | int, req: RealtimeReportRequest, *, priority: int = 0) -> RealtimeReportResponse:
+        url = f"{self._base_url}/properties/{property_id}:runRealtimeReport"
+
+        def call() -> RealtimeReportResponse:
+            return self._call(
+                "POST",
+                url,
+                property_id,
+                lambda: self._request_raw("POST", url, body=_encode(req), property_id=property_id, priority=priority),
+                lambda raw: self._parse(RealtimeReportResponse, raw),
+            )
+
+        if self._flight is not None:
+            return self._flight.do("realtime:" + cache_key(property_id, req), call)
+        return call()
 
     def get_metadata(self, property_id: str | int) -> Dict[str, Any]:
-        base = "https://analyticsdata.googleapis.com/v1beta" if FEATURE_USE_BETA_METADATA else BASE_URL
-        url = f"{base}/properties/{property_id}/metadata"
-        return self._request("GET", url)
+        return self._request("GET", _metadata_url(self._base_url, property_id), property_id=property_id)
 
     # Optional
-    def batch_run_reports(self, property_id: str | int, requests_list: list[RunReportRequest]) -> Dict[str, Any]:
-        url = f"{BASE_URL}/properties/{property_id}:batchRunReports"
-        payload = {"requests": [json.loads(r.model_dump_json(exclude_none=True)) for r in requests_list]}
-        return self._request("POST", url, json_body=payload)
+    def batch_run_reports(
+        self,
+        property_id: str | int,
+        requests_list: list[RunReportRequest],
+        *,
+        max_workers: int = 4,
+        priority: int = 0,
+    ) -> list[RunReportResponse]:
+        """Run any number of reports, ``MAX_BATCH_SIZE`` per batch call, chunks in parallel.
+
+        Responses are returned in the same order as ``requests_list``.
+        """
+        url = f"{self._base_url}/properties/{property_id}:batchRunReports"
+
+        def parse(raw: bytes) -> list[RunReportResponse]:
+            return _parse_batch(raw, self._validate, RunReportResponse, BatchRunReportsResponse, "reports")
+
+        return self._run_batches(url, property_id, requests_list, parse, max_workers, priority)
+
+    def _run_batches(
+        self,
+        url: str,
+        property_id: str | int,
+        requests_list: list[Any],
+        parse: Callable[[bytes], list[T]],
+        max_workers: int,
+        priority: int = 0,
+    ) -> list[T]:
+        chunks = list(_chunked(requests_list, MAX_BATCH_SIZE))
+
+        def send(chunk: list[Any]) -> list[T]:
+            body = _encode_batch(chunk)
+            return self._call("POST", url, property_id, lambda: self._request_raw("POST", url, body=body, property_id=property_id, priority=priority), parse)
+
+        if len(chunks) <= 1:
+            return [resp for chunk in chunks for resp in send(chunk)]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks)), thread_name_prefix="ga4-batch") as pool:
+            return [resp for part in pool.map(send, chunks) for resp in part]
+
+    # ----- Pivot reports and compatibility -----
+    def run_pivot_report(self, property_id: str | int, req: RunPivotReportRequest, *, priority: int = 0) -> RunPivotReportResponse:
+        """One cross-tab call in place of a report per slice; reshape with ``pivot.pivot_matrix``."""
+        if self._metadata is not None:
+            self._metadata.validate(property_id, req)
+        url = f"{self._base_url}/properties/{property_id}:runPivotReport"
+        return self._call(
+            "POST",
+            url,
+            property_id,
+            lambda: self._request_raw("POST", url, body=_encode(req), property_id=property_id, priority=priority),
+            lambda raw: self._parse(RunPivotReportResponse, raw),
+        )
+
+    def batch_run_pivot_reports(
+        self,
+        property_id: str | int,
+        requests_list: list[RunPivotReportRequest],
+        *,
+        max_workers: int = 4,
+        priority: int = 0,
+    ) -> list[RunPivotReportResponse]:
+        """``batch_run_reports`` for pivot requests; responses keep the order of ``requests_list``."""
+        if self._metadata is not None:
+            for req in requests_list:
+                self._metadata.validate(property_id, req)
+        url = f"{self._base_url}/properties/{property_id}:batchRunPivotReports"
+
+        def parse(raw: bytes) -> list[RunPivotReportResponse]:
+            return _parse_batch(raw, self._validate, RunPivotReportResponse, BatchRunPivotReportsResponse, "pivotReports")
+
+        return self._run_batches(url, property_id, requests_list, parse, max_workers, priority)
+
+    def check_compatibility(
+        self,
+        property_id: str | int,
+        req: CheckCompatibilityRequest | RunReportRequest | RunPivotReportRequest,
+    ) -> CheckCompatibilityResponse:
+        """Which of the request's dimensions/metrics GA can combine (report requests are converted)."""
+        url = f"{self._base_url}/properties/{property_id}:checkCompatibility"
+        body = _encode(_compatibility_request(req))
+        return self._call(
+            "POST",
+            url,
+            property_id,
+            lambda: self._request_raw("POST", url, body=body, property_id=property_id),
+            CheckCompatibilityResponse.model_validate_json,
+        )
+
+    def ensure_compatible(self, property_id: str | int, req: CheckCompatibilityRequest | RunReportRequest | RunPivotReportRequest) -> None:
+        """Raise ``RequestValidationError`` before a report is run if GA can't combine its fields.
+
+        Verdicts are remembered per property and field set (the ``MAX_COMPATIBILITY_VERDICTS``
+        most recently used), so repeated jobs check once.
+        """
+        compat = _compatibility_request(req)
+        key = cache_key(property_id, compat)
+        problems = self._compatibility.get(key)
+        if problems is None:
+            problems = self._compatibility.set(key, _compatibility_problems(self.check_compatibility(property_id, compat)))
+        if problems:
+            raise RequestValidationError(problems)
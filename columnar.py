@@ -0,0 +1,93 @@
+"""Column-oriented report results backed by NumPy arrays.
+
+``ColumnarReport.from_json`` reads the raw runReport JSON directly into one
+array per dimension/metric, skipping the per-row pydantic models. Metric
+columns are cast according to ``metricHeaders[].type``.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+try:  # optional dependency: pip install "dealscale-ga4-sdk[columnar]"
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+_INTEGER_TYPES = {"TYPE_INTEGER"}
+
+
+def _require_numpy() -> None:
+    if np is None:  # pragma: no cover
+        raise ImportError("numpy is required for columnar reports")
+
+
+def metric_dtype(metric_type: Optional[str]) -> Any:
+    """NumPy dtype for a GA ``MetricType``; everything that is not an integer is float64."""
+    return np.int64 if metric_type in _INTEGER_TYPES else np.float64
+
+
+@dataclass
+class ColumnarReport:
+    dimension_names: List[str]
+    metric_names: List[str]
+    metric_types: List[Optional[str]]
+    columns: Dict[str, Any] = field(default_factory=dict)  # name -> np.ndarray
+    row_count: Optional[int] = None
+    property_quota: Optional[Dict[str, Any]] = None  # raw ``propertyQuota`` block, when requested
+
+    def __len__(self) -> int:
+        if not self.columns:
+            return 0
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name]
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "ColumnarReport":
+        _require_numpy()
+        dims = [h["name"] for h in data.get("dimensionHeaders", [])]
+        mets = [h["name"] for h in data.get("metricHeaders", [])]
+        types = [h.get("type") for h in data.get("metricHeaders", [])]
+        rows = data.get("rows") or []
+
+        columns: Dict[str, Any] = {}
+        for i, name in enumerate(dims):
+            columns[name] = np.array([r["dimensionValues"][i].get("value", "") for r in rows], dtype=object)
+        for j, name in enumerate(mets):
+            raw = np.array([r["metricValues"][j].get("value") or "0" for r in rows], dtype=str)
+            columns[name] = raw.astype(metric_dtype(types[j])) if len(raw) else np.empty(0, metric_dtype(types[j]))
+        return cls(dims, mets, types, columns, data.get("rowCount"), data.get("propertyQuota"))
+
+    @classmethod
+    def concat(cls, parts: Iterable["ColumnarReport"]) -> "ColumnarReport":
+        """Stack several pages/reports with the same headers into one."""
+        _require_numpy()
+        parts = list(parts)
+        if not parts:
+            raise ValueError("concat() needs at least one report")
+        first = parts[0]
+        columns = {name: np.concatenate([p.columns[name] for p in parts]) for name in first.columns}
+        return cls(first.dimension_names, first.metric_names, first.metric_types, columns, first.row_count)
+
+    # ----- Exports -----
+    def to_arrow(self) -> Any:
+        """``pyarrow.Table``; numeric columns are wrapped without copying."""
+        import pyarrow as pa  # type: ignore
+
+        arrays = [
+            pa.array(col.tolist(), type=pa.string()) if col.dtype == object else pa.array(col)
+            for col in self.columns.values()
+        ]
+        return pa.Table.from_arrays(arrays, names=list(self.columns))
+
+    def to_pandas(self) -> Any:
+        import pandas as pd  # type: ignore
+
+        return pd.DataFrame(self.columns, copy=False)
+
+    def to_polars(self) -> Any:
+        import polars as pl  # type: ignore
+
+        return pl.from_arrow(self.to_arrow())
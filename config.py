@@ -40,8 +40,24 @@ class OAuthSettings:
 
 @dataclass(frozen=True)
 class HttpSettings:
+    """HTTP transport settings.
+
+    Env overrides:
+      - GA_HTTP_TIMEOUT: per-request timeout in seconds
+      - GA_USER_AGENT: User-Agent header
+      - GA_HTTP_POOL_CONNECTIONS / GA_HTTP_POOL_MAXSIZE: urllib3 pools per client and connections per host
+      - GA_HTTP_TRANSPORT: default GA4Client transport: requests, httpx or http2
+      - GA_CLIENT_POOL_SIZE: max clients kept by api.deps (one per credential)
+      - GA_CLIENT_IDLE_TTL: seconds before an idle pooled client is closed
+    """
+
     timeout: int = int(os.getenv("GA_HTTP_TIMEOUT", str(DEFAULT_TIMEOUT)))
     user_agent: str = os.getenv("GA_USER_AGENT", DEFAULT_USER_AGENT)
+    pool_connections: int = int(os.getenv("GA_HTTP_POOL_CONNECTIONS", "4"))
+    pool_maxsize: int = int(os.getenv("GA_HTTP_POOL_MAXSIZE", "32"))
+    transport: str = os.getenv("GA_HTTP_TRANSPORT", "requests")
+    client_pool_size: int = int(os.getenv("GA_CLIENT_POOL_SIZE", "256"))
+    client_idle_ttl: float = float(os.getenv("GA_CLIENT_IDLE_TTL", "600"))
 
 
 OAUTH_SETTINGS = OAuthSettings()
@@ -0,0 +1,244 @@
+"""Stream a paginated report to NDJSON, CSV or Parquet at flat memory.
+
+Pages from ``GA4Client.iter_report_pages`` are buffered up to ``buffer_rows``
+and flushed as one batch: a CSV/NDJSON chunk (a separate gzip member when
+compressed) or a Parquet row group. Metric columns are typed from
+``MetricHeader.type``.
+
+With ``checkpoint_path`` the export is resumable: after every flush the next
+offset and output position are recorded, and a rerun truncates the output to
+the last flushed batch and continues from there. Relative dates (``7daysAgo``)
+are pinned to calendar dates in the checkpoint, so a rerun on a later day
+resumes the original window. Parquet cannot be appended to, so a checkpointed
+Parquet export writes a directory of part files.
+
+An empty report still produces a file: the CSV header or Parquet schema.
+"""
+from __future__ import annotations
+
+import csv
+import gzip
+import hashlib
+import io
+import json
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
+
+from . import _codec
+from .cache import pin_dates
+from .api._requests import DateRange, RunReportRequest
+from .api._responses import MetricHeader, RunReportResponse
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import GA4Client
+
+ExportFormat = Literal["ndjson", "csv", "parquet"]
+
+_COMPRESSIONS: Dict[str, Tuple[Optional[str], ...]] = {
+    "ndjson": (None, "gzip"),
+    "csv": (None, "gzip"),
+    "parquet": (None, "none", "snappy", "gzip", "brotli", "zstd", "lz4"),  # Parquet column codecs
+}
+
+
+@dataclass(frozen=True)
+class ExportResult:
+    path: str
+    rows: int
+    resumed_from: int  # rows already exported by an earlier run
+
+
+def _cast(metric_type: Optional[str]) -> Any:
+    return int if metric_type == "TYPE_INTEGER" else float
+
+
+def _columns(page: RunReportResponse) -> Dict[str, List[Any]]:
+    cols: Dict[str, List[Any]] = {}
+    for i, h in enumerate(page.dimensionHeaders):
+        cols[h.name] = [r.dimensionValues[i].get("value", "") for r in page.rows]
+    for j, h in enumerate(page.metricHeaders):
+        cast = _cast(h.type)
+        cols[h.name] = [cast(r.metricValues[j].get("value") or 0) for r in page.rows]
+    return cols
+
+
+class _TextWriter:
+    def __init__(self, path: str, fmt: ExportFormat, compression: Optional[str], names: List[str], resume_at: Optional[int]) -> None:
+        self.fmt = fmt
+        self.gzip = compression == "gzip"
+        self.names = names
+        if resume_at is not None:
+            self._raw = open(path, "r+b")
+            self._raw.truncate(resume_at)
+            self._raw.seek(resume_at)
+        else:
+            self._raw = open(path, "wb")
+            if fmt == "csv":
+                self._emit(self._csv([names]))
+
+    def _csv(self, rows: Any) -> bytes:
+        buf = io.StringIO()
+        csv.writer(buf, lineterminator="\n").writerows(rows)
+        return buf.getvalue().encode("utf-8")
+
+    def _emit(self, data: bytes) -> None:
+        # one complete gzip member per batch keeps every flushed prefix a valid file
+        self._raw.write(gzip.compress(data) if self.gzip else data)
+
+    def write(self, cols: Dict[str, List[Any]]) -> None:
+        columns = [cols[n] for n in self.names]
+        if self.fmt == "csv":
+            self._emit(self._csv(zip(*columns)))
+        else:
+            self._emit(b"".join(_codec.dumps(dict(zip(self.names, row))) + b"\n" for row in zip(*columns)))
+
+    def position(self) -> int:
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        return self._raw.tell()
+
+    def close(self) -> None:
+        self._raw.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: str, compression: Optional[str], types: Dict[str, str], *, parts: bool, resume_at: Optional[int]) -> None:
+        try:
+            import pyarrow as pa  # type: ignore
+            import pyarrow.parquet as pq  # type: ignore
+        except Exception as e:  # pragma: no cover
+            raise ImportError("pyarrow is required for Parquet export") from e
+        self._pa, self._pq = pa, pq
+        self.path = path
+        self.compression = compression or "snappy"
+        self.schema = pa.schema([(name, getattr(pa, t)()) for name, t in types.items()])
+        self.parts = parts
+        self._count = resume_at or 0
+        self._writer = None
+        if parts:
+            os.makedirs(path, exist_ok=True)
+            for name in os.listdir(path):
+                if name.startswith("part-") and int(name[5:10]) >= self._count:
+                    os.remove(os.path.join(path, name))
+        else:
+            self._writer = pq.ParquetWriter(path, self.schema, compression=self.compression)
+
+    def write(self, cols: Dict[str, List[Any]]) -> None:
+        table = self._pa.Table.from_pydict(cols, schema=self.schema)
+        if self.parts:
+            self._pq.write_table(table, os.path.join(self.path, f"part-{self._count:05d}.parquet"), compression=self.compression)
+        else:
+            self._writer.write_table(table)  # type: ignore[union-attr]
+        self._count += 1
+
+    def position(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        elif self._count == 0:  # empty report: one empty part carries the schema
+            self.write({name: [] for name in self.schema.names})
+
+
+def _checkpoint_key(property_id: str | int, req: RunReportRequest) -> str:
+    # relative dates stay unresolved here, so tomorrow's rerun still finds today's checkpoint
+    body = req.model_dump_json(exclude={"offset"}, exclude_none=True).encode("utf-8")
+    return f"{property_id}:{hashlib.sha256(body).hexdigest()}"
+
+
+def _load_checkpoint(path: str, key: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if state.get("key") == key else None
+
+
+def _save_checkpoint(path: str, state: Dict[str, Any]) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+def export_report(
+    client: "GA4Client",
+    property_id: str | int,
+    req: RunReportRequest,
+    path: str,
+    *,
+    format: ExportFormat = "ndjson",
+    compression: Optional[str] = None,
+    page_size: int = 10_000,
+    buffer_rows: int = 100_000,
+    checkpoint_path: Optional[str] = None,
+) -> ExportResult:
+    if format not in _COMPRESSIONS:
+        raise ValueError(f"unknown export format '{format}'")
+    if compression not in _COMPRESSIONS[format]:
+        allowed = ", ".join(repr(c) for c in _COMPRESSIONS[format])
+        raise ValueError(f"{format} export supports compression {allowed}")
+    key = _checkpoint_key(property_id, req)
+    state = _load_checkpoint(checkpoint_path, key) if checkpoint_path else None
+    if state and state.get("dateRanges") is not None:
+        req = req.model_copy(update={"dateRanges": [DateRange.model_validate(r) for r in state["dateRanges"]]})
+    else:
+        req = pin_dates(req)
+    date_ranges = [r.model_dump(exclude_none=True) for r in req.dateRanges or []]
+    done = state["rows"] if state else 0
+    start = (req.offset or 0) + done
+    remaining = None if req.limit is None else req.limit - done
+    if remaining is not None and remaining <= 0:
+        return ExportResult(path, done, done)
+
+    pages = client.iter_report_pages(
+        property_id, req.model_copy(update={"offset": start, "limit": remaining}), page_size=page_size
+    )
+    writer: Any = None
+    buffered: Dict[str, List[Any]] = {}
+    rows = done
+
+    def open_writer(dimensions: List[str], metrics: List[MetricHeader]) -> None:
+        nonlocal writer, buffered
+        names = dimensions + [h.name for h in metrics]
+        resume_at = state["position"] if state else None
+        if format == "parquet":
+            types = {name: "string" for name in dimensions}
+            for h in metrics:
+                types[h.name] = "int64" if h.type == "TYPE_INTEGER" else "float64"
+            writer = _ParquetWriter(path, compression, types, parts=checkpoint_path is not None, resume_at=resume_at)
+        else:
+            writer = _TextWriter(path, format, compression, names, resume_at)
+        buffered = {name: [] for name in names}
+
+    def flush() -> None:
+        nonlocal buffered
+        if not buffered or not next(iter(buffered.values())):
+            return
+        writer.write(buffered)
+        buffered = {name: [] for name in buffered}
+        if checkpoint_path:
+            _save_checkpoint(checkpoint_path, {"key": key, "rows": rows, "position": writer.position(), "dateRanges": date_ranges})
+
+    try:
+        for page in pages:
+            if writer is None:
+                open_writer([h.name for h in page.dimensionHeaders], list(page.metricHeaders))
+            for name, values in _columns(page).items():
+                buffered[name].extend(values)
+            rows += len(page.rows)
+            if len(buffered[next(iter(buffered))]) >= buffer_rows:
+                flush()
+        if writer is None:  # no pages at all: headers come from the request
+            open_writer([d.name for d in req.dimensions], [MetricHeader(name=m.name) for m in req.metrics])
+        flush()
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return ExportResult(path, rows, done)
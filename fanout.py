@@ -0,0 +1,136 @@
+"""Run many (property, request) report jobs concurrently."""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Deque, Dict, Iterable, Iterator, List, Optional
+
+from .api._requests import RunReportRequest
+from .api._responses import RunReportResponse
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import GA4Client
+    from .async_client import AsyncGA4Client
+
+
+@dataclass(frozen=True)
+class FanoutJob:
+    property_id: str | int
+    request: RunReportRequest
+    tag: Any = None  # caller-defined label, e.g. the date window
+
+
+@dataclass
+class FanoutResult:
+    job: FanoutJob
+    response: Optional[RunReportResponse] = None
+    error: Optional[BaseException] = None
+    started_at: float = 0.0  # time.monotonic() at dispatch
+    elapsed: float = 0.0  # seconds spent in run_report
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def jobs_matrix(property_ids: Iterable[str | int], requests_list: Iterable[RunReportRequest]) -> List[FanoutJob]:
+    """Cross every property with every request (e.g. one request per date window)."""
+    reqs = list(requests_list)
+    return [FanoutJob(pid, r, tag=i) for pid in property_ids for i, r in enumerate(reqs)]
+
+
+def _timed(client: "GA4Client", job: FanoutJob) -> FanoutResult:
+    result = FanoutResult(job, started_at=time.monotonic())
+    try:
+        result.response = client.run_report(job.property_id, job.request)
+    except Exception as e:
+        result.error = e
+    result.elapsed = time.monotonic() - result.started_at
+    return result
+
+
+def run_fanout(
+    client: "GA4Client",
+    jobs: Iterable[FanoutJob],
+    *,
+    max_workers: int = 16,
+    max_per_property: int = 4,
+) -> Iterator[FanoutResult]:
+    """Run jobs on a thread pool and yield results in completion order.
+
+    A job is only dispatched while its property has fewer than
+    ``max_per_property`` calls in flight, so one slow property never ties up
+    the whole pool. Failures are reported on the result, not raised.
+    """
+    queues: Dict[str, Deque[FanoutJob]] = {}
+    for job in jobs:
+        queues.setdefault(str(job.property_id), deque()).append(job)
+    in_flight: Dict[str, int] = {key: 0 for key in queues}
+    running: Dict[Future[FanoutResult], str] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ga4-fanout") as pool:
+
+        def fill() -> None:
+            for key, queue in queues.items():
+                while queue and in_flight[key] < max_per_property and len(running) < max_workers:
+                    running[pool.submit(_timed, client, queue.popleft())] = key
+                    in_flight[key] += 1
+
+        fill()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                in_flight[running.pop(future)] -= 1
+            fill()
+            for future in done:
+                yield future.result()
+
+
+async def arun_fanout(
+    client: "AsyncGA4Client",
+    jobs: Iterable[FanoutJob],
+    *,
+    max_concurrency: int = 64,
+    max_per_property: int = 4,
+) -> AsyncIterator[FanoutResult]:
+    """Asyncio variant of ``run_fanout`` for ``AsyncGA4Client``.
+
+    Dispatch is the same: at most ``max_concurrency`` tasks exist at once, each
+    started only while its property is under ``max_per_property``.
+    """
+    queues: Dict[str, Deque[FanoutJob]] = {}
+    for job in jobs:
+        queues.setdefault(str(job.property_id), deque()).append(job)
+    in_flight: Dict[str, int] = {key: 0 for key in queues}
+    running: Dict["asyncio.Task[FanoutResult]", str] = {}
+
+    async def one(job: FanoutJob) -> FanoutResult:
+        result = FanoutResult(job, started_at=time.monotonic())
+        try:
+            result.response = await client.run_report(job.property_id, job.request)
+        except Exception as e:
+            result.error = e
+        result.elapsed = time.monotonic() - result.started_at
+        return result
+
+    def fill() -> None:
+        for key, queue in queues.items():
+            while queue and in_flight[key] < max_per_property and len(running) < max_concurrency:
+                running[asyncio.ensure_future(one(queue.popleft()))] = key
+                in_flight[key] += 1
+
+    try:
+        fill()
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                in_flight[running.pop(task)] -= 1
+            fill()
+            for task in done:
+                yield task.result()
+    finally:
+        for task in running:
+            task.cancel()
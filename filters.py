@@ -0,0 +1,62 @@
+"""GA ``Filter`` semantics evaluated locally, shared by every module that filters rows itself.
+
+``splitter`` and ``fusion`` test one value at a time with ``matches_filter``;
+``local_query`` applies ``string_predicate`` to a column's distinct values and
+the ``NUMERIC_OPS`` operators (which work on NumPy arrays too) to whole columns.
+"""
+from __future__ import annotations
+
+import operator
+import re
+from typing import Any, Callable, Dict
+
+from .api._requests import Filter, NumericFilter, StringFilter
+
+NUMERIC_OPS: Dict[str, Callable[[Any, Any], Any]] = {
+    "EQUAL": operator.eq,
+    "LESS_THAN": operator.lt,
+    "LESS_THAN_OR_EQUAL": operator.le,
+    "GREATER_THAN": operator.gt,
+    "GREATER_THAN_OR_EQUAL": operator.ge,
+}
+
+
+def numeric_target(nf: NumericFilter) -> float | int:
+    nv = nf.value
+    return float(nv.doubleValue) if nv.doubleValue is not None else int(nv.int64Value or 0)
+
+
+def numeric_op(nf: NumericFilter) -> Callable[[Any, Any], Any]:
+    try:
+        return NUMERIC_OPS[nf.operation]
+    except KeyError:
+        raise ValueError(f"unsupported numericFilter operation '{nf.operation}'") from None
+
+
+def string_predicate(sf: StringFilter) -> Callable[[str], bool]:
+    """Test for one dimension value, with GA's match type and case handling."""
+    match = sf.matchType
+    if match in ("FULL_REGEXP", "PARTIAL_REGEXP"):
+        pattern = re.compile(sf.value, 0 if sf.caseSensitive else re.IGNORECASE)
+        test = pattern.fullmatch if match == "FULL_REGEXP" else pattern.search
+        return lambda value: test(value) is not None
+    fold: Callable[[str], str] = (lambda v: v) if sf.caseSensitive else str.lower
+    target = fold(sf.value)
+    if match == "EXACT":
+        return lambda value: fold(value) == target
+    if match == "BEGINS_WITH":
+        return lambda value: fold(value).startswith(target)
+    if match == "ENDS_WITH":
+        return lambda value: fold(value).endswith(target)
+    if match == "CONTAINS":
+        return lambda value: target in fold(value)
+    raise ValueError(f"unsupported stringFilter matchType '{match}'")
+
+
+def matches_filter(value: str, flt: Filter) -> bool:
+    """Evaluate one GA ``Filter`` against a single dimension or metric value (as returned by GA)."""
+    if flt.numericFilter is not None:
+        return numeric_op(flt.numericFilter)(float(value or 0), numeric_target(flt.numericFilter))
+    if flt.stringFilter is None:
+        return True
+    return string_predicate(flt.stringFilter)(value)
@@ -0,0 +1,201 @@
+"""Fuse compatible report requests into fewer, wider API calls.
+
+Widgets often ask for the same rows (same dimensions, date ranges, ordering
+and metric filter) and differ only in their metrics or in a simple
+``dimensionFilter``. ``plan_fusion`` groups those requests and merges each
+group into as few ``RunReportRequest``s as GA's limits allow (10 metrics per
+call):
+
+- metrics are unioned, and packed into several calls when there are too many;
+- differing string ``dimensionFilter``s on a requested dimension are dropped
+  from the call and applied locally, row by row. Filters on any other field
+  stay server-side: adding the field as a dimension and summing back over it
+  would double-count metrics such as ``sessions`` that span many of its values.
+
+``FusionPlan.split`` projects each fused response back onto its original
+requests, dropping rows where all of a request's metrics are zero (GA's own
+behaviour for a narrower request). ``run_fused`` plans, sends every call in
+``batch_run_reports`` round-trips, pages fused calls to completion and splits.
+Requests with ``limit``/``offset`` or numeric dimension filters run unchanged.
+"""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .api._requests import FilterExpression, Metric, RunReportRequest
+from .api._responses import Row, RunReportResponse
+from .filters import matches_filter
+from .metadata import MAX_METRICS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import GA4Client
+
+
+@dataclass
+class FusedCall:
+    request: RunReportRequest
+    members: List[int]  # indices into FusionPlan.requests
+    local_filters: bool = False  # members' dimensionFilters are applied after the call
+
+    @property
+    def fused(self) -> bool:
+        return len(self.members) > 1 or self.local_filters
+
+
+@dataclass
+class FusionPlan:
+    requests: List[RunReportRequest]
+    calls: List[FusedCall]
+
+    @property
+    def saved_calls(self) -> int:
+        return len(self.requests) - len(self.calls)
+
+    def split(self, responses: List[RunReportResponse]) -> List[RunReportResponse]:
+        """Per-request results, in the order of ``requests``, from one response per call."""
+        if len(responses) != len(self.calls):
+            raise ValueError(f"expected {len(self.calls)} responses, got {len(responses)}")
+        out: List[Optional[RunReportResponse]] = [None] * len(self.requests)
+        for call, resp in zip(self.calls, responses):
+            for i in call.members:
+                out[i] = resp if not call.fused else _project(resp, self.requests[i], call.local_filters)
+        return out  # type: ignore[return-value]
+
+
+def _fusable_filter(expr: Optional[FilterExpression]) -> bool:
+    return expr is None or expr.filter is None or expr.filter.numericFilter is None
+
+
+def _group_key(req: RunReportRequest) -> str:
+    rest = req.model_dump(exclude={"dimensions", "metrics", "dimensionFilter"}, exclude_none=True)
+    rest["dimensions"] = sorted(d.name for d in req.dimensions)
+    return json.dumps(rest, sort_keys=True)
+
+
+def _filter_key(req: RunReportRequest) -> str:
+    return req.dimensionFilter.model_dump_json(exclude_none=True) if req.dimensionFilter else ""
+
+
+def _pack_metrics(members: List[int], requests: List[RunReportRequest]) -> List[Tuple[List[int], List[str]]]:
+    """First-fit-decreasing bins of requests whose metric union stays within ``MAX_METRICS``."""
+    bins: List[Tuple[List[int], List[str]]] = []
+    for i in sorted(members, key=lambda i: -len(requests[i].metrics)):
+        names = [m.name for m in requests[i].metrics]
+        for idx, names_in in bins:
+            extra = [n for n in dict.fromkeys(names) if n not in names_in]
+            if len(names_in) + len(extra) <= MAX_METRICS:
+                idx.append(i)
+                names_in.extend(extra)
+                break
+        else:
+            bins.append(([i], list(dict.fromkeys(names))))
+    return [(sorted(idx), names) for idx, names in bins]
+
+
+def _filters_on_dimensions(group: List[int], requests: List[RunReportRequest]) -> bool:
+    """Whether every member's filter is on one of the (shared) requested dimensions, so it can be applied per row."""
+    dims = {d.name for d in requests[group[0]].dimensions}
+    return all(
+        requests[i].dimensionFilter is None
+        or requests[i].dimensionFilter.filter is None  # type: ignore[union-attr]
+        or requests[i].dimensionFilter.filter.fieldName in dims  # type: ignore[union-attr]
+        for i in group
+    )
+
+
+def plan_fusion(requests: List[RunReportRequest], *, fuse_filters: bool = True) -> FusionPlan:
+    """Group ``requests`` into the fewest calls that can answer all of them."""
+    groups: Dict[str, List[int]] = {}
+    calls: List[FusedCall] = []
+    for i, req in enumerate(requests):
+        if req.limit is not None or req.offset is not None or not _fusable_filter(req.dimensionFilter):
+            calls.append(FusedCall(req, [i]))
+            continue
+        groups.setdefault(_group_key(req), []).append(i)
+
+    for group in groups.values():
+        same_filter = len({_filter_key(requests[i]) for i in group}) == 1
+        if same_filter or not fuse_filters or not _filters_on_dimensions(group, requests):
+            # keep each dimensionFilter server-side: fuse metrics within each filter
+            subgroups: Dict[str, List[int]] = {}
+            for i in group:
+                subgroups.setdefault(_filter_key(requests[i]), []).append(i)
+            parts = [(members, False) for members in subgroups.values()]
+        else:
+            parts = [(group, True)]
+
+        for members, local in parts:
+            base = requests[members[0]]
+            for idx, metric_names in _pack_metrics(members, requests):
+                if len(idx) == 1:
+                    calls.append(FusedCall(requests[idx[0]], idx))
+                    continue
+                fused = base.model_copy(
+                    update={
+                        "metrics": [Metric(name=n) for n in metric_names],
+                        "dimensionFilter": None if local else base.dimensionFilter,
+                    }
+                )
+                calls.append(FusedCall(fused, idx, local))
+    calls.sort(key=lambda c: c.members[0])
+    return FusionPlan(list(requests), calls)
+
+
+# ----- Local projection -----
+def _project(resp: RunReportResponse, req: RunReportRequest, local_filters: bool) -> RunReportResponse:
+    dim_at = {h.name: i for i, h in enumerate(resp.dimensionHeaders)}
+    met_at = {h.name: i for i, h in enumerate(resp.metricHeaders)}
+    dims = [dim_at[d.name] for d in req.dimensions]
+    mets = [met_at[m.name] for m in req.metrics]
+    flt = req.dimensionFilter.filter if local_filters and req.dimensionFilter is not None else None
+    flt_at = dim_at[flt.fieldName] if flt is not None else None
+
+    rows: List[Row] = []
+    for row in resp.rows:
+        if flt is not None and not matches_filter(row.dimensionValues[flt_at].get("value", ""), flt):  # type: ignore[index]
+            continue
+        metric_values = [row.metricValues[i] for i in mets]
+        if all(float(v.get("value") or 0) == 0 for v in metric_values):
+            continue
+        rows.append(Row.model_construct(dimensionValues=[row.dimensionValues[i] for i in dims], metricValues=metric_values))
+
+    return RunReportResponse.model_construct(
+        dimensionHeaders=[resp.dimensionHeaders[i] for i in dims],
+        metricHeaders=[resp.metricHeaders[i] for i in mets],
+        rows=rows,
+        totals=None,
+        metadata=resp.metadata,
+        rowCount=len(rows),
+        propertyQuota=resp.propertyQuota,
+    )
+
+
+# ----- Execution -----
+def run_fused(
+    client: "GA4Client",
+    property_id: str | int,
+    requests: List[RunReportRequest],
+    *,
+    page_size: int = 100_000,
+    fuse_filters: bool = True,
+) -> List[RunReportResponse]:
+    """Answer ``requests`` with as few round-trips as possible; results keep the input order."""
+    plan = plan_fusion(requests, fuse_filters=fuse_filters)
+    sent = [c.request.model_copy(update={"limit": page_size}) if c.fused else c.request for c in plan.calls]
+    if len(sent) == 1:
+        responses = [client.run_report(property_id, sent[0])]
+    else:
+        responses = client.batch_run_reports(property_id, sent)
+
+    for n, (call, resp) in enumerate(zip(plan.calls, responses)):
+        rows = list(resp.rows)
+        while call.fused and resp.rowCount is not None and len(rows) < resp.rowCount:
+            page = client.run_report(property_id, call.request.model_copy(update={"offset": len(rows), "limit": page_size}))
+            if not page.rows:
+                break
+            rows.extend(page.rows)
+        if len(rows) != len(resp.rows):
+            responses[n] = resp.model_copy(update={"rows": rows})
+    return plan.split(responses)
@@ -0,0 +1,212 @@
+"""Request instrumentation for ``GA4Client`` / ``AsyncGA4Client``.
+
+Register callbacks on a ``Hooks`` object and pass it as ``hooks=``. Each
+logical API call produces one ``RequestEvent``: ``on_request`` callbacks see
+it before the first attempt, ``on_response`` callbacks after the call has
+finished (successfully or not) with per-phase timings in ``spans``:
+
+- ``queue``: waiting for a ``QuotaScheduler`` permit
+- ``ttfb``: send until response headers (connect, TLS, server time)
+- ``transfer``: reading the response body
+- ``retry_sleep``: backoff between attempts
+- ``parse``: JSON decode and pydantic validation / columnar parse
+
+Without ``hooks`` the clients skip all of this. ``prometheus_hooks`` and
+``opentelemetry_hooks`` build ready-made exporters (optional dependencies).
+"""
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+_current: ContextVar[Optional["RequestEvent"]] = ContextVar("ga4_request_event", default=None)
+
+
+def current_event() -> Optional["RequestEvent"]:
+    """Event of the call in progress on this thread/task, if it is being traced."""
+    return _current.get()
+
+
+def endpoint_of(url: str) -> str:
+    """``runReport``, ``batchRunReports``, ``metadata``, ... from a Data API URL."""
+    tail = url.rsplit("/", 1)[-1]
+    return tail.rsplit(":", 1)[-1] if ":" in tail else tail
+
+
+@dataclass
+class RequestEvent:
+    method: str
+    url: str
+    property_id: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+    duration: float = 0.0
+    status: Optional[int] = None
+    attempts: int = 0
+    hedges: int = 0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    cache_hit: Optional[bool] = None
+    error: Optional[BaseException] = None
+    spans: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def endpoint(self) -> str:
+        return endpoint_of(self.url)
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+    def add_span(self, phase: str, seconds: float) -> None:
+        self.spans[phase] = self.spans.get(phase, 0.0) + seconds
+
+
+Callback = Callable[[RequestEvent], None]
+
+
+class Hooks:
+    def __init__(self) -> None:
+        self.request_callbacks: List[Callback] = []
+        self.response_callbacks: List[Callback] = []
+
+    def on_request(self, callback: Callback) -> Callback:
+        self.request_callbacks.append(callback)
+        return callback
+
+    def on_response(self, callback: Callback) -> Callback:
+        self.response_callbacks.append(callback)
+        return callback
+
+    def _start(self, method: str, url: str, property_id: Any) -> RequestEvent:
+        event = RequestEvent(method, url, None if property_id is None else str(property_id))
+        for cb in self.request_callbacks:
+            cb(event)
+        return event
+
+    def _finish(self, event: RequestEvent, began: float) -> None:
+        event.duration = time.perf_counter() - began
+        for cb in self.response_callbacks:
+            cb(event)
+
+    def trace(self, method: str, url: str, property_id: Any, fetch: Callable[[], bytes], parse: Callable[[bytes], T]) -> T:
+        event = self._start(method, url, property_id)
+        began = time.perf_counter()
+        token = _current.set(event)
+        try:
+            raw = fetch()
+            t0 = time.perf_counter()
+            result = parse(raw)
+            event.add_span("parse", time.perf_counter() - t0)
+            return result
+        except BaseException as e:
+            event.error = e
+            raise
+        finally:
+            _current.reset(token)
+            self._finish(event, began)
+
+    async def atrace(
+        self, method: str, url: str, property_id: Any, fetch: Callable[[], Awaitable[bytes]], parse: Callable[[bytes], T]
+    ) -> T:
+        event = self._start(method, url, property_id)
+        began = time.perf_counter()
+        token = _current.set(event)
+        try:
+            raw = await fetch()
+            t0 = time.perf_counter()
+            result = parse(raw)
+            event.add_span("parse", time.perf_counter() - t0)
+            return result
+        except BaseException as e:
+            event.error = e
+            raise
+        finally:
+            _current.reset(token)
+            self._finish(event, began)
+
+
+# ----- Exporters -----
+def prometheus_hooks(registry: Any = None, *, namespace: str = "ga4") -> Hooks:
+    """Hooks that record request/phase histograms and counters with ``prometheus_client``."""
+    try:
+        from prometheus_client import REGISTRY, Counter, Histogram  # type: ignore
+    except Exception as e:  # pragma: no cover
+        raise ImportError("prometheus_client is required for prometheus_hooks") from e
+
+    registry = registry or REGISTRY
+    duration = Histogram(f"{namespace}_request_seconds", "GA4 call latency", ["endpoint"], registry=registry)
+    phases = Histogram(f"{namespace}_request_phase_seconds", "GA4 call latency by phase", ["endpoint", "phase"], registry=registry)
+    calls = Counter(f"{namespace}_requests", "GA4 calls", ["endpoint", "status"], registry=registry)
+    retries = Counter(f"{namespace}_retries", "GA4 retry attempts", ["endpoint"], registry=registry)
+    hedges = Counter(f"{namespace}_hedges", "GA4 hedged duplicate requests", ["endpoint"], registry=registry)
+    transferred = Counter(f"{namespace}_bytes", "GA4 bytes on the wire", ["endpoint", "direction"], registry=registry)
+    cache = Counter(f"{namespace}_cache_lookups", "GA4 response cache lookups", ["endpoint", "result"], registry=registry)
+
+    hooks = Hooks()
+
+    @hooks.on_response
+    def record(event: RequestEvent) -> None:
+        ep = event.endpoint
+        duration.labels(ep).observe(event.duration)
+        for phase, seconds in event.spans.items():
+            phases.labels(ep, phase).observe(seconds)
+        status = "error" if event.status is None and event.error is not None else str(event.status or "cached")
+        calls.labels(ep, status).inc()
+        if event.retries:
+            retries.labels(ep).inc(event.retries)
+        if event.hedges:
+            hedges.labels(ep).inc(event.hedges)
+        transferred.labels(ep, "out").inc(event.bytes_out)
+        transferred.labels(ep, "in").inc(event.bytes_in)
+        if event.cache_hit is not None:
+            cache.labels(ep, "hit" if event.cache_hit else "miss").inc()
+
+    return hooks
+
+
+def opentelemetry_hooks(tracer: Any = None) -> Hooks:
+    """Hooks that emit one OpenTelemetry span per call, with a child span per phase."""
+    try:
+        from opentelemetry import trace  # type: ignore
+    except Exception as e:  # pragma: no cover
+        raise ImportError("opentelemetry-api is required for opentelemetry_hooks") from e
+
+    tracer = tracer or trace.get_tracer("ga4_sdk")
+    hooks = Hooks()
+
+    @hooks.on_response
+    def record(event: RequestEvent) -> None:
+        start_ns = int(event.started_at * 1e9)
+        end_ns = start_ns + int(event.duration * 1e9)
+        span = tracer.start_span(f"GA4 {event.endpoint}", start_time=start_ns)
+        span.set_attributes(
+            {
+                "http.request.method": event.method,
+                "url.full": event.url,
+                "ga4.property_id": event.property_id or "",
+                "http.response.status_code": event.status or 0,
+                "ga4.retries": event.retries,
+                "ga4.hedges": event.hedges,
+                "ga4.bytes_out": event.bytes_out,
+                "ga4.bytes_in": event.bytes_in,
+            }
+        )
+        if event.cache_hit is not None:
+            span.set_attribute("ga4.cache_hit", event.cache_hit)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(trace.Status(trace.StatusCode.ERROR))
+        # phases are cumulative durations, laid out back to back under the call span
+        ctx = trace.set_span_in_context(span)
+        cursor = start_ns
+        for phase, seconds in event.spans.items():
+            child = tracer.start_span(phase, context=ctx, start_time=cursor)
+            cursor += int(seconds * 1e9)
+            child.end(end_time=cursor)
+        span.end(end_time=end_ns)
+
+    return hooks
@@ -0,0 +1,160 @@
+"""Vectorised group-by/filter/order/limit over a ``ColumnarReport``.
+
+Re-slices data already fetched (e.g. a cached daily report rolled up to
+months) without another API call. The query is an ordinary
+``RunReportRequest``: ``dimensions`` are the group-by keys, ``metrics`` are
+aggregated, ``dimensionFilter`` applies before grouping and ``metricFilter``
+after it, then ``orderBys`` and ``offset``/``limit``. A single ``dateRanges``
+entry narrows the rows by the report's ``date`` column. Dimensions missing from
+the report can be derived from existing columns (``DERIVED_DIMENSIONS`` or
+``derive=``).
+"""
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Callable, Dict, Optional
+
+from .cache import resolve_date
+from .columnar import ColumnarReport, np, _require_numpy
+from .filters import numeric_op, numeric_target, string_predicate
+from .api._requests import FilterExpression, RunReportRequest, StringFilter
+from .api._responses import MetricHeader
+from .splitter import is_additive
+
+Derivation = Callable[[ColumnarReport], Any]
+
+
+def _date_prefix(width: int) -> Derivation:
+    # numpy truncates on narrowing string casts: "20250130" -> "2025" / "202501"
+    return lambda report: report["date"].astype(str).astype(f"U{width}").astype(object)
+
+
+def _iso_year_week(report: ColumnarReport) -> Any:
+    weeks = [date(int(v[:4]), int(v[4:6]), int(v[6:8])).isocalendar() for v in report["date"]]
+    return np.array([f"{y}{w:02d}" for y, w, _ in weeks], dtype=object)
+
+
+# GA4 date dimensions rebuilt from a YYYYMMDD ``date`` column
+DERIVED_DIMENSIONS: Dict[str, Derivation] = {
+    "year": _date_prefix(4),
+    "yearMonth": _date_prefix(6),
+    "isoYearIsoWeek": _iso_year_week,
+}
+
+
+def _string_mask(col: Any, sf: StringFilter) -> Any:
+    # dimension columns repeat heavily: test each distinct value once
+    uniq, inverse = np.unique(col.astype(str), return_inverse=True)
+    test = string_predicate(sf)
+    return np.fromiter((test(v) for v in uniq), dtype=bool, count=len(uniq))[inverse.reshape(-1)]
+
+
+def _field(columns: Dict[str, Any], name: str, use: str) -> Any:
+    try:
+        return columns[name]
+    except KeyError:
+        raise ValueError(f"{use} field '{name}' is not in the report or the requested fields") from None
+
+
+def _mask(columns: Dict[str, Any], expr: Optional[FilterExpression], n: int) -> Any:
+    if expr is None or expr.filter is None:
+        return np.ones(n, dtype=bool)
+    flt = expr.filter
+    col = _field(columns, flt.fieldName, "filter")
+    if flt.stringFilter is not None:
+        return _string_mask(col, flt.stringFilter)
+    if flt.numericFilter is not None:
+        op, target = numeric_op(flt.numericFilter), numeric_target(flt.numericFilter)
+        return op(col.astype(float) if col.dtype == object else col, target)
+    return np.ones(n, dtype=bool)
+
+
+def _date_mask(report: ColumnarReport, req: RunReportRequest, today: Optional[date]) -> Optional[Any]:
+    if not req.dateRanges:
+        return None
+    if len(req.dateRanges) != 1:
+        raise ValueError("local queries support a single date range")
+    if "date" not in report.columns:
+        raise ValueError("dateRanges needs a 'date' dimension in the report")
+    today = today or date.today()
+    rng = req.dateRanges[0]
+    start, end = (resolve_date(v, today).strftime("%Y%m%d") for v in (rng.startDate, rng.endDate))
+    days = report["date"].astype(str)  # YYYYMMDD compares like the dates it encodes
+    return (days >= start) & (days <= end)
+
+
+def query(
+    report: ColumnarReport,
+    req: RunReportRequest,
+    *,
+    derive: Optional[Dict[str, Derivation]] = None,
+    today: Optional[date] = None,
+) -> ColumnarReport:
+    """Answer ``req`` from ``report``; relative dates in ``dateRanges`` are resolved against ``today``."""
+    _require_numpy()
+    derivations = {**DERIVED_DIMENSIONS, **(derive or {})}
+    n = len(report)
+    columns = dict(report.columns)
+    for d in req.dimensions:
+        if d.name not in columns:
+            if d.name not in derivations:
+                raise ValueError(f"dimension '{d.name}' is not in the report and cannot be derived")
+            columns[d.name] = derivations[d.name](report)
+
+    headers = {name: MetricHeader(name=name, type=t) for name, t in zip(report.metric_names, report.metric_types)}
+    for m in req.metrics:
+        if m.name not in headers:
+            raise ValueError(f"metric '{m.name}' is not in the report")
+
+    keep = _mask(columns, req.dimensionFilter, n)
+    in_range = _date_mask(report, req, today)
+    if in_range is not None:
+        keep &= in_range
+    dims = [d.name for d in req.dimensions]
+    mets = [m.name for m in req.metrics]
+    filtered = {name: columns[name][keep] for name in dims + mets}
+    count = int(keep.sum())
+
+    # Group: one integer code per distinct dimension tuple
+    if dims and count:
+        codes = np.stack([np.unique(filtered[d], return_inverse=True)[1].reshape(-1) for d in dims], axis=1)
+        uniq, group = np.unique(codes, axis=0, return_index=False, return_inverse=True)
+        group = group.reshape(-1)
+        groups = len(uniq)
+    else:
+        group = np.zeros(count, dtype=np.intp)
+        groups = 1 if count else 0
+
+    out: Dict[str, Any] = {}
+    if groups == count:
+        order = np.argsort(group, kind="stable")
+        out = {name: filtered[name][order] for name in dims + mets}
+    else:
+        first = np.full(groups, count, dtype=np.intp)
+        np.minimum.at(first, group, np.arange(count))
+        for d in dims:
+            out[d] = filtered[d][first]
+        for m in mets:
+            if not is_additive(headers[m]):
+                raise ValueError(f"metric '{m}' is not additive and cannot be re-aggregated locally")
+            summed = np.bincount(group, weights=filtered[m], minlength=groups)
+            out[m] = summed.astype(filtered[m].dtype) if filtered[m].dtype == np.int64 else summed
+
+    size = groups
+    keep = _mask(out, req.metricFilter, size)
+    out = {name: col[keep] for name, col in out.items()}
+    size = int(keep.sum())
+
+    if req.orderBys and size:
+        keys = []
+        for ob in reversed(req.orderBys):
+            col = _field(out, ob.fieldName, "orderBy")
+            rank = np.unique(col, return_inverse=True)[1].reshape(-1) if col.dtype == object else col
+            keys.append(-rank if ob.desc else rank)
+        order = np.lexsort(keys)
+        out = {name: col[order] for name, col in out.items()}
+
+    start = req.offset or 0
+    stop = start + req.limit if req.limit is not None else None
+    out = {name: col[start:stop] for name, col in out.items()}
+    return ColumnarReport(dims, mets, [headers[m].type for m in mets], out, size)
@@ -0,0 +1,184 @@
+"""Per-property metadata cache and local validation of report requests.
+
+``MetadataService`` fetches ``/metadata`` once per property (then serves it
+from memory, or from ``cache_dir`` across processes, until ``ttl`` expires)
+and indexes dimensions and metrics by API name, including deprecated aliases.
+``validate`` checks a ``RunReportRequest`` (or ``RunPivotReportRequest``)
+against that index so typos fail locally instead of costing a round-trip and quota.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .api._exceptions import RequestValidationError
+from .api._requests import FilterExpression, Pivot, RunPivotReportRequest, RunReportRequest
+from .api._responses import DimensionMetadata, MetricMetadata, PropertyMetadata
+
+# runReport limits
+MAX_DIMENSIONS = 9
+MAX_METRICS = 10
+# runPivotReport: the product of all pivot limits
+MAX_PIVOT_CELLS = 100_000
+
+
+@dataclass
+class MetadataIndex:
+    dimensions: Dict[str, DimensionMetadata]
+    metrics: Dict[str, MetricMetadata]
+    fetched_at: float
+
+    @classmethod
+    def build(cls, meta: PropertyMetadata, fetched_at: float) -> "MetadataIndex":
+        dims: Dict[str, DimensionMetadata] = {}
+        for d in meta.dimensions:
+            for name in (d.apiName, *d.deprecatedApiNames):
+                dims[name] = d
+        mets: Dict[str, MetricMetadata] = {}
+        for m in meta.metrics:
+            for name in (m.apiName, *m.deprecatedApiNames):
+                mets[name] = m
+        return cls(dims, mets, fetched_at)
+
+
+def _filter_fields(expr: Optional[FilterExpression]) -> List[str]:
+    if expr is None or expr.filter is None:
+        return []
+    return [expr.filter.fieldName]
+
+
+def _pivot_problems(pivots: List[Pivot], dims: List[str], requested: set) -> List[str]:
+    problems: List[str] = []
+    used = [f for p in pivots for f in p.fieldNames]
+    for name in dict.fromkeys(used):
+        if name not in dims and name != "dateRange":
+            problems.append(f"pivot field '{name}' is not a requested dimension")
+    for name in dims:
+        if used.count(name) != 1:
+            problems.append(f"dimension '{name}' must appear in exactly one pivot")
+    for order in (o for p in pivots for o in p.orderBys or []):
+        if order.fieldName not in requested:
+            problems.append(f"pivot orderBys field '{order.fieldName}' is not in the requested dimensions/metrics")
+    cells = 1
+    for p in pivots:
+        cells *= p.limit
+    if cells > MAX_PIVOT_CELLS:
+        problems.append(f"pivot limits multiply to {cells}, at most {MAX_PIVOT_CELLS} allowed")
+    return problems
+
+
+def validate_request(index: MetadataIndex, req: RunReportRequest | RunPivotReportRequest) -> None:
+    """Raise ``RequestValidationError`` listing every problem found in ``req``."""
+    problems: List[str] = []
+    dims = [d.name for d in req.dimensions]
+    mets = [m.name for m in req.metrics]
+
+    if len(dims) > MAX_DIMENSIONS:
+        problems.append(f"{len(dims)} dimensions requested, at most {MAX_DIMENSIONS} allowed")
+    if len(mets) > MAX_METRICS:
+        problems.append(f"{len(mets)} metrics requested, at most {MAX_METRICS} allowed")
+    for kind, names in (("dimension", dims), ("metric", mets)):
+        dupes = sorted({n for n in names if names.count(n) > 1})
+        if dupes:
+            problems.append(f"duplicate {kind}s: {', '.join(dupes)}")
+
+    problems.extend(f"unknown dimension '{n}'" for n in dims if n not in index.dimensions)
+    problems.extend(f"unknown metric '{n}'" for n in mets if n not in index.metrics)
+    for n in mets:
+        meta = index.metrics.get(n)
+        if meta is not None and meta.blockedReasons:
+            problems.append(f"metric '{n}' is blocked: {', '.join(meta.blockedReasons)}")
+
+    for name in _filter_fields(req.dimensionFilter):
+        if name not in index.dimensions:
+            problems.append(f"dimensionFilter field '{name}' is not a dimension")
+    for name in _filter_fields(req.metricFilter):
+        if name not in index.metrics:
+            problems.append(f"metricFilter field '{name}' is not a metric")
+    requested = set(dims) | set(mets)
+    if isinstance(req, RunPivotReportRequest):
+        problems.extend(_pivot_problems(req.pivots, dims, requested))
+    else:
+        for order in req.orderBys or []:
+            if order.fieldName not in requested:
+                problems.append(f"orderBys field '{order.fieldName}' is not in the requested dimensions/metrics")
+
+    if problems:
+        raise RequestValidationError(problems)
+
+
+class MetadataService:
+    def __init__(
+        self,
+        fetch: Callable[[str | int], Dict[str, Any]],
+        *,
+        ttl: float = 24 * 3600,
+        cache_dir: Optional[str] = None,
+    ) -> None:
+        """``fetch`` is usually ``GA4Client.get_metadata``; one service can back many clients."""
+        self._fetch = fetch
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, MetadataIndex] = {}
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir or ".", f"metadata_{key}.json")
+
+    def _load_disk(self, key: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            return stored["metadata"], float(stored["fetched_at"])
+        except Exception:
+            return None
+
+    def _save_disk(self, key: str, data: Dict[str, Any], fetched_at: float) -> None:
+        if not self.cache_dir:
+            return
+        tmp = self._path(key) + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": fetched_at, "metadata": data}, f)
+            os.replace(tmp, self._path(key))
+        except Exception:
+            pass
+
+    def index(self, property_id: str | int) -> MetadataIndex:
+        key = str(property_id)
+        now = time.time()
+        index = self._indexes.get(key)
+        if index is not None and now - index.fetched_at < self.ttl:
+            return index
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None and now - index.fetched_at < self.ttl:
+                return index
+            stored = self._load_disk(key)
+            if stored is not None and now - stored[1] < self.ttl:
+                data, fetched_at = stored
+            else:
+                data, fetched_at = self._fetch(property_id), now
+                self._save_disk(key, data, fetched_at)
+            index = self._indexes[key] = MetadataIndex.build(PropertyMetadata.model_validate(data), fetched_at)
+            return index
+
+    def invalidate(self, property_id: str | int) -> None:
+        with self._lock:
+            self._indexes.pop(str(property_id), None)
+            if self.cache_dir:
+                try:
+                    os.remove(self._path(str(property_id)))
+                except OSError:
+                    pass
+
+    def validate(self, property_id: str | int, req: RunReportRequest | RunPivotReportRequest) -> None:
+        validate_request(self.index(property_id), req)
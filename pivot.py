@@ -0,0 +1,87 @@
+"""Reshape ``runPivotReport`` results into dense NumPy arrays.
+
+A pivot response is a flat list of rows plus, per pivot, the ordered value
+combinations GA kept (``pivotHeaders``). ``pivot_matrix`` lays the rows out on
+one axis per pivot in that header order, so a two-pivot request becomes a
+rows x columns matrix per metric. Combinations GA did not return are NaN.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .columnar import _require_numpy, np
+from .api._requests import RunPivotReportRequest
+from .api._responses import RunPivotReportResponse
+
+Label = Tuple[str, ...]
+
+
+@dataclass
+class PivotMatrix:
+    fields: List[List[str]]  # fieldNames of each pivot
+    labels: List[List[Label]]  # value combinations along each pivot axis, in header order
+    metrics: List[str]
+    values: Any  # float64, shape (len(labels[0]), ..., len(labels[-1]), len(metrics))
+
+    def matrix(self, metric: Optional[str] = None) -> Any:
+        """Values of one metric (default: the first), one axis per pivot."""
+        return self.values[..., self.metrics.index(metric) if metric else 0]
+
+    def to_pandas(self, metric: Optional[str] = None) -> Any:
+        """Two-pivot cross-tab as a DataFrame: first pivot on the index, second on the columns."""
+        if len(self.fields) != 2:
+            raise ValueError("to_pandas needs exactly two pivots; use matrix() for other shapes")
+        try:
+            import pandas as pd  # type: ignore
+        except Exception as e:  # pragma: no cover
+            raise ImportError("pandas is required for to_pandas") from e
+
+        def index(axis: int) -> Any:
+            labels, names = self.labels[axis], self.fields[axis]
+            if len(names) == 1:
+                return pd.Index([label[0] for label in labels], name=names[0])
+            return pd.MultiIndex.from_tuples(labels, names=names)
+
+        return pd.DataFrame(self.matrix(metric), index=index(0), columns=index(1))
+
+
+def _values(cells: List[dict]) -> Label:
+    return tuple(cell.get("value", "") for cell in cells)
+
+
+def pivot_matrix(resp: RunPivotReportResponse, req: RunPivotReportRequest) -> PivotMatrix:
+    """Dense array of ``resp`` laid out along the pivots of ``req`` (which names each pivot's fields)."""
+    _require_numpy()
+    if len(resp.pivotHeaders) != len(req.pivots):
+        raise ValueError(f"response has {len(resp.pivotHeaders)} pivot headers, request has {len(req.pivots)} pivots")
+    fields = [list(p.fieldNames) for p in req.pivots]
+    labels = [[_values(h.dimensionValues) for h in header.pivotDimensionHeaders] for header in resp.pivotHeaders]
+    positions: List[Dict[Label, int]] = [{label: i for i, label in enumerate(axis)} for axis in labels]
+    dim_index = {h.name: i for i, h in enumerate(resp.dimensionHeaders)}
+    try:
+        columns = [[dim_index[f] for f in names] for names in fields]
+    except KeyError as e:
+        raise ValueError(f"pivot field {e.args[0]!r} is not among the response dimensions") from None
+    metrics = [h.name for h in resp.metricHeaders]
+
+    coords: List[List[int]] = [[] for _ in fields]
+    flat: List[str] = []
+    for row in resp.rows:
+        dims = row.dimensionValues
+        at = []
+        for cols, pos in zip(columns, positions):
+            i = pos.get(tuple(dims[c].get("value", "") for c in cols))
+            if i is None:  # outside this pivot's limit/offset
+                break
+            at.append(i)
+        else:
+            for axis, i in zip(coords, at):
+                axis.append(i)
+            flat.extend(cell.get("value", "") for cell in row.metricValues)
+
+    values = np.full(tuple(len(axis) for axis in labels) + (len(metrics),), np.nan)
+    if flat:
+        cells = np.asarray(flat, dtype=np.float64).reshape(-1, len(metrics))
+        values[tuple(np.asarray(axis, dtype=np.intp) for axis in coords)] = cells
+    return PivotMatrix(fields, labels, metrics, values)
@@ -0,0 +1,96 @@
+"""Registry of live clients keyed by credential.
+
+Reusing a ``GA4Client`` reuses its ``requests.Session`` and so its keep-alive
+connections to analyticsdata.googleapis.com. ``ClientPool`` keeps at most
+``max_clients`` of them (least recently used goes first) and drops any that
+sat idle longer than ``idle_ttl``. A dropped client is closed once it has been
+idle for ``idle_ttl`` and is not checked out through ``lease``.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .config import HTTP_SETTINGS
+from .client import GA4Client
+
+
+def _token_key(token: str) -> str:
+    # never keep raw bearer tokens around as dict keys
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class ClientPool:
+    def __init__(
+        self,
+        *,
+        max_clients: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+        factory: Callable[[str], GA4Client] = lambda token: GA4Client(access_token=token),
+    ) -> None:
+        self.max_clients = max_clients or HTTP_SETTINGS.client_pool_size
+        self.idle_ttl = idle_ttl if idle_ttl is not None else HTTP_SETTINGS.client_idle_ttl
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._clients: "OrderedDict[str, Tuple[GA4Client, float]]" = OrderedDict()
+        self._retired: List[Tuple[GA4Client, float]] = []  # dropped, not yet closed
+        self._leases: Dict[GA4Client, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get(self, token: str) -> GA4Client:
+        with self._lock:
+            return self._checkout(token, time.monotonic())
+
+    @contextmanager
+    def lease(self, token: str) -> Iterator[GA4Client]:
+        """``get``, with the client kept open until the block exits even if the pool drops it meanwhile."""
+        with self._lock:
+            client = self._checkout(token, time.monotonic())
+            self._leases[client] = self._leases.get(client, 0) + 1
+        try:
+            yield client
+        finally:
+            with self._lock:
+                self._leases[client] -= 1
+                if not self._leases[client]:
+                    del self._leases[client]
+                self._evict_idle(time.monotonic())
+
+    def _checkout(self, token: str, now: float) -> GA4Client:
+        key = _token_key(token)
+        self._evict_idle(now)
+        entry = self._clients.pop(key, None)
+        client = entry[0] if entry else self._factory(token)
+        self._clients[key] = (client, now)
+        while len(self._clients) > self.max_clients:
+            # may still be serving a request: closed with the idle ones, once it is idle too
+            self._retired.append(self._clients.popitem(last=False)[1])
+        return client
+
+    def _evict_idle(self, now: float) -> None:
+        while self._clients:
+            key, (client, last_used) = next(iter(self._clients.items()))
+            if now - last_used <= self.idle_ttl:
+                break
+            del self._clients[key]
+            self._retired.append((client, last_used))
+        busy = []
+        for client, last_used in self._retired:
+            if client in self._leases or now - last_used <= self.idle_ttl:
+                busy.append((client, last_used))
+            else:
+                client.close()
+        self._retired = busy
+
+    def clear(self) -> None:
+        with self._lock:
+            for client, _ in [*self._clients.values(), *self._retired]:
+                client.close()
+            self._clients.clear()
+            self._retired.clear()
@@ -0,0 +1,197 @@
+"""Client-side GA4 quota scheduler.
+
+``QuotaScheduler`` hands out permits before a request is sent so workers stay
+under the property quotas instead of discovering them through 429s. It keeps
+per property:
+
+- a token bucket sized to the tokens-per-hour quota, refilled continuously and
+  reset to GA's ``remaining`` whenever a response carries ``propertyQuota``
+  (``returnPropertyQuota=True`` on the request), whose per-request ``consumed``
+  also tunes the estimated cost of a call;
+- a cap on concurrent requests;
+- a pause deadline set when GA answers 429, shared by every waiter.
+
+Waiters are served lowest ``priority`` first, then FIFO. The same scheduler
+can be used from threads (``acquire``) and asyncio tasks (``acquire_async``).
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Iterator, List, Tuple
+
+from .api._responses import PropertyQuota
+
+# Analytics standard-property defaults
+DEFAULT_TOKENS_PER_HOUR = 40_000
+DEFAULT_CONCURRENT_REQUESTS = 10
+
+
+@dataclass
+class _PropertyState:
+    capacity: float
+    tokens: float
+    concurrent: int
+    in_flight: int = 0
+    updated: float = field(default_factory=time.monotonic)
+    paused_until: float = 0.0
+    cost: float = 10.0  # running estimate of tokens charged per request
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.capacity / 3600.0)
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until a request could go out (0 = now); ``inf`` when only a release can help."""
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.in_flight >= self.concurrent:
+            return float("inf")
+        if self.tokens >= self.cost:
+            return 0.0
+        return (self.cost - self.tokens) * 3600.0 / self.capacity
+
+
+class QuotaScheduler:
+    def __init__(
+        self,
+        *,
+        tokens_per_hour: int = DEFAULT_TOKENS_PER_HOUR,
+        concurrent_requests: int = DEFAULT_CONCURRENT_REQUESTS,
+        poll_interval: float = 0.05,
+    ) -> None:
+        self.tokens_per_hour = tokens_per_hour
+        self.concurrent_requests = concurrent_requests
+        self.poll_interval = poll_interval
+        self._cond = threading.Condition()
+        self._states: Dict[str, _PropertyState] = {}
+        self._waiting: Dict[str, List[Tuple[int, int]]] = {}
+        self._seq = itertools.count()
+
+    def _state(self, key: str) -> _PropertyState:
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _PropertyState(
+                float(self.tokens_per_hour), float(self.tokens_per_hour), self.concurrent_requests
+            )
+        return state
+
+    # ----- Permits -----
+    def _enqueue(self, key: str, priority: int) -> Tuple[int, int]:
+        ticket = (priority, next(self._seq))
+        heapq.heappush(self._waiting.setdefault(key, []), ticket)
+        return ticket
+
+    def _try_grant(self, key: str, ticket: Tuple[int, int]) -> float:
+        """Grant the permit if ``ticket`` is first in line and quota allows; else return the wait hint."""
+        state = self._state(key)
+        now = time.monotonic()
+        state.refill(now)
+        if self._waiting[key][0] != ticket:
+            return self.poll_interval
+        wait = state.wait_time(now)
+        if wait == 0.0:
+            heapq.heappop(self._waiting[key])
+            state.tokens -= state.cost
+            state.in_flight += 1
+            self._cond.notify_all()
+        return wait
+
+    def _abandon(self, key: str, ticket: Tuple[int, int]) -> None:
+        queue = self._waiting[key]
+        if ticket in queue:
+            queue.remove(ticket)
+            heapq.heapify(queue)
+            self._cond.notify_all()
+
+    def _release(self, key: str) -> None:
+        with self._cond:
+            self._state(key).in_flight -= 1
+            self._cond.notify_all()
+
+    def try_acquire(self, property_id: str | int) -> bool:
+        """Take (and charge) a permit only if one is free now and nobody is queued; pair with ``release``."""
+        key = str(property_id)
+        with self._cond:
+            state = self._state(key)
+            now = time.monotonic()
+            state.refill(now)
+            if self._waiting.get(key) or state.wait_time(now) != 0.0:
+                return False
+            state.tokens -= state.cost
+            state.in_flight += 1
+            return True
+
+    def release(self, property_id: str | int) -> None:
+        self._release(str(property_id))
+
+    @contextmanager
+    def acquire(self, property_id: str | int, *, priority: int = 0) -> Iterator[None]:
+        key = str(property_id)
+        with self._cond:
+            ticket = self._enqueue(key, priority)
+            try:
+                while True:
+                    wait = self._try_grant(key, ticket)
+                    if wait == 0.0:
+                        break
+                    self._cond.wait(timeout=None if wait == float("inf") else wait)
+            except BaseException:
+                self._abandon(key, ticket)
+                raise
+        try:
+            yield
+        finally:
+            self._release(key)
+
+    @asynccontextmanager
+    async def acquire_async(self, property_id: str | int, *, priority: int = 0) -> AsyncIterator[None]:
+        import asyncio  # deferred: sync-only workers never load the event loop machinery
+
+        key = str(property_id)
+        with self._cond:
+            ticket = self._enqueue(key, priority)
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_grant(key, ticket)
+                if wait == 0.0:
+                    break
+                await asyncio.sleep(min(wait, self.poll_interval))
+        except BaseException:
+            with self._cond:
+                self._abandon(key, ticket)
+            raise
+        try:
+            yield
+        finally:
+            self._release(key)
+
+    # ----- Feedback from GA -----
+    def pause(self, property_id: str | int, seconds: float) -> None:
+        """Hold every waiter for ``property_id`` (called on 429 so workers back off together, once)."""
+        with self._cond:
+            state = self._state(str(property_id))
+            state.paused_until = max(state.paused_until, time.monotonic() + seconds)
+
+    def observe(self, property_id: str | int, quota: PropertyQuota) -> None:
+        """Re-sync local state with the ``propertyQuota`` block of a response."""
+        with self._cond:
+            state = self._state(str(property_id))
+            state.refill(time.monotonic())
+            hourly = quota.tokensPerHour
+            if hourly is not None and hourly.consumed:
+                # ``consumed`` is what this one request was charged, not an hourly running total
+                state.cost = 0.8 * state.cost + 0.2 * hourly.consumed
+            if hourly is not None and hourly.remaining is not None:
+                # GA's figure covers every client of the property; keep our own unanswered permits charged
+                state.capacity = max(float(self.tokens_per_hour), float(hourly.remaining))
+                state.tokens = float(hourly.remaining) - state.in_flight * state.cost
+            concurrent = quota.concurrentRequests
+            if concurrent is not None and concurrent.consumed is not None and concurrent.remaining is not None:
+                state.concurrent = max(1, concurrent.consumed + concurrent.remaining)
+            self._cond.notify_all()
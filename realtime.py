@@ -0,0 +1,73 @@
+"""Adaptive realtime polling that yields only what changed between snapshots."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Tuple
+
+from .api._requests import RealtimeReportRequest
+from .api._responses import RealtimeReportResponse, Row
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .async_client import AsyncGA4Client
+
+RowKey = Tuple[str, ...]
+
+
+def row_key(row: Row) -> RowKey:
+    return tuple(v.get("value", "") for v in row.dimensionValues)
+
+
+@dataclass
+class RealtimeDiff:
+    added: Dict[RowKey, Row] = field(default_factory=dict)
+    changed: Dict[RowKey, Row] = field(default_factory=dict)
+    removed: Dict[RowKey, Row] = field(default_factory=dict)  # rows as last seen
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def diff_rows(previous: Dict[RowKey, Row], rows: List[Row]) -> Tuple[RealtimeDiff, Dict[RowKey, Row]]:
+    """Compare a new snapshot against the previous index; return the diff and the new index."""
+    current = {row_key(r): r for r in rows}
+    diff = RealtimeDiff()
+    for key, row in current.items():
+        old = previous.get(key)
+        if old is None:
+            diff.added[key] = row
+        elif old.metricValues != row.metricValues:
+            diff.changed[key] = row
+    for key, row in previous.items():
+        if key not in current:
+            diff.removed[key] = row
+    return diff, current
+
+
+async def stream_realtime(
+    client: "AsyncGA4Client",
+    property_id: str | int,
+    req: RealtimeReportRequest,
+    *,
+    interval: float = 5.0,
+    max_interval: float = 60.0,
+    backoff: float = 2.0,
+) -> AsyncIterator[RealtimeDiff]:
+    """Poll ``run_realtime_report`` forever, yielding a ``RealtimeDiff`` whenever rows change.
+
+    The first snapshot arrives as all-added. While nothing changes the poll
+    interval grows by ``backoff`` up to ``max_interval``; any change resets it.
+    """
+    index: Dict[RowKey, Row] = {}
+    delay = interval
+    first = True
+    while True:
+        snapshot: RealtimeReportResponse = await client.run_realtime_report(property_id, req)
+        diff, index = diff_rows(index, snapshot.rows)
+        if diff or first:
+            first = False
+            delay = interval
+            yield diff
+        else:
+            delay = min(delay * backoff, max_interval)
+        await asyncio.sleep(delay)
@@ -0,0 +1,223 @@
+"""Tail-latency controls: hedged requests and per-endpoint circuit breakers.
+
+``HedgePolicy`` tracks recent latencies per endpoint (``runReport``,
+``batchRunReports``, ...). Once a call has been in flight longer than the
+chosen percentile, it sends one duplicate and returns whichever response
+arrives first. GA report calls are read-only, so a duplicate is safe, but it
+does cost quota. Keep ``percentile`` high so only the slow tail is hedged.
+
+``CircuitBreaker`` counts consecutive upstream failures (5xx and network
+errors) per endpoint; a 429 is one property's quota and is neither a failure
+nor a success. After ``failure_threshold`` failures it opens and calls fail
+fast with ``CircuitOpenError`` for ``recovery_time`` seconds. It then
+lets ``half_open_max`` probe calls through, and one success closes it again.
+A probe abandoned before it reports (cancelled, or failing before the request
+is sent) must hand its slot back with ``release``.
+
+Both are thread-safe and can be shared by many clients, sync and async.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from .api._exceptions import CircuitOpenError
+
+
+class HedgePolicy:
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 200,
+        min_delay: float = 0.05,
+        max_workers: int = 16,
+    ) -> None:
+        if not 0.0 < percentile < 1.0:
+            raise ValueError("percentile must be between 0 and 1")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self._window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self._window)
+            samples.append(seconds)
+
+    def delay_for(self, endpoint: str) -> Optional[float]:
+        """Seconds to wait before hedging, or ``None`` while there are too few samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return max(self.min_delay, samples[min(len(samples) - 1, int(self.percentile * len(samples)))])
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="ga4-hedge")
+            return self._pool
+
+    def _timed(self, endpoint: str, send: Callable[[], Any]) -> Callable[[], Any]:
+        def run() -> Any:
+            began = time.perf_counter()
+            resp = send()
+            self.record(endpoint, time.perf_counter() - began)
+            return resp
+
+        return run
+
+    def run(
+        self,
+        endpoint: str,
+        send: Callable[[], Any],
+        *,
+        admit: Optional[Callable[[], bool]] = None,
+        release: Optional[Callable[[], None]] = None,
+    ) -> Tuple[Any, bool]:
+        """Call ``send`` (hedged once if it is slow); returns ``(response, hedged)``.
+
+        ``admit`` takes a rate-limit permit for the duplicate without blocking (no permit, no
+        hedge) and ``release`` returns it once the duplicate finishes. The losing request is
+        left to finish in the background and its response is dropped.
+        """
+        delay = self.delay_for(endpoint)
+        if delay is None:
+            return self._timed(endpoint, send)(), False
+        pool = self._executor()
+        first = pool.submit(self._timed(endpoint, send))
+        done, _ = wait([first], timeout=delay)
+        if done or (admit is not None and not admit()):
+            return first.result(), False
+        second = pool.submit(self._timed(endpoint, send))
+        if release is not None:
+            second.add_done_callback(lambda _: release())
+        pending: set[Future[Any]] = {first, second}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next(iter(done))
+            if winner.exception() is None or not pending:
+                return winner.result(), True
+
+    async def arun(
+        self,
+        endpoint: str,
+        send: Callable[[], Awaitable[Any]],
+        *,
+        admit: Optional[Callable[[], Awaitable[bool]]] = None,
+        release: Optional[Callable[[], None]] = None,
+    ) -> Tuple[Any, bool]:
+        """Async ``run``; the losing request is cancelled."""
+        import asyncio  # deferred: keeps sync-only imports light
+
+        async def timed() -> Any:
+            began = time.perf_counter()
+            resp = await send()
+            self.record(endpoint, time.perf_counter() - began)
+            return resp
+
+        delay = self.delay_for(endpoint)
+        if delay is None:
+            return await timed(), False
+        first = asyncio.ensure_future(timed())
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done or (admit is not None and not await admit()):
+            return await first, False
+        second = asyncio.ensure_future(timed())
+        if release is not None:
+            second.add_done_callback(lambda _: release())
+        pending = {first, second}
+        try:
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next(iter(done))
+                if winner.exception() is None or not pending:
+                    return winner.result(), True
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+
+
+@dataclass
+class _Circuit:
+    failures: int = 0
+    opened_at: Optional[float] = None
+    probes: int = 0
+
+
+class CircuitBreaker:
+    def __init__(self, *, failure_threshold: int = 5, recovery_time: float = 30.0, half_open_max: int = 1) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.half_open_max = half_open_max
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, endpoint: str) -> str:
+        """``closed``, ``open`` or ``half_open``."""
+        with self._lock:
+            c = self._circuits.get(endpoint)
+            if c is None or c.opened_at is None:
+                return "closed"
+            return "open" if time.monotonic() - c.opened_at < self.recovery_time else "half_open"
+
+    def before(self, endpoint: str) -> Optional[float]:
+        """Admit a call or raise ``CircuitOpenError``; while half-open only ``half_open_max`` probes pass.
+
+        Returns a probe token for ``release`` when the call took a half-open slot, else ``None``.
+        """
+        with self._lock:
+            c = self._circuits.get(endpoint)
+            if c is None or c.opened_at is None:
+                return None
+            remaining = self.recovery_time - (time.monotonic() - c.opened_at)
+            if remaining <= 0 and c.probes < self.half_open_max:
+                c.probes += 1
+                return c.opened_at
+        raise CircuitOpenError(endpoint, max(remaining, 0.0))
+
+    def check(self, endpoint: str) -> None:
+        """Raise ``CircuitOpenError`` while open, without taking a half-open slot."""
+        with self._lock:
+            c = self._circuits.get(endpoint)
+            if c is None or c.opened_at is None:
+                return
+            remaining = self.recovery_time - (time.monotonic() - c.opened_at)
+        if remaining > 0:
+            raise CircuitOpenError(endpoint, remaining)
+
+    def release(self, endpoint: str, token: Optional[float]) -> None:
+        """Return a probe slot taken by ``before``; a no-op once the probe's outcome was recorded."""
+        if token is None:
+            return
+        with self._lock:
+            c = self._circuits.get(endpoint)
+            if c is not None and c.opened_at == token and c.probes > 0:
+                c.probes -= 1
+
+    def record(self, endpoint: str, ok: bool) -> None:
+        with self._lock:
+            c = self._circuits.setdefault(endpoint, _Circuit())
+            if ok:
+                c.failures, c.opened_at, c.probes = 0, None, 0
+                return
+            c.failures += 1
+            if c.opened_at is not None or c.failures >= self.failure_threshold:
+                # a failed probe re-opens for another full recovery period
+                c.opened_at, c.probes = time.monotonic(), 0
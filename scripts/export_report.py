@@ -0,0 +1,62 @@
+"""Export a GA4 report to NDJSON, CSV or Parquet with streaming writes.
+
+Example:
+  python -m google_analytics.scripts.export_report --dimensions date,pagePath \
+      --metrics screenPageViews --last-n-days 365 --format parquet --out views.parquet
+"""
+from __future__ import annotations
+
+import argparse
+import os
+
+from ..client import GA4Client
+from ..config import SCOPE_ANALYTICS_READONLY
+from ..api.utils import build_run_report_request
+from ..export import export_report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--property", default=os.getenv("GA_PROPERTY_ID"), help="GA4 property id (default: GA_PROPERTY_ID)")
+    parser.add_argument("--dimensions", required=True, help="comma-separated dimension names")
+    parser.add_argument("--metrics", required=True, help="comma-separated metric names")
+    parser.add_argument("--start-date")
+    parser.add_argument("--end-date")
+    parser.add_argument("--last-n-days", type=int, help="relative window, so a checkpointed rerun resumes it on a later day")
+    parser.add_argument("--limit", type=int, help="max rows to export")
+    parser.add_argument("--format", choices=["ndjson", "csv", "parquet"], default="ndjson")
+    parser.add_argument("--compression", help="gzip for ndjson/csv; snappy, zstd, gzip, ... for parquet")
+    parser.add_argument("--page-size", type=int, default=10_000)
+    parser.add_argument("--buffer-rows", type=int, default=100_000)
+    parser.add_argument("--checkpoint", help="checkpoint file; rerun with the same arguments to resume")
+    parser.add_argument("--out", required=True)
+    args = parser.parse_args()
+
+    if not args.property:
+        raise SystemExit("Pass --property or set GA_PROPERTY_ID in environment")
+
+    client = GA4Client.from_service_account(scopes=[SCOPE_ANALYTICS_READONLY])
+    req = build_run_report_request(
+        dimensions=args.dimensions.split(","),
+        metrics=args.metrics.split(","),
+        start_date=f"{args.last_n_days}daysAgo" if args.last_n_days is not None else args.start_date,
+        end_date="today" if args.last_n_days is not None else args.end_date,
+        limit=args.limit,
+    )
+    result = export_report(
+        client,
+        args.property,
+        req,
+        args.out,
+        format=args.format,
+        compression=args.compression,
+        page_size=args.page_size,
+        buffer_rows=args.buffer_rows,
+        checkpoint_path=args.checkpoint,
+    )
+    resumed = f" (resumed after {result.resumed_from})" if result.resumed_from else ""
+    print(f"Exported {result.rows} rows to {result.path}{resumed}")
+
+
+if __name__ == "__main__":
+    main()
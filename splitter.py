@@ -0,0 +1,258 @@
+"""Split a long ``dateRanges`` window into sub-ranges, run them in parallel, merge the rows.
+
+Windows are per day, week or month, or chosen adaptively from the full
+range's ``rowCount`` so each sub-report stays under ``target_rows``. Rows with
+the same dimension values in several windows (e.g. no ``date`` dimension) are
+re-aggregated: additive metrics are summed. Anything else (distinct user
+counts, rates, averages, and any metric not in ``ADDITIVE_METRICS`` unless the
+caller vouches for it with ``additive=``) cannot be, and raises ``ValueError``
+before any window is fetched. ``metricFilter``, ``orderBys`` and
+``offset``/``limit`` apply to the merged rows, not per window.
+"""
+from __future__ import annotations
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Dict, Iterable, List, Literal, Optional, Set, Tuple
+
+from .api._requests import DateRange, FilterExpression, RunReportRequest
+from .api._responses import MetricHeader, Row, RunReportResponse
+from .cache import resolve_date
+from .filters import matches_filter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import GA4Client
+
+Granularity = Literal["day", "week", "month", "auto"]
+
+# Counts of events/sessions and money/time sums: a row's value over disjoint windows is the
+# sum of its per-window values. Everything else (distinct users, rates, averages) is not.
+ADDITIVE_METRICS = frozenset(
+    {
+        "addToCarts",
+        "adUnitExposure",
+        "advertiserAdClicks",
+        "advertiserAdCost",
+        "advertiserAdImpressions",
+        "checkouts",
+        "conversions",
+        "ecommercePurchases",
+        "engagedSessions",
+        "eventCount",
+        "eventValue",
+        "grossItemRevenue",
+        "grossPurchaseRevenue",
+        "itemDiscountAmount",
+        "itemListClickEvents",
+        "itemListViewEvents",
+        "itemRefundAmount",
+        "itemRevenue",
+        "itemsAddedToCart",
+        "itemsCheckedOut",
+        "itemsClickedInList",
+        "itemsClickedInPromotion",
+        "itemsPurchased",
+        "itemsViewed",
+        "itemsViewedInList",
+        "itemsViewedInPromotion",
+        "keyEvents",
+        "newUsers",
+        "organicGoogleSearchClicks",
+        "organicGoogleSearchImpressions",
+        "promotionClicks",
+        "promotionViews",
+        "publisherAdClicks",
+        "publisherAdImpressions",
+        "purchaseRevenue",
+        "refundAmount",
+        "screenPageViews",
+        "sessions",
+        "shippingAmount",
+        "taxAmount",
+        "totalAdRevenue",
+        "totalRevenue",
+        "transactions",
+        "userEngagementDuration",
+    }
+)
+# One row per day or finer: rows of different windows never share dimension values.
+_DAY_DIMENSIONS = {"date", "dateHour", "dateHourMinute"}
+
+
+def is_additive(header: MetricHeader, additive: Optional[Set[str]] = None) -> bool:
+    """Whether ``header``'s values can be summed across windows; ``additive`` overrides the known list."""
+    if additive is not None:
+        return header.name in additive
+    return header.name.split(":", 1)[0] in ADDITIVE_METRICS  # keyEvents:purchase counts like keyEvents
+
+
+def split_date_range(start: date, end: date, granularity: Granularity, *, days: int = 1) -> List[Tuple[date, date]]:
+    """Consecutive inclusive windows covering ``start..end``. ``auto`` uses ``days`` per window."""
+    windows: List[Tuple[date, date]] = []
+    cursor = start
+    while cursor <= end:
+        if granularity == "day":
+            stop = cursor
+        elif granularity == "week":
+            stop = cursor + timedelta(days=6 - cursor.weekday())
+        elif granularity == "month":
+            next_month = (cursor.replace(day=1) + timedelta(days=32)).replace(day=1)
+            stop = next_month - timedelta(days=1)
+        else:
+            stop = cursor + timedelta(days=days - 1)
+        stop = min(stop, end)
+        windows.append((cursor, stop))
+        cursor = stop + timedelta(days=1)
+    return windows
+
+
+def _fetch_all(client: "GA4Client", property_id: str | int, req: RunReportRequest, page_size: int) -> RunReportResponse:
+    first = client.run_report(property_id, req.model_copy(update={"offset": 0, "limit": page_size}))
+    rows = list(first.rows)
+    while first.rowCount is not None and len(rows) < first.rowCount:
+        page = client.run_report(property_id, req.model_copy(update={"offset": len(rows), "limit": page_size}))
+        if not page.rows:
+            break
+        rows.extend(page.rows)
+    return first.model_copy(update={"rows": rows, "rowCount": len(rows)})
+
+
+def merge_reports(parts: Iterable[RunReportResponse], *, additive: Optional[Set[str]] = None) -> RunReportResponse:
+    """Merge sub-range reports with identical headers into one, summing additive metrics on key collisions."""
+    parts = list(parts)
+    if not parts:
+        raise ValueError("merge_reports() needs at least one report")
+    headers = parts[0].metricHeaders
+    sums = [is_additive(h, additive) for h in headers]
+    integer = [h.type == "TYPE_INTEGER" for h in headers]
+
+    merged: Dict[Tuple[str, ...], List[float]] = {}
+    dims: Dict[Tuple[str, ...], List[dict]] = {}
+    raw: Dict[Tuple[str, ...], List[dict]] = {}
+    for part in parts:
+        for row in part.rows:
+            key = tuple(v.get("value", "") for v in row.dimensionValues)
+            values = [float(v.get("value") or 0) for v in row.metricValues]
+            if key not in merged:
+                merged[key], dims[key], raw[key] = values, row.dimensionValues, row.metricValues
+                continue
+            for i, ok in enumerate(sums):
+                if not ok:
+                    raise ValueError(
+                        f"metric '{headers[i].name}' is not additive and rows for {key} span several windows; "
+                        "add a date dimension or split less"
+                    )
+                merged[key][i] += values[i]
+            raw[key] = []
+
+    rows = []
+    for key, values in merged.items():
+        metric_values = raw[key] or [
+            {"value": str(int(v)) if integer[i] else repr(v)} for i, v in enumerate(values)
+        ]
+        rows.append(Row(dimensionValues=dims[key], metricValues=metric_values))
+    return RunReportResponse(
+        dimensionHeaders=parts[0].dimensionHeaders,
+        metricHeaders=headers,
+        rows=rows,
+        rowCount=len(rows),
+    )
+
+
+def run_split_report(
+    client: "GA4Client",
+    property_id: str | int,
+    req: RunReportRequest,
+    *,
+    granularity: Granularity = "auto",
+    target_rows: int = 100_000,
+    page_size: int = 100_000,
+    max_workers: int = 8,
+    additive: Optional[Set[str]] = None,
+    today: Optional[date] = None,
+) -> RunReportResponse:
+    """Run ``req`` (one date range) as parallel sub-range reports and merge them.
+
+    ``metricFilter``, ``orderBys``, ``offset`` and ``limit`` are applied to the
+    merged rows, so a top-N request ranks on full-range values.
+    """
+    if not req.dateRanges or len(req.dateRanges) != 1:
+        raise ValueError("run_split_report needs exactly one date range")
+    non_additive = [m.name for m in req.metrics if not is_additive(MetricHeader(name=m.name), additive)]
+    if non_additive and not any(d.name in _DAY_DIMENSIONS for d in req.dimensions):
+        # checked before any window is fetched: merging would fail only after the quota is spent
+        raise ValueError(
+            f"metric '{non_additive[0]}' is not additive and rows would span several windows; "
+            "add a date dimension, or pass additive= if it sums correctly"
+        )
+    today = today or date.today()
+    start = resolve_date(req.dateRanges[0].startDate, today)
+    end = resolve_date(req.dateRanges[0].endDate, today)
+
+    days = 1
+    if granularity == "auto":
+        probe = client.run_report(property_id, req.model_copy(update={"limit": 1, "offset": None}))
+        total_days = (end - start).days + 1
+        per_day = (probe.rowCount or 0) / total_days
+        days = max(1, min(total_days, math.floor(target_rows / per_day))) if per_day else total_days
+    windows = split_date_range(start, end, granularity, days=days)
+
+    def run(window: Tuple[date, date]) -> RunReportResponse:
+        # metricFilter/orderBys/limit/offset only make sense on the merged totals
+        sub = req.model_copy(
+            update={
+                "dateRanges": [DateRange(startDate=window[0].isoformat(), endDate=window[1].isoformat())],
+                "limit": None,
+                "offset": None,
+                "orderBys": None,
+                "metricFilter": None,
+            }
+        )
+        return _fetch_all(client, property_id, sub, page_size)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(windows)), thread_name_prefix="ga4-split") as pool:
+        parts = list(pool.map(run, windows))
+    merged = merge_reports(parts, additive=additive)
+    rows = _filter_rows(merged, req.metricFilter)
+    rows = _order_rows(merged, rows, req)
+    count = len(rows)  # like GA: rows matching the request, before offset/limit
+    start = req.offset or 0
+    rows = rows[start : start + req.limit if req.limit is not None else None]
+    totals = _merge_totals(parts, additive)
+    return merged.model_copy(update={"rows": rows, "rowCount": count, "totals": totals})
+
+
+def _filter_rows(report: RunReportResponse, expr: Optional[FilterExpression]) -> List[Row]:
+    if expr is None or expr.filter is None:
+        return list(report.rows)
+    flt = expr.filter
+    names = [h.name for h in report.metricHeaders]
+    if flt.fieldName not in names:
+        raise ValueError(f"metricFilter field '{flt.fieldName}' is not a requested metric")
+    at = names.index(flt.fieldName)
+    return [row for row in report.rows if matches_filter(row.metricValues[at].get("value", ""), flt)]
+
+
+def _order_rows(report: RunReportResponse, rows: List[Row], req: RunReportRequest) -> List[Row]:
+    dims = [h.name for h in report.dimensionHeaders]
+    mets = [h.name for h in report.metricHeaders]
+    for order in reversed(req.orderBys or []):  # stable sorts, least significant key first
+        if order.fieldName in mets:
+            at = mets.index(order.fieldName)
+            rows.sort(key=lambda r: float(r.metricValues[at].get("value") or 0), reverse=order.desc)
+        elif order.fieldName in dims:
+            at = dims.index(order.fieldName)
+            rows.sort(key=lambda r: r.dimensionValues[at].get("value", ""), reverse=order.desc)
+        else:
+            raise ValueError(f"orderBys field '{order.fieldName}' is not in the requested dimensions/metrics")
+    return rows
+
+
+def _merge_totals(parts: List[RunReportResponse], additive: Optional[Set[str]]) -> Optional[List[Row]]:
+    """Window totals summed into one (``ValueError`` for non-additive metrics, like rows)."""
+    with_totals = [p for p in parts if p.totals]
+    if not with_totals:
+        return None
+    as_reports = [p.model_copy(update={"rows": p.totals}) for p in with_totals]
+    return merge_reports(as_reports, additive=additive).rows
@@ -0,0 +1,128 @@
+"""Incremental report sync driven by a local SQLite watermark store.
+
+Each (property, request shape) remembers the last day it has synced. A run
+fetches from that day minus ``restatement_days`` (GA keeps revising recent
+data) up to yesterday, and hands the rows to a sink that replaces that window
+in the caller's dataset.
+"""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+from .api._requests import DateRange, RunReportRequest
+from .api._responses import Row
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import GA4Client
+
+# sink(start, end, rows): replace every stored row dated start..end (inclusive) with ``rows``
+SyncSink = Callable[[date, date, Iterator[Row]], None]
+
+
+def request_shape_key(req: RunReportRequest) -> str:
+    """Hash of the request minus its date window/paging, so every run of a report maps to one watermark."""
+    shape = req.model_copy(update={"dateRanges": None, "limit": None, "offset": None})
+    return hashlib.sha256(shape.model_dump_json(exclude_none=True).encode("utf-8")).hexdigest()
+
+
+class WatermarkStore:
+    """Thread-safe SQLite table of the last synced day per (property, request shape)."""
+
+    def __init__(self, path: str = "./.ga4_watermarks.sqlite3") -> None:
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS watermarks ("
+            " property_id TEXT NOT NULL, shape TEXT NOT NULL, last_date TEXT NOT NULL, updated_at REAL NOT NULL,"
+            " PRIMARY KEY (property_id, shape))"
+        )
+        self._conn.commit()
+
+    def get(self, property_id: str | int, shape: str) -> Optional[date]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_date FROM watermarks WHERE property_id = ? AND shape = ?", (str(property_id), shape)
+            ).fetchone()
+        return date.fromisoformat(row[0]) if row else None
+
+    def set(self, property_id: str | int, shape: str, last_date: date) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO watermarks (property_id, shape, last_date, updated_at) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (property_id, shape) DO UPDATE SET last_date = excluded.last_date, updated_at = excluded.updated_at",
+                (str(property_id), shape, last_date.isoformat(), time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@dataclass(frozen=True)
+class SyncResult:
+    start: date
+    end: date
+    rows: int
+
+
+class IncrementalSync:
+    def __init__(
+        self,
+        client: "GA4Client",
+        store: WatermarkStore,
+        *,
+        initial_start: date,
+        restatement_days: int = 3,
+        page_size: int = 10_000,
+    ) -> None:
+        self.client = client
+        self.store = store
+        self.initial_start = initial_start
+        self.restatement_days = restatement_days
+        self.page_size = page_size
+
+    def plan(self, property_id: str | int, req: RunReportRequest, *, today: Optional[date] = None) -> Optional[DateRange]:
+        """Date window the next run would fetch, or ``None`` when already up to date."""
+        end = (today or date.today()) - timedelta(days=1)
+        watermark = self.store.get(property_id, request_shape_key(req))
+        start = self.initial_start
+        if watermark is not None:
+            start = max(start, watermark - timedelta(days=self.restatement_days - 1))
+        if start > end:
+            return None
+        return DateRange(startDate=start.isoformat(), endDate=end.isoformat())
+
+    def run(
+        self,
+        property_id: str | int,
+        req: RunReportRequest,
+        sink: SyncSink,
+        *,
+        today: Optional[date] = None,
+    ) -> Optional[SyncResult]:
+        """Fetch the planned window and pass it to ``sink``; the watermark only advances if the sink succeeds."""
+        if not any(d.name == "date" for d in req.dimensions):
+            raise ValueError("incremental sync requires the 'date' dimension")
+        window = self.plan(property_id, req, today=today)
+        if window is None:
+            return None
+
+        count = 0
+
+        def rows() -> Iterator[Row]:
+            nonlocal count
+            delta = req.model_copy(update={"dateRanges": [window], "offset": None, "limit": None})
+            for row in self.client.iter_report_rows(property_id, delta, page_size=self.page_size):
+                count += 1
+                yield row
+
+        start, end = date.fromisoformat(window.startDate), date.fromisoformat(window.endDate)
+        sink(start, end, rows())
+        self.store.set(property_id, request_shape_key(req), end)
+        return SyncResult(start, end, count)
@@ -0,0 +1,135 @@
+"""Pluggable HTTP transports under ``GA4Client``.
+
+A transport sends one request and returns the library's response object;
+``requests`` and ``httpx`` responses share everything the client reads
+(``status_code``, ``headers``, ``content``, ``text``, ``json()``, ``elapsed``).
+
+- ``RequestsTransport``: HTTP/1.1 keep-alive pool (the default).
+- ``HttpxTransport``: one ``httpx.Client``; with ``http2=True`` concurrent
+  report calls are multiplexed as streams over a single connection
+  (``http2`` extra).
+
+Both advertise every response encoding their HTTP library can decode here
+(gzip and deflate always, brotli/zstd when their packages are present and, for
+zstd, urllib3 >= 2 / httpx >= 0.27) and decode the body chunk by chunk as it is
+read, never buffering the compressed copy.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Literal, Optional, Protocol, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .auth import BearerAuth, TokenProvider
+from .config import HTTP_SETTINGS
+
+
+def _installed(*modules: str) -> bool:
+    for name in modules:
+        try:
+            __import__(name)
+            return True
+        except Exception:
+            continue
+    return False
+
+
+def _version(module: str) -> Tuple[int, ...]:
+    try:
+        version = __import__(module).__version__
+    except Exception:
+        return ()
+    return tuple(int(part) for part in re.findall(r"\d+", version)[:2])
+
+
+# first releases that decode zstd: urllib3 (under requests) and httpx
+_ZSTD_SINCE = {"requests": ("urllib3", (2, 0)), "httpx": ("httpx", (0, 27))}
+
+
+def accept_encoding(library: Literal["requests", "httpx"] = "requests") -> str:
+    """``Accept-Encoding`` value for the decoders ``library`` can use in this environment."""
+    encodings = ["gzip", "deflate"]
+    if _installed("brotli", "brotlicffi"):
+        encodings.append("br")
+    module, since = _ZSTD_SINCE[library]
+    if _installed("zstandard") and _version(module) >= since:
+        encodings.append("zstd")
+    return ", ".join(encodings)
+
+
+class Transport(Protocol):
+    session: Any
+
+    def request(self, method: str, url: str, *, data: Optional[bytes], timeout: float) -> Any: ...
+
+    def close(self) -> None: ...
+
+
+class RequestsTransport:
+    def __init__(
+        self,
+        headers: Dict[str, str],
+        *,
+        credentials: Optional[TokenProvider] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+    ) -> None:
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections or HTTP_SETTINGS.pool_connections,
+            pool_maxsize=pool_maxsize or HTTP_SETTINGS.pool_maxsize,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept-Encoding": accept_encoding(), **headers})
+        if credentials is not None:
+            self.session.auth = BearerAuth(credentials)
+
+    def request(self, method: str, url: str, *, data: Optional[bytes], timeout: float) -> requests.Response:
+        # urllib3 decompresses each chunk as it is read into ``.content``
+        return self.session.request(method, url, data=data, timeout=timeout)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class HttpxTransport:
+    def __init__(
+        self,
+        headers: Dict[str, str],
+        *,
+        credentials: Optional[TokenProvider] = None,
+        http2: bool = True,
+        max_connections: Optional[int] = None,
+    ) -> None:
+        try:
+            import httpx
+        except Exception as e:  # pragma: no cover
+            raise ImportError("httpx is required for HttpxTransport") from e
+        if http2 and not _installed("h2"):
+            raise ImportError('h2 is required for HTTP/2: pip install "dealscale-ga4-sdk[http2]"')
+        size = max_connections or HTTP_SETTINGS.pool_maxsize
+        self.session = httpx.Client(
+            http2=http2,
+            headers={"Accept-Encoding": accept_encoding("httpx"), **headers},
+            limits=httpx.Limits(max_connections=size, max_keepalive_connections=size),
+        )
+        self._credentials = credentials
+
+    def request(self, method: str, url: str, *, data: Optional[bytes], timeout: float) -> Any:
+        headers = None if self._credentials is None else {"Authorization": f"Bearer {self._credentials.token()}"}
+        return self.session.request(method, url, content=data, headers=headers, timeout=timeout)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def make_transport(kind: str, headers: Dict[str, str], *, credentials: Optional[TokenProvider] = None) -> Transport:
+    """Build a transport by name: ``requests``, ``httpx`` (HTTP/1.1) or ``http2``."""
+    if kind == "requests":
+        return RequestsTransport(headers, credentials=credentials)
+    if kind in ("httpx", "http2"):
+        return HttpxTransport(headers, credentials=credentials, http2=kind == "http2")
+    raise ValueError(f"unknown transport {kind!r}; expected 'requests', 'httpx' or 'http2'")